@@ -0,0 +1,118 @@
+"""
+Backfill queue for existing leads whose backup row still has empty fields.
+
+run_mission used to fill such duplicates inline (a fresh browser per lead,
+a CSV rewrite each time, discovery on hold). Now it only records them here;
+LeadHunter.run_backfill_sweep() works the queue later: most valuable
+missing fields first, plain HTTP before the browser, one shared browser for
+the rest, and one CSV write per batch.
+
+Config:
+    BACKFILL_PATH          default <HUNTER_CACHE_DIR>/backfill.sqlite
+    BACKFILL_BATCH         leads per sweep (default 50)
+    BACKFILL_MAX_ATTEMPTS  sweeps a lead may come back empty before it's dropped (default 3)
+
+Usage:
+    python backfill_queue.py stats
+    python backfill_queue.py sweep [--batch N]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+CACHE_DIR = os.getenv("HUNTER_CACHE_DIR", ".hunter_cache")
+BACKFILL_PATH = os.getenv("BACKFILL_PATH", os.path.join(CACHE_DIR, "backfill.sqlite"))
+BACKFILL_BATCH = int(os.getenv("BACKFILL_BATCH", 50))
+BACKFILL_MAX_ATTEMPTS = int(os.getenv("BACKFILL_MAX_ATTEMPTS", 3))
+
+# Backup CSV columns worth filling, and what each is worth to outreach (queue priority = sum of missing)
+FIELD_VALUE = {"Emails": 5, "Mobile": 4, "Phone": 3, "LinkedIn": 2, "Chat Option": 1, "Instagram": 1, "Facebook": 1}
+FILL_FIELDS = list(FIELD_VALUE)
+
+
+def priority_of(missing):
+    return sum(FIELD_VALUE.get(f, 0) for f in missing)
+
+
+class BackfillQueue:
+    def __init__(self, path=BACKFILL_PATH):
+        self.path = path
+        self.stats = {"queued": 0}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""CREATE TABLE IF NOT EXISTS backfill (
+                            name TEXT PRIMARY KEY, website TEXT, keyword TEXT, csv_path TEXT NOT NULL,
+                            region TEXT, missing TEXT NOT NULL, priority REAL NOT NULL,
+                            attempts INTEGER NOT NULL DEFAULT 0, enqueued REAL NOT NULL)""")
+            db.execute("CREATE INDEX IF NOT EXISTS backfill_priority ON backfill (priority DESC, enqueued)")
+
+    def _db(self):
+        # One short-lived connection per call: missions and the sweeper may overlap
+        return sqlite3.connect(self.path, timeout=10)
+
+    def enqueue(self, name, website, keyword, csv_path, missing, region="US"):
+        """Adds (or refreshes) a lead; a lead already queued keeps its attempt count."""
+        with self._db() as db:
+            db.execute("""INSERT INTO backfill (name, website, keyword, csv_path, region, missing, priority, enqueued)
+                          VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                          ON CONFLICT(name) DO UPDATE SET website = excluded.website, keyword = excluded.keyword,
+                              csv_path = excluded.csv_path, region = excluded.region,
+                              missing = excluded.missing, priority = excluded.priority""",
+                       (name, website, keyword, csv_path, region, json.dumps(missing), priority_of(missing), time.time()))
+        self.stats["queued"] += 1
+
+    def take(self, n=BACKFILL_BATCH):
+        """The n most valuable queued leads (they stay queued until done() / retry())."""
+        with self._db() as db:
+            rows = db.execute("""SELECT name, website, keyword, csv_path, region, missing, priority, attempts
+                                 FROM backfill ORDER BY priority DESC, enqueued LIMIT ?""", (n,)).fetchall()
+        return [{"name": r[0], "website": r[1], "keyword": r[2], "csv_path": r[3], "region": r[4],
+                 "missing": json.loads(r[5]), "priority": r[6], "attempts": r[7]} for r in rows]
+
+    def done(self, names):
+        with self._db() as db:
+            db.executemany("DELETE FROM backfill WHERE name = ?", [(n,) for n in names])
+
+    def retry(self, names):
+        """Counts an empty-handed attempt; leads past BACKFILL_MAX_ATTEMPTS are dropped."""
+        with self._db() as db:
+            db.executemany("UPDATE backfill SET attempts = attempts + 1, priority = priority / 2 WHERE name = ?",
+                           [(n,) for n in names])
+            return db.execute("DELETE FROM backfill WHERE attempts >= ?", (BACKFILL_MAX_ATTEMPTS,)).rowcount
+
+    def pending(self):
+        with self._db() as db:
+            return db.execute("SELECT COUNT(*) FROM backfill").fetchone()[0]
+
+
+_queue = None
+
+
+def get_backfill_queue():
+    global _queue
+    if _queue is None:
+        _queue = BackfillQueue()
+    return _queue
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill queue for incomplete existing leads.")
+    parser.add_argument("command", choices=["stats", "sweep"])
+    parser.add_argument("--batch", type=int, default=BACKFILL_BATCH)
+    args = parser.parse_args()
+    queue = get_backfill_queue()
+
+    if args.command == "stats":
+        with queue._db() as db:
+            for name, pr, att, missing in db.execute(
+                    "SELECT name, priority, attempts, missing FROM backfill ORDER BY priority DESC LIMIT 20"):
+                print(f"{pr:>5.1f}  {name[:40]:<40} {', '.join(json.loads(missing))}" + (f"  (tried {att}x)" if att else ""))
+        print(f"{queue.pending()} leads queued")
+    else:
+        import asyncio
+        from lead_hunter import LeadHunter
+
+        asyncio.run(LeadHunter().run_backfill_sweep(max_items=args.batch, update_callback=print))
@@ -0,0 +1,163 @@
+"""
+Managed process pool for CPU-bound work inside async missions.
+
+Everything heavy used to run inline on the asyncio loop (HTML parsing, JSON
+repair, pandas CSV reads/writes), so one slow page stalled every other
+coroutine. CPUPool.run() hands that work to worker processes and records
+per-task queue / run times, so the mission summary shows how long the loop
+would have been blocked.
+
+- Pool size: CPU_POOL_WORKERS, else (usable cores - 1), capped at 4. 0 = run everything inline.
+- Small payloads (< CPU_POOL_INLINE_CHARS) run inline: the IPC round trip would cost more.
+- Large text payloads (>= CPU_POOL_SHM_CHARS) go through shared memory instead of the pipe.
+- Workers are spawned (not forked) so they never inherit the browser's threads.
+"""
+import asyncio
+import atexit
+import concurrent.futures
+import multiprocessing
+import os
+import time
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+INLINE_CHARS = int(os.getenv("CPU_POOL_INLINE_CHARS", 20000))
+SHM_CHARS = int(os.getenv("CPU_POOL_SHM_CHARS", 1_000_000))
+
+
+def default_workers():
+    if os.getenv("CPU_POOL_WORKERS"):
+        return max(0, int(os.getenv("CPU_POOL_WORKERS")))
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return max(1, min(4, cores - 1))
+
+
+class _SharedText:
+    """Marker for a str argument parked in a SharedMemory block."""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+
+def _to_shared(value):
+    data = value.encode("utf-8")
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    shm.buf[:len(data)] = data
+    return shm, _SharedText(shm.name, len(data))
+
+
+def _from_shared(marker):
+    shm = shared_memory.SharedMemory(name=marker.name)
+    try:
+        return bytes(shm.buf[:marker.size]).decode("utf-8")
+    finally:
+        # Only close: the parent owns (and unlinks) the block, and spawned workers share its resource tracker
+        shm.close()
+
+
+def _invoke(fn, args, submitted_at):
+    """Runs in the worker: resolves shared-memory args, times the call."""
+    started = time.time()
+    args = [_from_shared(a) if isinstance(a, _SharedText) else a for a in args]
+    result = fn(*args)
+    return result, started - submitted_at, time.time() - started
+
+
+class CPUPool:
+    def __init__(self, workers=None):
+        self.workers = default_workers() if workers is None else workers
+        self._executor = None
+        self.stats = {}   # task -> {"calls", "offloaded", "queue_s", "run_s", "max_run_s"}
+
+    def _pool(self):
+        if self._executor is None and self.workers > 0:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def _record(self, stats, name, offloaded, queue_s, run_s):
+        s = stats.setdefault(name, {"calls": 0, "offloaded": 0, "queue_s": 0.0, "run_s": 0.0, "max_run_s": 0.0})
+        s["calls"] += 1
+        s["offloaded"] += offloaded
+        s["queue_s"] += queue_s
+        s["run_s"] += run_s
+        s["max_run_s"] = max(s["max_run_s"], run_s)
+
+    async def run(self, fn, *args, name=None, offload=None, stats=None):
+        """
+        Awaitable fn(*args). offload=None decides by payload size; True/False forces it.
+        fn must be a module-level function of a light module (workers import it by name).
+        Timings go to `stats` (e.g. one dict per mission) and to the pool-wide totals.
+        """
+        name = name or fn.__name__
+        targets = [self.stats] + ([stats] if stats is not None else [])
+        if offload is None:
+            offload = sum(len(a) for a in args if isinstance(a, (str, bytes))) >= INLINE_CHARS
+        pool = self._pool() if offload else None
+        if pool is None:
+            start = time.perf_counter()
+            result = fn(*args)
+            for t in targets:
+                self._record(t, name, 0, 0.0, time.perf_counter() - start)
+            return result
+
+        shared, call_args = [], []
+        for a in args:
+            if shared_memory is not None and isinstance(a, str) and len(a) >= SHM_CHARS:
+                shm, marker = _to_shared(a)
+                shared.append(shm)
+                call_args.append(marker)
+            else:
+                call_args.append(a)
+        try:
+            loop = asyncio.get_running_loop()
+            result, queue_s, run_s = await loop.run_in_executor(pool, _invoke, fn, call_args, time.time())
+        except concurrent.futures.process.BrokenProcessPool:
+            # A worker died (OOM etc.): rebuild the pool and do this one inline
+            self.shutdown()
+            start = time.perf_counter()
+            result = fn(*args)
+            for t in targets:
+                self._record(t, name, 0, 0.0, time.perf_counter() - start)
+            return result
+        finally:
+            for shm in shared:
+                shm.close()
+                shm.unlink()
+        for t in targets:
+            self._record(t, name, 1, max(0.0, queue_s), run_s)
+        return result
+
+    def summary(self, stats=None):
+        """One line per task: calls, offloaded share, average queue wait and run time."""
+        lines = []
+        for name, s in sorted((self.stats if stats is None else stats).items(), key=lambda kv: -kv[1]["run_s"]):
+            off = s["offloaded"]
+            queue_ms = 1000 * s["queue_s"] / off if off else 0.0
+            lines.append(f"{name}: {s['calls']} calls ({off} in pool), queue {queue_ms:.1f} ms avg, "
+                         f"run {1000 * s['run_s'] / s['calls']:.1f} ms avg / {1000 * s['max_run_s']:.0f} ms max")
+        return lines
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_pool = None
+
+
+def get_cpu_pool():
+    """Process-wide pool shared by every LeadHunter (the dashboard builds one hunter per mission)."""
+    global _pool
+    if _pool is None:
+        _pool = CPUPool()
+        atexit.register(_pool.shutdown)
+    return _pool
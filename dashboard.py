@@ -5,7 +5,8 @@ import pandas as pd
 import datetime
 import re
 import time
-from lead_hunter import LeadHunter
+from lead_hunter import LeadHunter, LADDER_THRESHOLDS, DEFAULT_CITY_MAP
+from lead_classifier import LeadClassifier, MODEL_FILE
 from gsheets_handler import GSheetsHandler
 from dotenv import load_dotenv
 import io
@@ -29,6 +30,11 @@ if 'search_offsets' not in st.session_state:
     with st.spinner("Synchronizing cross-device search pipelines..."):
         st.session_state.search_offsets = GSheetsHandler().load_search_offsets_from_cloud()
 
+@st.cache_resource
+def load_gate_model(mtime):
+    # Keyed on the model file's mtime: parsed once per (re)training, not on every rerun
+    return LeadClassifier.load(kind="score")
+
 # --- SMART AUTO-DE-DUPLICATOR ---
 def run_startup_clean_and_dedup():
     local_backup_csv = r"E:\Lead Hunter\incremental_leads_backup.csv"
@@ -112,12 +118,6 @@ NICHE_BOOSTERS = {
     "Digital Marketing": ["Marketing Agency", "SEO Consultant", "PPC Expert", "Content Strategy"]
 }
 
-DEFAULT_CITY_MAP = {
-    "Noida": "in", "Gurgaon": "in", "Gurugram": "in", "Delhi": "in", "Mumbai": "in",
-    "Dubai": "ae", "Abu Dhabi": "ae", "London": "uk", "Singapore": "sg", 
-    "New York": "www", "Miami": "www", "Sydney": "au"
-}
-
 # --- GLOBAL UTILITY FUNCTIONS ---
 def get_boosted_niche(niche_input):
     """Returns a Boolean string of related keywords for high-intent targeting."""
@@ -631,6 +631,26 @@ with st.sidebar:
         if st.checkbox("Show Memory Map"):
             st.json(st.session_state.city_map)
 
+        st.subheader("🧠 Local AI Gate")
+        st.toggle("Score confident leads locally (skip Gemini)", value=os.getenv("LOCAL_SCORER_GATE", "false").lower() == "true", key="local_gate")
+        gate_model = load_gate_model(os.path.getmtime(MODEL_FILE) if os.path.exists(MODEL_FILE) else 0)
+        if gate_model and gate_model.report.get("n"):
+            r = gate_model.report
+            st.caption(f"Held-out: {r['agreement']:.0%} agreement with Gemini · skips {r['gate_coverage']:.0%} of calls · {r['latency_ms']} ms/lead")
+        else:
+            st.caption("No model yet — run `python lead_classifier.py train` on the intelligence archive.")
+
+        st.subheader("💾 Enrichment Cache")
+        st.toggle("Force refresh (re-scrape domains already in the cache)", value=os.getenv("ENRICH_CACHE_REFRESH", "false").lower() == "true", key="refresh_cache")
+
+        st.subheader("🪜 Enrichment Ladder")
+        st.caption("Minimum Maps pre-score (0-100) a business needs before each costly step runs")
+        c_lad1, c_lad2 = st.columns(2)
+        c_lad1.number_input("🌐 Browser", 0, 100, LADDER_THRESHOLDS["browser"], key="ladder_browser")
+        c_lad2.number_input("📱 Socials", 0, 100, LADDER_THRESHOLDS["socials"], key="ladder_socials")
+        c_lad1.number_input("🧬 X-Ray", 0, 100, LADDER_THRESHOLDS["xray"], key="ladder_xray")
+        c_lad2.number_input("🤖 AI Score", 0, 100, LADDER_THRESHOLDS["llm"], key="ladder_llm")
+
     with st.expander("🧼 Data Hygiene & Cleanup"):
         st.write("Keep your CRM fast and professional by removing duplicates.")
         if st.button("✨ Run Global Deduplication", use_container_width=True):
@@ -1452,7 +1472,10 @@ if st.session_state.is_running:
         log_placeholder.code("\n".join(st.session_state.logs[-15:]), language="text")
 
     try:
-        hunter = LeadHunter(keyword=st.session_state.target_query, limit=st.session_state.limit)
+        ladder = {tier: st.session_state.get(f"ladder_{tier}", LADDER_THRESHOLDS[tier]) for tier in LADDER_THRESHOLDS}
+        hunter = LeadHunter(keyword=st.session_state.target_query, limit=st.session_state.limit, ladder=ladder,
+                            local_gate=st.session_state.get("local_gate", False),
+                            refresh_cache=st.session_state.get("refresh_cache", False))
         update_ui(f"🚀 Initializing {st.session_state.app_mode}...")
         
         all_leads = []
@@ -0,0 +1,327 @@
+"""
+Pure-Python MX resolver with a TTL cache — replaces the `nslookup` subprocess
+that check_google_workspace used to fork for every lead.
+
+Queries go out as raw UDP DNS packets (asyncio for run_mission, a plain
+blocking socket for sync callers). Answers are cached per domain for their
+TTL, NXDOMAIN / empty answers are cached too, and concurrent lookups of the
+same domain share one query.
+
+Config:
+    DNS_SERVER     "host" or "host:port" (default: first nameserver in /etc/resolv.conf, else 8.8.8.8)
+    DNS_TIMEOUT    seconds per attempt (default 2)
+
+Usage:
+    python dns_resolver.py lookup example.com other.com
+    python dns_resolver.py stub [--port 5353]    # local stub server for offline testing
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import struct
+import time
+
+QTYPE_MX = 15
+QTYPE_SOA = 6
+RCODE_NXDOMAIN = 3
+NEGATIVE_TTL = 300
+MIN_TTL = 30
+MAX_TTL = 86400
+GOOGLE_MX_HOSTS = ("google.com", "googlemail.com")
+
+
+def default_nameserver():
+    env = os.getenv("DNS_SERVER", "").strip()
+    if env:
+        host, _, port = env.partition(":")
+        return host, int(port or 53)
+    try:
+        with open("/etc/resolv.conf", "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == "nameserver" and "." in parts[1]:
+                    return parts[1], 53
+    except OSError:
+        pass
+    return "8.8.8.8", 53
+
+
+# --- Wire format ---
+
+def build_query(domain, qtype=QTYPE_MX, query_id=None):
+    query_id = random.randint(0, 0xFFFF) if query_id is None else query_id
+    header = struct.pack(">HHHHHH", query_id, 0x0100, 1, 0, 0, 0)  # RD=1, one question
+    qname = b"".join(bytes([len(label)]) + label.encode("idna") for label in domain.strip(".").split(".") if label)
+    return query_id, header + qname + b"\x00" + struct.pack(">HH", qtype, 1)
+
+
+def _read_name(data, offset):
+    """Reads a (possibly compressed) domain name. Returns (name, offset after the name)."""
+    labels, jumped, end, hops = [], False, offset, 0
+    while True:
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if not jumped:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            jumped = True
+            hops += 1
+            if hops > 20:
+                raise ValueError("DNS name compression loop")
+            continue
+        if length == 0:
+            return ".".join(labels), (end if jumped else offset + 1)
+        labels.append(data[offset + 1:offset + 1 + length].decode("ascii", "ignore"))
+        offset += 1 + length
+
+
+def parse_response(data, query_id=None):
+    """
+    Returns (rcode, [(preference, host)], ttl). ttl is the smallest answer TTL,
+    or the SOA minimum for negative answers.
+    """
+    rid, flags, qd, an, ns, _ = struct.unpack(">HHHHHH", data[:12])
+    if query_id is not None and rid != query_id:
+        raise ValueError("DNS response id mismatch")
+    rcode = flags & 0x000F
+    offset = 12
+    for _ in range(qd):
+        _, offset = _read_name(data, offset)
+        offset += 4
+    records, ttls = [], []
+    for section, count in (("an", an), ("ns", ns)):
+        for _ in range(count):
+            _, offset = _read_name(data, offset)
+            rtype, _, ttl, rdlen = struct.unpack(">HHIH", data[offset:offset + 10])
+            offset += 10
+            if section == "an" and rtype == QTYPE_MX:
+                pref = struct.unpack(">H", data[offset:offset + 2])[0]
+                host, _ = _read_name(data, offset + 2)
+                records.append((pref, host.lower()))
+                ttls.append(ttl)
+            elif section == "ns" and rtype == QTYPE_SOA and not records:
+                # RFC 2308: negative answers live for min(SOA TTL, SOA MINIMUM)
+                _, p = _read_name(data, offset)
+                _, p = _read_name(data, p)
+                ttls.append(min(ttl, struct.unpack(">I", data[p + 16:p + 20])[0]))
+            offset += rdlen
+    ttl = min(ttls) if ttls else NEGATIVE_TTL
+    return rcode, sorted(records), ttl
+
+
+# --- Resolver ---
+
+class _QueryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, query_id, future):
+        self.query_id = query_id
+        self.future = future
+
+    def datagram_received(self, data, addr):
+        if self.future.done():
+            return
+        try:
+            self.future.set_result(parse_response(data, self.query_id))
+        except ValueError:
+            pass  # stray or spoofed packet — keep waiting
+        except Exception as e:
+            self.future.set_exception(e)
+
+    def error_received(self, exc):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+class MXResolver:
+    """MX lookups with a domain -> (expires_at, records) cache shared by async and sync callers."""
+
+    def __init__(self, server=None, timeout=None, retries=2, concurrency=20):
+        self.server = server or default_nameserver()
+        self.timeout = float(timeout or os.getenv("DNS_TIMEOUT", 2))
+        self.retries = retries
+        self.concurrency = concurrency
+        self.cache = {}
+        self.inflight = {}
+        self.stats = {"hits": 0, "queries": 0, "negative": 0, "errors": 0}
+
+    def _cached(self, domain):
+        entry = self.cache.get(domain)
+        if entry and entry[0] > time.monotonic():
+            self.stats["hits"] += 1
+            return entry[1]
+        return None
+
+    def _store(self, domain, rcode, records, ttl):
+        if rcode not in (0, RCODE_NXDOMAIN):
+            return records  # SERVFAIL/REFUSED: don't poison the cache
+        if not records:
+            self.stats["negative"] += 1
+        ttl = max(MIN_TTL, min(MAX_TTL, ttl))
+        self.cache[domain] = (time.monotonic() + ttl, records)
+        return records
+
+    async def _query_async(self, domain):
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.retries + 1):
+            query_id, packet = build_query(domain)
+            future = loop.create_future()
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _QueryProtocol(query_id, future), remote_addr=self.server)
+            try:
+                self.stats["queries"] += 1
+                transport.sendto(packet)
+                return await asyncio.wait_for(future, self.timeout)
+            except (asyncio.TimeoutError, OSError):
+                if attempt == self.retries:
+                    raise
+            finally:
+                transport.close()
+
+    async def resolve_mx(self, domain):
+        """Returns sorted [(preference, host)] for `domain`; [] if it has none or the lookup failed."""
+        domain = domain.strip().lower().rstrip(".")
+        if not domain:
+            return []
+        cached = self._cached(domain)
+        if cached is not None:
+            return cached
+        task = self.inflight.get(domain)
+        if task is None:
+            task = self.inflight[domain] = asyncio.ensure_future(self._lookup(domain))
+        # Shielded: one caller being cancelled must not cancel the lookup the others wait on
+        return await asyncio.shield(task)
+
+    async def _lookup(self, domain):
+        """The one in-flight query for `domain`: final records for every waiter, errors counted once."""
+        try:
+            rcode, records, ttl = await self._query_async(domain)
+            return self._store(domain, rcode, records, ttl)
+        except Exception:
+            self.stats["errors"] += 1
+            return []
+        finally:
+            self.inflight.pop(domain, None)
+
+    async def resolve_mx_many(self, domains):
+        """Batch lookup. Returns {domain: records}; each distinct domain is queried at most once."""
+        unique = {d.strip().lower().rstrip(".") for d in domains if d and d.strip()}
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def one(d):
+            async with sem:
+                return d, await self.resolve_mx(d)
+
+        return dict(await asyncio.gather(*(one(d) for d in unique)))
+
+    def resolve_mx_sync(self, domain):
+        """Blocking variant for sync callers (same cache)."""
+        domain = domain.strip().lower().rstrip(".")
+        if not domain:
+            return []
+        cached = self._cached(domain)
+        if cached is not None:
+            return cached
+        family = socket.AF_INET6 if ":" in self.server[0] else socket.AF_INET
+        for attempt in range(self.retries + 1):
+            query_id, packet = build_query(domain)
+            try:
+                with socket.socket(family, socket.SOCK_DGRAM) as sock:
+                    sock.settimeout(self.timeout)
+                    self.stats["queries"] += 1
+                    sock.sendto(packet, self.server)
+                    deadline = time.monotonic() + self.timeout
+                    while True:
+                        data, _ = sock.recvfrom(4096)
+                        try:
+                            rcode, records, ttl = parse_response(data, query_id)
+                            return self._store(domain, rcode, records, ttl)
+                        except ValueError:
+                            if time.monotonic() > deadline:
+                                raise socket.timeout()
+            except OSError:
+                if attempt == self.retries:
+                    self.stats["errors"] += 1
+        return []
+
+
+_resolver = None
+
+
+def get_resolver():
+    global _resolver
+    if _resolver is None:
+        _resolver = MXResolver()
+    return _resolver
+
+
+def is_google_mx(records):
+    return any(host.endswith(GOOGLE_MX_HOSTS) for _, host in records)
+
+
+# --- Local stub server (offline testing) ---
+
+def build_response(query, mx_records=None, ttl=300, nxdomain=False):
+    """Answers a raw MX query with the given [(preference, host)] records."""
+    query_id = struct.unpack(">H", query[:2])[0]
+    _, q_end = _read_name(query, 12)
+    question = query[12:q_end + 4]
+    records = mx_records or []
+    flags = 0x8180 | (RCODE_NXDOMAIN if nxdomain else 0)
+    out = struct.pack(">HHHHHH", query_id, flags, 1, len(records), 0, 0) + question
+    for pref, host in records:
+        rdata = struct.pack(">H", pref) + build_query(host)[1][12:-4]
+        out += b"\xc0\x0c" + struct.pack(">HHIH", QTYPE_MX, 1, ttl, len(rdata)) + rdata
+    return out
+
+
+class StubDNSServer(asyncio.DatagramProtocol):
+    """Serves MX answers from a dict {domain: [(pref, host)]}; unknown domains get NXDOMAIN."""
+
+    def __init__(self, zone):
+        self.zone = {k.lower(): v for k, v in zone.items()}
+        self.queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        name, _ = _read_name(data, 12)
+        records = self.zone.get(name.lower())
+        self.transport.sendto(build_response(data, records, nxdomain=records is None), addr)
+
+
+async def start_stub(zone, host="127.0.0.1", port=0):
+    """Starts a StubDNSServer and returns (transport, protocol, (host, port))."""
+    loop = asyncio.get_running_loop()
+    transport, proto = await loop.create_datagram_endpoint(lambda: StubDNSServer(zone), local_addr=(host, port))
+    return transport, proto, transport.get_extra_info("sockname")[:2]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MX lookups via the built-in resolver.")
+    parser.add_argument("command", choices=["lookup", "stub"])
+    parser.add_argument("domains", nargs="*")
+    parser.add_argument("--port", type=int, default=5353)
+    args = parser.parse_args()
+
+    async def main():
+        if args.command == "stub":
+            zone = {"example.com": [(1, "aspmx.l.google.com"), (5, "alt1.aspmx.l.google.com")],
+                    "example.org": [(10, "mx.example.org")]}
+            _, proto, addr = await start_stub(zone, port=args.port)
+            print(f"Stub DNS on {addr[0]}:{addr[1]} — set DNS_SERVER={addr[0]}:{addr[1]}")
+            await asyncio.Event().wait()
+        resolver = get_resolver()
+        start = time.perf_counter()
+        results = await resolver.resolve_mx_many(args.domains)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        await resolver.resolve_mx_many(args.domains)
+        warm = time.perf_counter() - start
+        for d, records in results.items():
+            print(f"{d}: {'Google Workspace' if is_google_mx(records) else '-'} {records}")
+        print(f"cold {cold * 1000:.1f} ms | cached {warm * 1e6:.0f} µs | {resolver.stats}")
+
+    asyncio.run(main())
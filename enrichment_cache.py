@@ -0,0 +1,229 @@
+"""
+Disk-backed enrichment cache keyed by company domain (by page for businesses
+whose only site is a page on a shared platform: facebook.com/..., linktr.ee/...).
+
+The same domains come back across keywords, cities, Naukri jobs and fill-in
+passes; scrape_website, enrichment_waterfall and the social / founder
+lookups read from here first. Every field has its own TTL. When a field has
+expired but the site gave us an ETag / Last-Modified, one conditional GET
+decides: 304 extends the cached fields, anything else means re-scrape.
+
+Config:
+    ENRICH_CACHE_PATH      default <HUNTER_CACHE_DIR>/enrichment_cache.sqlite
+    ENRICH_TTL_<FIELD>     hours, overrides FIELD_TTL_HOURS below (e.g. ENRICH_TTL_FOUNDER=72)
+    ENRICH_CACHE_REFRESH   "true" ignores cached values (they are still rewritten)
+
+Usage:
+    python enrichment_cache.py stats | purge
+    python enrichment_cache.py forget example.com
+"""
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import urllib.parse
+
+from http_client import fetch
+
+CACHE_DIR = os.getenv("HUNTER_CACHE_DIR", ".hunter_cache")
+ENRICH_CACHE_PATH = os.getenv("ENRICH_CACHE_PATH", os.path.join(CACHE_DIR, "enrichment_cache.sqlite"))
+
+# Contact details and identities move slowly; page speed and the text excerpt less so
+FIELD_TTL_HOURS = {
+    "content": 24 * 7,
+    "emails": 24 * 30,
+    "phone": 24 * 30,
+    "address": 24 * 60,
+    "socials": 24 * 30,
+    "socials_recovered": 24 * 30,
+    "tech_stack": 24 * 14,
+    "chat": 24 * 14,
+    "load_time": 24 * 7,
+    "founder": 24 * 30,
+    "founder_linkedin": 24 * 30,
+    "founder_xray": 24 * 14,
+    "default": 24 * 7,
+}
+# What scrape_website returns, in its tuple order
+SCRAPE_FIELDS = ("content", "emails", "socials", "phone", "tech_stack", "load_time", "chat", "address")
+
+
+# Hosts where many businesses live under one domain: the path is the business
+SHARED_HOSTS = ("facebook.com", "instagram.com", "linkedin.com", "linktr.ee", "sites.google.com", "wixsite.com",
+                "business.site", "yelp.com", "tiktok.com", "x.com", "twitter.com", "youtube.com", "carrd.co")
+
+
+def domain_key(url):
+    """
+    "https://www.Acme.com/about" -> "acme.com"; shared-platform pages keep their
+    path ("facebook.com/acmeplumbing"); "" when there is no host.
+    """
+    url = (url or "").strip()
+    if not url or url.lower() in ("n/a", "unknown", "none"):
+        return ""
+    if "://" not in url:
+        url = "http://" + url
+    parts = urllib.parse.urlsplit(url)
+    host = (parts.hostname or "").lower()
+    host = host[4:] if host.startswith("www.") else host
+    if host and any(host == h or host.endswith("." + h) for h in SHARED_HOSTS):
+        host = host[2:] if host.startswith("m.") else host
+        path = parts.path.rstrip("/").lower()
+        return host + path if path else ""   # the bare platform root is nobody's site
+    return host
+
+
+def ttl_seconds(field):
+    hours = os.getenv(f"ENRICH_TTL_{field.upper()}")
+    return 3600 * float(hours if hours else FIELD_TTL_HOURS.get(field, FIELD_TTL_HOURS["default"]))
+
+
+class EnrichmentCache:
+    def __init__(self, path=ENRICH_CACHE_PATH):
+        self.path = path
+        self.refresh = os.getenv("ENRICH_CACHE_REFRESH", "false").lower() == "true"
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "changed": 0, "stores": 0}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""CREATE TABLE IF NOT EXISTS fields (
+                            domain TEXT NOT NULL, field TEXT NOT NULL, value TEXT NOT NULL,
+                            expires REAL NOT NULL, updated REAL NOT NULL,
+                            PRIMARY KEY (domain, field))""")
+            db.execute("""CREATE TABLE IF NOT EXISTS validators (
+                            domain TEXT PRIMARY KEY, url TEXT NOT NULL, etag TEXT, last_modified TEXT)""")
+
+    def _db(self):
+        # One short-lived connection per call: missions run on several threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _rows(self, domain, fields):
+        with self._db() as db:
+            marks = ",".join("?" * len(fields))
+            return {f: (json.loads(v), exp) for f, v, exp in db.execute(
+                f"SELECT field, value, expires FROM fields WHERE domain = ? AND field IN ({marks})", (domain, *fields))}
+
+    async def get(self, url, fields, revalidate=True, refresh=None):
+        """
+        {field: value} when every field is cached for url's domain, else None.
+        Expired fields are revived by a 304 on the stored validators (revalidate=True).
+        refresh=True (default: ENRICH_CACHE_REFRESH) always misses, forcing a fresh scrape.
+        """
+        domain = domain_key(url)
+        if not domain or (self.refresh if refresh is None else refresh):
+            return None
+        try:
+            rows = await asyncio.to_thread(self._rows, domain, fields)
+            if len(rows) < len(fields):
+                self.stats["misses"] += 1
+                return None
+            expired = [f for f, (_, exp) in rows.items() if exp <= time.time()]
+            if expired and not (revalidate and await self.revalidate(domain, expired)):
+                self.stats["misses"] += 1
+                return None
+        except sqlite3.Error as e:
+            print(f"Enrichment cache read error: {e}")
+            return None
+        self.stats["hits"] += 1
+        return {f: value for f, (value, _) in rows.items()}
+
+    def _validators(self, domain):
+        with self._db() as db:
+            return db.execute("SELECT url, etag, last_modified FROM validators WHERE domain = ?", (domain,)).fetchone()
+
+    def _extend(self, domain, fields):
+        now = time.time()
+        with self._db() as db:
+            for f in fields:
+                db.execute("UPDATE fields SET expires = ? WHERE domain = ? AND field = ?", (now + ttl_seconds(f), domain, f))
+
+    async def revalidate(self, domain, fields):
+        """Conditional GET with the stored ETag / Last-Modified; on 304 the fields get a fresh TTL."""
+        row = await asyncio.to_thread(self._validators, domain)
+        if not row or not (row[1] or row[2]):
+            return False
+        url, etag, last_modified = row
+        headers = {}
+        if etag: headers["If-None-Match"] = etag
+        if last_modified: headers["If-Modified-Since"] = last_modified
+        try:
+            r = await fetch(url, headers=headers, timeout=6, allow_redirects=False, max_bytes=1)
+        except Exception:
+            return False
+        if r["status"] != 304:
+            self.stats["changed"] += 1
+            return False
+        await asyncio.to_thread(self._extend, domain, fields)
+        self.stats["revalidated"] += 1
+        return True
+
+    def put(self, url, values, validators=None):
+        """
+        Stores {field: value} for url's domain; validators = {"etag", "last_modified"} of its homepage.
+        Blocking (sqlite): async callers go through asyncio.to_thread.
+        """
+        domain = domain_key(url)
+        if not domain:
+            return
+        now = time.time()
+        try:
+            with self._db() as db:
+                for field, value in values.items():
+                    db.execute("INSERT OR REPLACE INTO fields VALUES (?, ?, ?, ?, ?)",
+                               (domain, field, json.dumps(value), now + ttl_seconds(field), now))
+                if validators and (validators.get("etag") or validators.get("last_modified")):
+                    db.execute("INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?)",
+                               (domain, url, validators.get("etag"), validators.get("last_modified")))
+            self.stats["stores"] += 1
+        except sqlite3.Error as e:
+            print(f"Enrichment cache write error: {e}")
+
+    def forget(self, url):
+        domain = domain_key(url) or url
+        with self._db() as db:
+            n = db.execute("DELETE FROM fields WHERE domain = ?", (domain,)).rowcount
+            db.execute("DELETE FROM validators WHERE domain = ?", (domain,))
+        return n
+
+    def purge(self):
+        """Drops fields past their TTL that no validator can revive."""
+        with self._db() as db:
+            return db.execute("""DELETE FROM fields WHERE expires <= ?
+                                 AND domain NOT IN (SELECT domain FROM validators)""", (time.time(),)).rowcount
+
+    def summary(self):
+        s = self.stats
+        looked = s["hits"] + s["misses"]
+        if not looked:
+            return ""
+        return (f"{s['hits']}/{looked} lookups hit ({s['hits'] / looked:.0%}), {s['revalidated']} revalidated by 304, "
+                f"{s['changed']} changed, {s['stores']} stored")
+
+
+_cache = None
+
+
+def get_enrichment_cache():
+    global _cache
+    if _cache is None:
+        _cache = EnrichmentCache()
+    return _cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-domain enrichment cache.")
+    parser.add_argument("command", choices=["stats", "purge", "forget"])
+    parser.add_argument("domains", nargs="*")
+    args = parser.parse_args()
+    cache = get_enrichment_cache()
+    if args.command == "purge":
+        print(f"Purged {cache.purge()} fields")
+    elif args.command == "forget":
+        for d in args.domains:
+            print(f"{d}: {cache.forget(d)} fields dropped")
+    with cache._db() as db:
+        for field, n, live in db.execute("SELECT field, COUNT(*), SUM(expires > ?) FROM fields GROUP BY field", (time.time(),)):
+            print(f"{field:<18} {n:>6} domains ({live} fresh)")
+        print(f"validators         {db.execute('SELECT COUNT(*) FROM validators').fetchone()[0]:>6} domains")
@@ -0,0 +1,276 @@
+"""
+Streaming HTML -> text for the AI prompts.
+
+truncate_for_ai and page_records used to build a full BeautifulSoup tree
+(pure-Python html.parser) just to read the first few thousand characters.
+These helpers instead stream tokenizer events — lxml's C parser when
+available, html.parser otherwise — and keep only running text:
+
+- script / style / nav / footer subtrees are skipped as they stream past
+- whitespace is collapsed on the fly
+- parsing stops as soon as the character budget is filled
+
+Usage:
+    python html_text.py bench [page.html ... | dir/]   # vs the BeautifulSoup versions
+"""
+import argparse
+import time
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+SKIP_TAGS = frozenset(["script", "style", "nav", "footer"])
+BLOCK_TAGS = frozenset(["div", "li", "tr", "article", "section", "p", "h1", "h2", "h3", "h4", "h5", "h6",
+                        "ul", "ol", "table", "tbody", "dl", "dd", "td", "main", "form"])
+FEED_CHARS = 32768
+
+
+class _TextTarget:
+    """Collects whitespace-normalised words outside skipped subtrees until max_chars is reached."""
+
+    def __init__(self, max_chars, skip=SKIP_TAGS):
+        self.max_chars = max_chars
+        self.skip = skip
+        self.skip_depth = 0
+        self.words = []
+        self.size = 0
+        self.pending = []
+        self.done = False
+
+    def _flush(self):
+        # Text between two tags is one string (same as get_text(separator=' '))
+        if self.pending:
+            for word in "".join(self.pending).split():
+                self.words.append(word)
+                self.size += len(word) + 1
+            self.pending = []
+            if self.max_chars is not None and self.size > self.max_chars:
+                self.done = True
+
+    def start(self, tag, attrib=None):
+        self._flush()
+        if tag in self.skip:
+            self.skip_depth += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in self.skip and self.skip_depth:
+            self.skip_depth -= 1
+
+    def data(self, text):
+        if not self.skip_depth:
+            self.pending.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        # lxml calls close() itself when parsing finishes; keep the result stable for the second call
+        self._flush()
+        return " ".join(self.words)
+
+
+class _RecordTarget(_TextTarget):
+    """
+    Streaming version of the record splitter: the largest block element whose
+    text fits in max_record_chars becomes one record; bigger blocks are split
+    into their child blocks and the inline runs between them.
+    """
+
+    def __init__(self, max_record_chars, max_chars=None, skip=SKIP_TAGS | {"head"}, block_tags=BLOCK_TAGS):
+        super().__init__(max_chars, skip)
+        self.max_record_chars = max_record_chars
+        self.block_tags = block_tags
+        self.records = []
+        # frame: [tag, items, size, has_block, split]; items are ("inline"|"block", text)
+        self.stack = [["#root", [], 0, False, False]]
+
+    def _emit(self, text):
+        if text:
+            self.records.append(text)
+            self.size += len(text) + 1
+            if self.max_chars is not None and self.size > self.max_chars:
+                self.done = True
+
+    def _emit_items(self, items):
+        run = []
+        for kind, text in items:
+            if kind == "inline":
+                run.append(text)
+            else:
+                self._emit(" ".join(run))
+                run = []
+                self._emit(text)
+        self._emit(" ".join(run))
+
+    def _split(self, depth):
+        """Frame at `depth` (and so every ancestor) is too big: emit their pending items in document order."""
+        for frame in self.stack[:depth + 1]:
+            if not frame[4]:
+                frame[4] = True
+            self._emit_items(frame[1])
+            frame[1] = []
+
+    def _flush(self):
+        if not self.pending:
+            return
+        text = " ".join("".join(self.pending).split())
+        self.pending = []
+        if text:
+            frame = self.stack[-1]
+            frame[1].append(("inline", text))
+            frame[2] += len(text) + 1
+
+    def start(self, tag, attrib=None):
+        self._flush()
+        if tag in self.skip:
+            self.skip_depth += 1
+        elif not self.skip_depth and tag in self.block_tags:
+            self.stack.append([tag, [], 0, False, False])
+
+    def end(self, tag):
+        self._flush()
+        if tag in self.skip:
+            if self.skip_depth:
+                self.skip_depth -= 1
+            return
+        if self.skip_depth or tag not in self.block_tags or len(self.stack) == 1:
+            return
+        # Close the innermost open block with this tag (tolerates unclosed children)
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth][0] == tag:
+                break
+        else:
+            return
+        while len(self.stack) > depth:
+            self._close_frame()
+
+    def _close_frame(self):
+        tag, items, size, has_block, split = self.stack.pop()
+        parent = self.stack[-1]
+        parent[3] = True
+        if split:
+            self._emit_items(items)
+            return
+        text = " ".join(t for _, t in items)
+        if size - 1 <= self.max_record_chars or not has_block:
+            if parent[4]:
+                self._emit_items(parent[1])
+                parent[1] = []
+                self._emit(text)
+            else:
+                parent[1].append(("block", text))
+                parent[2] += len(text) + 1
+                if parent[2] - 1 > self.max_record_chars:
+                    self._split(len(self.stack) - 1)
+        else:
+            self._split(len(self.stack) - 1)
+            self._emit_items(items)
+
+    def close(self):
+        if self.stack is None:
+            return self.records
+        self._flush()
+        while len(self.stack) > 1:
+            self._close_frame()
+        root = self.stack[0]
+        if root[4] or (root[3] and root[2] - 1 > self.max_record_chars):
+            self._emit_items(root[1])
+        else:
+            self._emit(" ".join(t for _, t in root[1]))
+        self.stack = None
+        return self.records
+
+
+class _StdlibParser(HTMLParser):
+    """html.parser adapter that drives the same target interface as lxml's target parser."""
+
+    def __init__(self, target):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag)
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def _stream(html, target, backend=None):
+    """Feeds html in slices and stops as soon as the target says its budget is full."""
+    if not html:
+        return target.close()
+    backend = backend or ("lxml" if etree is not None else "stdlib")
+    parser = etree.HTMLParser(target=target, recover=True) if backend == "lxml" else _StdlibParser(target)
+    try:
+        for i in range(0, len(html), FEED_CHARS):
+            parser.feed(html[i:i + FEED_CHARS])
+            if target.done:
+                break
+        if not target.done:
+            parser.close()
+    except Exception as e:
+        if not target.done:
+            print(f"HTML stream error: {e}")
+    return target.close()
+
+
+def html_to_text(html, max_chars=5000, skip=SKIP_TAGS, backend=None):
+    """Visible text (skipped subtrees removed, whitespace collapsed), cut at max_chars."""
+    return _stream(html, _TextTarget(max_chars, skip), backend)[:max_chars]
+
+
+def html_to_records(html, max_record_chars=1500, max_chars=None, backend=None):
+    """Record-aligned text blocks (listing cards, table rows, ...) in document order."""
+    return _stream(html, _RecordTarget(max_record_chars, max_chars), backend)
+
+
+# --- Benchmark ---
+
+def _soup_text(html, max_chars=5000):
+    """The BeautifulSoup version truncate_for_ai used before, kept for comparison."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(list(SKIP_TAGS)):
+        tag.decompose()
+    return " ".join(soup.get_text(separator=' ').split())[:max_chars]
+
+
+def bench(paths, rounds=3):
+    from signal_engine import load_corpus
+    pages = load_corpus(paths)
+    total_mb = sum(len(p) for p in pages) / 1e6
+
+    def timed(fn):
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for html in pages:
+                fn(html)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    base = timed(_soup_text)
+    same = sum(_soup_text(p) == html_to_text(p) for p in pages)
+    print(f"Corpus: {len(pages)} pages, {total_mb:.1f} MB")
+    print(f"  BeautifulSoup (html.parser)   : {1000 * base / len(pages):8.1f} ms/page")
+    for backend in (["lxml"] if etree is not None else []) + ["stdlib"]:
+        t = timed(lambda h: html_to_text(h, backend=backend))
+        print(f"  stream {backend:<6} 5000-char budget: {1000 * t / len(pages):8.1f} ms/page ({base / t:.0f}x)")
+    t = timed(lambda h: html_to_records(h))
+    print(f"  stream records (whole page)   : {1000 * t / len(pages):8.1f} ms/page")
+    print(f"  Identical output on {same}/{len(pages)} pages")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming HTML-to-text extractor.")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("paths", nargs="*", help="HTML files, globs or directories")
+    args = parser.parse_args()
+    bench(args.paths)
@@ -0,0 +1,72 @@
+"""
+Small async HTTP layer for the non-browser fetchers (SERP HTML, JSON APIs).
+
+requests runs in worker threads (one pooled Session per thread), so callers on
+any event loop — the dashboard runs each mission on its own — can await
+fetch() without a new dependency. A process-wide semaphore caps concurrent
+requests; bodies are read up to max_bytes.
+
+Config:
+    HTTP_CONCURRENCY   max requests in flight (default 16)
+    HTTP_TIMEOUT       seconds (default 10)
+"""
+import asyncio
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_CONCURRENCY = int(os.getenv("HTTP_CONCURRENCY", 16))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))
+MAX_BYTES = 2_000_000
+
+_local = threading.local()
+_slots = threading.BoundedSemaphore(HTTP_CONCURRENCY)
+
+
+def _session():
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_CONCURRENCY, pool_maxsize=HTTP_CONCURRENCY)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _local.session = session
+    return session
+
+
+def fetch_sync(url, method="GET", headers=None, cookies=None, proxy=None, timeout=None,
+               allow_redirects=True, max_bytes=MAX_BYTES):
+    """
+    Returns {"status", "url", "headers", "text", "elapsed", "redirects"}.
+    Network errors raise (requests.RequestException).
+    """
+    proxies = {"http": proxy, "https": proxy} if proxy else None
+    start = time.perf_counter()
+    with _slots:
+        with _session().request(method, url, headers=headers, cookies=cookies, proxies=proxies,
+                                timeout=timeout or HTTP_TIMEOUT, allow_redirects=allow_redirects,
+                                stream=True) as r:
+            body = b""
+            if method != "HEAD":
+                for chunk in r.iter_content(65536):
+                    body += chunk
+                    if len(body) >= max_bytes:
+                        break
+            # requests assumes latin-1 for text/* without a charset; the web is mostly utf-8
+            encoding = r.encoding if "charset" in r.headers.get("Content-Type", "").lower() else "utf-8"
+            return {
+                "status": r.status_code,
+                "url": r.url,
+                "headers": dict(r.headers),
+                "text": body.decode(encoding or "utf-8", errors="replace"),
+                "elapsed": time.perf_counter() - start,
+                "redirects": [h.url for h in r.history],
+            }
+
+
+async def fetch(url, **kwargs):
+    """Awaitable fetch_sync (same arguments and result)."""
+    return await asyncio.to_thread(fetch_sync, url, **kwargs)
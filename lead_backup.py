@@ -0,0 +1,81 @@
+"""
+Local backup CSV (incremental_leads_backup.csv) operations used by run_mission.
+
+Each helper takes the file path and returns only a small answer, so
+LeadHunter can run them in the CPU pool: the pandas read/parse/write
+happens in a worker process instead of on the asyncio loop.
+"""
+import os
+
+import pandas as pd
+
+EMPTY_VALUES = ["N/A", "", "nan", "Pending Deep Background Scan..."]
+
+
+def _read(path):
+    # Everything as text: an all-"N/A" column would otherwise load as float NaN and refuse string writes
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def missing_fields(path, name, fields):
+    """Which of `fields` are still empty on the row for this Company Name ([] if complete, None if no row)."""
+    if not os.path.exists(path):
+        return None
+    df = _read(path)
+    matches = df.index[df['Company Name'].astype(str).str.strip() == name.strip()].tolist()
+    if not matches:
+        return None
+    row = df.iloc[matches[0]]
+    return [f for f in fields if str(row.get(f, "N/A")).strip() in EMPTY_VALUES]
+
+
+def fill_empty_fields_many(path, updates):
+    """
+    Writes values only into columns that are still empty, keyed by Company Name:
+    updates = {name: {column: value}}. One read and one write for the whole batch.
+    Returns {name: fields filled}.
+    """
+    df = _read(path)
+    names = df['Company Name'].astype(str).str.strip()
+    filled = {}
+    for name, values in updates.items():
+        idx = df.index[names == name.strip()].tolist()
+        if not idx:
+            continue
+        filled[name] = 0
+        for col, new_val in values.items():
+            if col not in df.columns:
+                df[col] = "N/A"
+            cur = str(df.loc[idx[0], col]).strip()
+            if cur in EMPTY_VALUES and new_val and str(new_val).strip() not in ["N/A", "", "nan"]:
+                df.loc[idx[0], col] = new_val
+                filled[name] += 1
+    if any(filled.values()):
+        df.to_csv(path, index=False)
+    return filled
+
+
+def website_in_backup(path, website):
+    if not os.path.exists(path):
+        return False
+    df = _read(path)
+    web_clean = website.strip().lower() if website else "n/a"
+    if 'Website' in df.columns and web_clean not in ["n/a", ""]:
+        return web_clean in df['Website'].astype(str).str.lower().values
+    return False
+
+
+def append_row(path, row):
+    pd.DataFrame([row]).to_csv(path, mode='a', header=not os.path.isfile(path), index=False)
+
+
+def update_row(path, name, values):
+    """Overwrites `values` on the first row with this Company Name. Returns True if a row was updated."""
+    df = _read(path)
+    idx = df.index[df['Company Name'] == name].tolist()
+    if not idx:
+        return False
+    for col, val in values.items():
+        df.loc[idx[0], col] = val
+    df.to_csv(path, index=False)
+    return True
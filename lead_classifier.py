@@ -0,0 +1,281 @@
+"""
+Local CPU Lead Classifier — distilled from archived Gemini decisions.
+
+intelligence_archive.txt already holds every scoring prompt and Gemini's
+JSON answer. This module turns those pairs into a dataset, fits a tiny
+hashed n-gram model (softmax for the decision, linear regression for the
+score) and saves it as JSON. LeadHunter uses it as a first-pass scorer:
+confident predictions skip Gemini, uncertain ones escalate.
+
+Usage:
+    python lead_classifier.py train [--archive intelligence_archive.txt] [--out lead_classifier_model.json]
+    python lead_classifier.py eval  [--archive ...] [--model ...]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+import time
+import zlib
+
+ARCHIVE_FILE = "intelligence_archive.txt"
+MODEL_FILE = os.getenv("LOCAL_SCORER_MODEL", "lead_classifier_model.json")
+DECISIONS = ["Qualified", "Neutral", "Not Qualified"]
+N_FEATURES = 2 ** 18
+
+# One archive entry written by LeadHunter.archive_intelligence()
+ENTRY_PATTERN = re.compile(
+    r"^\[(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)\] \[([^\]\n]+)\] \[([^\]\n]+)\]\n(.*?)\n-{50}$",
+    re.M | re.S,
+)
+
+# Prompt kind -> (prompt prefix, response prefix) as archived (categories are upper-cased)
+KINDS = {
+    "score": ("PROMPT_SCORE_", "RESPONSE_SCORE_"),
+    "linkedin": ("PROMPT_LINKEDIN_", "RESPONSE_LINKEDIN_"),
+}
+
+
+def normalize_decision(raw):
+    raw = str(raw or "").strip().lower()
+    if raw.startswith("not") or "unqualified" in raw:
+        return "Not Qualified"
+    if raw.startswith("qualified"):
+        return "Qualified"
+    return "Neutral"
+
+
+def prompt_body(kind, prompt):
+    """Keeps only the lead-specific part of an archived prompt (drops the fixed template)."""
+    if kind == "score":
+        match = re.search(r"Website Content:\s*(.*?)\s*Return exactly", prompt, re.S)
+        name = re.search(r"for '(.*?)'", prompt)
+        body = match.group(1) if match else prompt
+        return f"{name.group(1) if name else ''} {body}"
+    match = re.search(r"Signal Category:\s*(.*?)\n\s*Snippet:\s*(.*?)\n\s*Goal:", prompt, re.S)
+    return f"{match.group(1)} {match.group(2)}" if match else prompt
+
+
+def parse_archive(path=ARCHIVE_FILE):
+    """Yields (timestamp, mission_id, category, content) for every archived AI entry."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        raw = f.read()
+    for match in ENTRY_PATTERN.finditer(raw):
+        yield match.group(1), match.group(2), match.group(3), match.group(4)
+
+
+def load_dataset(path=ARCHIVE_FILE, kind="score"):
+    """
+    Pairs each PROMPT_<KIND>_<lead> with the RESPONSE_<KIND>_<lead> that follows it
+    in the same mission. Returns a list of {"text", "decision", "score"} rows.
+    """
+    prompt_prefix, response_prefix = KINDS[kind]
+    pending = {}
+    rows = []
+    for _, mission_id, category, content in parse_archive(path):
+        if category.startswith(prompt_prefix):
+            pending[(mission_id, category[len(prompt_prefix):])] = content
+        elif category.startswith(response_prefix):
+            prompt = pending.pop((mission_id, category[len(response_prefix):]), None)
+            if prompt is None:
+                continue
+            start, end = content.find("{"), content.rfind("}") + 1
+            try:
+                data = json.loads(content[start:end])
+                score = float(data.get("score", 0))
+            except Exception:
+                continue
+            rows.append({
+                "text": prompt_body(kind, prompt),
+                "decision": normalize_decision(data.get("decision")),
+                "score": max(0.0, min(100.0, score)),
+            })
+    return rows
+
+
+def featurize(text):
+    """Hashed word unigrams + bigrams, L2-normalised. Returns {index: weight}."""
+    words = re.findall(r"[a-z0-9@.]+", str(text).lower())[:1500]
+    grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    feats = {}
+    for g in grams:
+        idx = zlib.crc32(g.encode("utf-8")) % N_FEATURES
+        feats[idx] = feats.get(idx, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in feats.values())) or 1.0
+    return {k: v / norm for k, v in feats.items()}
+
+
+class LeadClassifier:
+    """Sparse softmax (decision) + linear regression (score) trained with plain SGD."""
+
+    def __init__(self, kind="score"):
+        self.kind = kind
+        self.w = {d: {} for d in DECISIONS}
+        self.b = {d: 0.0 for d in DECISIONS}
+        self.score_w = {}
+        self.score_b = 50.0
+        self.threshold = 0.8
+        self.report = {}
+
+    def _logits(self, feats):
+        return {d: self.b[d] + sum(self.w[d].get(i, 0.0) * v for i, v in feats.items()) for d in DECISIONS}
+
+    def _probs(self, feats):
+        logits = self._logits(feats)
+        top = max(logits.values())
+        exp = {d: math.exp(l - top) for d, l in logits.items()}
+        total = sum(exp.values())
+        return {d: e / total for d, e in exp.items()}
+
+    def fit(self, rows, epochs=12, lr=0.5, l2=1e-5, seed=7):
+        data = [(featurize(r["text"]), r["decision"], r["score"]) for r in rows]
+        self.score_b = sum(r["score"] for r in rows) / len(rows) if rows else 50.0
+        rng = random.Random(seed)
+        for epoch in range(epochs):
+            rng.shuffle(data)
+            step = lr / (1 + epoch)
+            for feats, decision, score in data:
+                probs = self._probs(feats)
+                for d in DECISIONS:
+                    grad = probs[d] - (1.0 if d == decision else 0.0)
+                    if grad == 0.0:
+                        continue
+                    wd = self.w[d]
+                    for i, v in feats.items():
+                        wd[i] = wd.get(i, 0.0) * (1 - step * l2) - step * grad * v
+                    self.b[d] -= step * grad
+                # Features are unit-norm, so one step moves the prediction by step * err
+                err = self.score_b + sum(self.score_w.get(i, 0.0) * v for i, v in feats.items()) - score
+                for i, v in feats.items():
+                    self.score_w[i] = self.score_w.get(i, 0.0) - step * err * v
+                self.score_b -= 0.1 * step * err
+        return self
+
+    def predict(self, text):
+        """Returns (decision, confidence, score)."""
+        feats = featurize(text)
+        probs = self._probs(feats)
+        decision = max(probs, key=probs.get)
+        score = self.score_b + sum(self.score_w.get(i, 0.0) * v for i, v in feats.items())
+        return decision, probs[decision], int(round(max(0.0, min(100.0, score))))
+
+    def is_confident(self, confidence):
+        return confidence >= self.threshold
+
+    def save(self, path=MODEL_FILE):
+        """Saves all kinds into one JSON file so LeadHunter loads a single artifact."""
+        bundle = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    bundle = json.load(f)
+            except Exception:
+                bundle = {}
+        prune = lambda weights: {str(i): round(v, 6) for i, v in weights.items() if abs(v) > 1e-6}
+        bundle[self.kind] = {
+            "w": {d: prune(self.w[d]) for d in DECISIONS},
+            "b": self.b,
+            "score_w": prune(self.score_w),
+            "score_b": self.score_b,
+            "threshold": self.threshold,
+            "report": self.report,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(bundle, f)
+
+    @classmethod
+    def load(cls, path=MODEL_FILE, kind="score"):
+        """Returns the saved model for `kind`, or None if it hasn't been trained yet."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f).get(kind)
+        except Exception as e:
+            print(f"[WARN] Could not load local scorer: {e}")
+            return None
+        if not data:
+            return None
+        model = cls(kind)
+        model.w = {d: {int(i): v for i, v in data["w"].get(d, {}).items()} for d in DECISIONS}
+        model.b = data["b"]
+        model.score_w = {int(i): v for i, v in data["score_w"].items()}
+        model.score_b = data["score_b"]
+        model.threshold = data.get("threshold", 0.8)
+        model.report = data.get("report", {})
+        return model
+
+
+def evaluate(model, rows):
+    """Agreement with Gemini, score error and per-lead latency on held-out rows."""
+    if not rows:
+        return {"n": 0}
+    agree = confident = confident_agree = 0
+    abs_err = 0.0
+    start = time.perf_counter()
+    for r in rows:
+        decision, conf, score = model.predict(r["text"])
+        agree += decision == r["decision"]
+        abs_err += abs(score - r["score"])
+        if model.is_confident(conf):
+            confident += 1
+            confident_agree += decision == r["decision"]
+    elapsed = time.perf_counter() - start
+    return {
+        "n": len(rows),
+        "agreement": round(agree / len(rows), 3),
+        "score_mae": round(abs_err / len(rows), 1),
+        "gate_coverage": round(confident / len(rows), 3),
+        "gate_agreement": round(confident_agree / confident, 3) if confident else None,
+        "latency_ms": round(1000 * elapsed / len(rows), 3),
+    }
+
+
+def train(archive=ARCHIVE_FILE, out=MODEL_FILE, kind="score", threshold=0.8, holdout=0.2, seed=7):
+    rows = load_dataset(archive, kind)
+    if len(rows) < 10:
+        print(f"[{kind}] Only {len(rows)} labelled examples in {archive} — need at least 10. Skipping.")
+        return None
+    rng = random.Random(seed)
+    rng.shuffle(rows)
+    cut = max(1, int(len(rows) * holdout))
+    test, train_rows = rows[:cut], rows[cut:]
+
+    model = LeadClassifier(kind).fit(train_rows, seed=seed)
+    model.threshold = threshold
+    model.report = evaluate(model, test)
+    model.report["trained_on"] = len(train_rows)
+    model.save(out)
+
+    r = model.report
+    print(f"[{kind}] trained on {len(train_rows)}, held out {r['n']}")
+    print(f"  Agreement with Gemini: {r['agreement']:.1%} | Score MAE: {r['score_mae']}")
+    if r["gate_agreement"] is not None:
+        print(f"  Gate @ p>={threshold}: skips Gemini for {r['gate_coverage']:.1%} of leads at {r['gate_agreement']:.1%} agreement")
+    print(f"  Latency: {r['latency_ms']} ms/lead")
+    return model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the local first-pass lead scorer from the intelligence archive.")
+    parser.add_argument("command", choices=["train", "eval"])
+    parser.add_argument("--archive", default=ARCHIVE_FILE)
+    parser.add_argument("--model", "--out", dest="model", default=MODEL_FILE)
+    parser.add_argument("--kind", choices=list(KINDS) + ["all"], default="all")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Min confidence for skipping Gemini")
+    args = parser.parse_args()
+
+    kinds = list(KINDS) if args.kind == "all" else [args.kind]
+    for k in kinds:
+        if args.command == "train":
+            train(args.archive, args.model, k, args.threshold)
+        else:
+            m = LeadClassifier.load(args.model, k)
+            if not m:
+                print(f"[{k}] No trained model in {args.model}")
+                continue
+            print(f"[{k}] {evaluate(m, load_dataset(args.archive, k))}")
@@ -7,30 +7,56 @@ import datetime
 from playwright.async_api import async_playwright
 import glob
 import json
-from bs4 import BeautifulSoup
+from html_text import html_to_text, html_to_records
 from gsheets_handler import GSheetsHandler
+from lead_classifier import LeadClassifier
+from structured_data import PORTAL_FIELDS, extract_portal, extract_json_block, json_ld_nodes, business_profile_from_parts, extract_business_profile
+from cpu_pool import get_cpu_pool
+import lead_backup
+from signal_engine import ENGINE as SIGNALS, SIGNATURES, EMAIL_REGEX, PHONE_PATTERN, scan_page, first_label, first_phone
 from dotenv import load_dotenv
 import google.generativeai as genai
 import gc
-import datetime
+import difflib
+import functools
+import hashlib
+import heapq
+import urllib.parse
+import weakref
 import pandas as pd
 
-import subprocess
+from dns_resolver import get_resolver, is_google_mx
+from proxy_pool import BLOCK_SELECTOR, get_proxy_pool, google_url, is_block_page, is_google_host
+from serp_providers import SerpRouter, GoogleHTTPProvider, SearxNGProvider, PlaywrightGoogleProvider
+from serp_cache import get_serp_cache
+from site_preflight import get_preflight
+from http_client import fetch
+from enrichment_cache import get_enrichment_cache, SCRAPE_FIELDS
+from snapshot_store import get_snapshot_store, RESCORE_CONCURRENCY
+from backfill_queue import get_backfill_queue, FILL_FIELDS, BACKFILL_BATCH, BACKFILL_MAX_ATTEMPTS
+
+def _workspace_domain(email_str):
+    if not email_str or "@" not in email_str: return ""
+    return email_str.split(',')[0].split('@')[-1].strip().lower()
 
 def check_google_workspace(email_str):
-    if not email_str or email_str == "N/A": return False
+    """Sync check (cached MX lookup) — prefer check_google_workspace_async inside the event loop."""
+    domain = _workspace_domain(email_str)
+    if not domain: return False
+    if domain in ['gmail.com', 'googlemail.com']: return True
     try:
-        domain = email_str.split('@')[-1].strip()
-        if not domain: return False
-        if domain in ['gmail.com', 'googlemail.com']: return True
-        # Quick MX Lookup to check for Google servers
-        result = subprocess.run(['nslookup', '-type=mx', domain], capture_output=True, text=True, timeout=2)
-        out = result.stdout.lower()
-        if 'google.com' in out or 'googlemail.com' in out:
-            return True
-    except:
-        pass
-    return False
+        return is_google_mx(get_resolver().resolve_mx_sync(domain))
+    except Exception:
+        return False
+
+async def check_google_workspace_async(email_str):
+    domain = _workspace_domain(email_str)
+    if not domain: return False
+    if domain in ['gmail.com', 'googlemail.com']: return True
+    try:
+        return is_google_mx(await get_resolver().resolve_mx(domain))
+    except Exception:
+        return False
 
 import phonenumbers
 from phonenumbers import phonenumberutil
@@ -43,7 +69,26 @@ def sanitize_phone_raw(raw_str):
     if re.match(r'^\d+\-\d+$', raw_str.strip()): return None
     return raw_str
 
-def clean_and_classify_phone(raw_phone, default_region="US"):
+# City -> LinkedIn country subdomain (dashboard settings start from this map)
+DEFAULT_CITY_MAP = {
+    "Noida": "in", "Gurgaon": "in", "Gurugram": "in", "Delhi": "in", "Mumbai": "in",
+    "Dubai": "ae", "Abu Dhabi": "ae", "London": "uk", "Singapore": "sg", 
+    "New York": "www", "Miami": "www", "Sydney": "au"
+}
+# LinkedIn subdomain -> phonenumbers region
+SUBDOMAIN_REGIONS = {"in": "IN", "ae": "AE", "uk": "GB", "sg": "SG", "au": "AU", "www": "US"}
+
+def infer_default_region(text, city_map=None, fallback="US"):
+    """Picks the phone region from the first mapped city mentioned in a keyword/city string."""
+    text = str(text or "").lower()
+    for city, sub in (city_map or DEFAULT_CITY_MAP).items():
+        if city.lower() in text:
+            return SUBDOMAIN_REGIONS.get(str(sub).lower(), fallback)
+    return fallback
+
+@functools.lru_cache(maxsize=100000)
+def normalize_phone(raw_phone, default_region="US"):
+    """Memoized parse: returns (clean_number, is_mobile, error). Same raw number is only parsed once."""
     try:
         parsed_num = phonenumbers.parse(raw_phone, default_region)
         
@@ -55,14 +100,19 @@ def clean_and_classify_phone(raw_phone, default_region="US"):
                 phonenumberutil.PhoneNumberType.MOBILE,
                 phonenumberutil.PhoneNumberType.FIXED_LINE_OR_MOBILE
             ]
-            return {"clean_number": formatted, "is_mobile": is_mobile, "error": None}
+            return formatted, is_mobile, None
     except Exception as e:
         pass
-    return {"clean_number": raw_phone, "is_mobile": False, "error": "Invalid Format"}
+    return raw_phone, False, "Invalid Format"
 
-def validate_and_parse_contact_fields(raw_phone_str, website_url="", email_str="", default_region="US"):
+def clean_and_classify_phone(raw_phone, default_region="US"):
+    clean_number, is_mobile, error = normalize_phone(raw_phone, default_region)
+    return {"clean_number": clean_number, "is_mobile": is_mobile, "error": error}
+
+def validate_and_parse_contact_fields(raw_phone_str, website_url="", email_str="", default_region="US", is_workspace=None):
     """
     Validates and sorts contact fields instantly using phonenumbers library.
+    Pass is_workspace (from check_google_workspace_async) to skip the blocking MX lookup.
     Returns: (is_phone_valid, is_mobile_valid, phone_val, mobile_val, chat_type)
     """
     phone_clean = "N/A"
@@ -86,29 +136,90 @@ def validate_and_parse_contact_fields(raw_phone_str, website_url="", email_str="
     is_mobile_valid = mobile_clean != "N/A"
 
     # Fast Scan Website Domain for Active Live-Chat Widgets
-    web_lower = str(website_url).lower()
-    if "wa.me" in web_lower or "api.whatsapp" in web_lower:
-        chat_detected = "WhatsApp Link"
-    elif "drift.com" in web_lower or "drifttteam" in web_lower:
-        chat_detected = "Drift Chat"
-    elif "intercom" in web_lower:
-        chat_detected = "Intercom"
-    elif "chat.google.com" in web_lower:
-        chat_detected = "Google Chat"
+    chat_detected = first_label(str(website_url), "url_chat", chat_detected)
 
     if is_mobile_valid and "WhatsApp" not in chat_detected:
         chat_detected = ("Verified Mobile" if chat_detected == "None/Standard"
                          else chat_detected + " | Verified Mobile")
 
     if email_str and email_str not in ["N/A", "", "Pending Deep Background Scan..."]:
-        first_email = email_str.split(',')[0].strip()
-        if check_google_workspace(first_email):
+        if is_workspace is None:
+            is_workspace = check_google_workspace(email_str.split(',')[0].strip())
+        if is_workspace:
             chat_detected = ("Google Workspace (Chat)" if chat_detected == "None/Standard"
                              else chat_detected + " | Google Workspace (Chat)")
 
     return is_phone_valid, is_mobile_valid, phone_clean, mobile_clean, chat_detected
 
 
+def _chat_from_website(web_series):
+    # Same url_chat rules as validate_and_parse_contact_fields, once per distinct website
+    web = web_series.fillna("").astype(str)
+    labels = {w: first_label(w, "url_chat", "None/Standard") for w in web.unique()}
+    return web.map(labels)
+
+def _append_chat(chat, mask, label):
+    base = chat.where(chat != "None/Standard", "")
+    return chat.where(~mask, (base + " | " + label).str.lstrip(" |"))
+
+def validate_contacts_frame(df, phone_col="Mobile", website_col="Website", email_col="Emails",
+                            keyword_col="Keyword", default_region=None, city_map=None, check_workspace=False):
+    """
+    Batch version of validate_and_parse_contact_fields for bulk imports.
+    Each distinct (raw phone, region) pair is parsed once and mapped back onto the rows.
+    Region comes from default_region, else is inferred per distinct keyword via city_map.
+    Returns a copy of df with Phone / Phone Valid / Mobile / Mobile Valid / Chat Option filled in;
+    a number that doesn't parse stays as it was in phone_col (marked not valid).
+    """
+    out = df.copy()
+    raw = out[phone_col].astype(str).str.strip() if phone_col in out.columns else pd.Series("", index=out.index)
+    raw = raw.where(~raw.isin(["nan", "None", "N/A"]), "")
+    if default_region:
+        region = pd.Series(default_region, index=out.index)
+    elif keyword_col in out.columns:
+        kw = out[keyword_col].fillna("").astype(str)
+        region = kw.map({k: infer_default_region(k, city_map) for k in kw.unique()})
+    else:
+        region = pd.Series("US", index=out.index)
+
+    parsed = {}
+    for raw_phone, reg in set(zip(raw, region)):
+        cleaned = sanitize_phone_raw(raw_phone) if raw_phone else None
+        phone_clean, mobile_clean = "N/A", "N/A"
+        if cleaned:
+            clean_number, is_mobile, error = normalize_phone(cleaned, reg)
+            if error is None and is_mobile:
+                mobile_clean = clean_number
+            elif error is None:
+                phone_clean = clean_number
+        # Wrong region guess or not a number: keep what the sheet had
+        unparsed = raw_phone if raw_phone and phone_clean == mobile_clean == "N/A" else None
+        parsed[(raw_phone, reg)] = (phone_clean, mobile_clean, unparsed)
+
+    rows = [parsed[key] for key in zip(raw, region)]
+    out["Phone"] = [r[0] for r in rows]
+    out["Phone Valid"] = ["YES" if r[0] != "N/A" else "NO" for r in rows]
+    out["Mobile"] = [r[1] for r in rows]
+    out["Mobile Valid"] = ["YES" if r[1] != "N/A" else "NO" for r in rows]
+    unparsed = pd.Series([r[2] for r in rows], index=out.index)
+    out.loc[unparsed.notna(), phone_col] = unparsed[unparsed.notna()]
+
+    chat = _chat_from_website(out[website_col]) if website_col in out.columns else pd.Series("None/Standard", index=out.index)
+    add_mobile = (out["Mobile Valid"] == "YES") & ~chat.str.contains("WhatsApp", regex=False)
+    chat = _append_chat(chat, add_mobile, "Verified Mobile")
+
+    if check_workspace and email_col in out.columns:
+        domains = out[email_col].fillna("").astype(str).map(_workspace_domain)
+        unique = [d for d in domains.unique() if d]
+        mx = asyncio.run(get_resolver().resolve_mx_many(unique)) if unique else {}
+        ws = {d: d in ("gmail.com", "googlemail.com") or is_google_mx(mx.get(d, [])) for d in unique}
+        is_ws = domains.map(lambda d: ws.get(d, False))
+        chat = _append_chat(chat, is_ws, "Google Workspace (Chat)")
+
+    out["Chat Option"] = chat
+    return out
+
+
 # Try importing different stealth implementations to compatible with different versions
 stealth_async = None
 Stealth = None
@@ -144,10 +255,283 @@ if os.path.exists(".env.local"):
 
 IS_RENDER = os.getenv("RENDER") == "true"
 
+# Social profile link patterns (homepage anchors)
+SOCIAL_LINK_PATTERNS = {
+    "linkedin": "linkedin.com/company",
+    "instagram": "instagram.com/",
+    "facebook": "facebook.com/",
+    "twitter": "x.com/"
+}
+# Social recovery: site: filters for the combined OR-query, and result paths that are not profiles
+SOCIAL_SEARCH_SITES = {"linkedin": "linkedin.com/company", "instagram": "instagram.com", "facebook": "facebook.com"}
+SOCIAL_NON_PROFILE = ("/p/", "/reel/", "/explore/", "/sharer", "/share", "/posts/", "/events/", "/groups/", "/login", "/hashtag/")
+
+
+def classify_social_url(url):
+    """Platform of a company profile URL (see SOCIAL_SEARCH_SITES), or None for posts / other pages."""
+    low = (url or "").lower()
+    if any(x in low for x in SOCIAL_NON_PROFILE):
+        return None
+    for platform, site in SOCIAL_SEARCH_SITES.items():
+        if site in low:
+            return platform
+    return None
+
+
+def socials_from_links(links):
+    """First profile link per SOCIAL_LINK_PATTERNS platform (share / intent links skipped)."""
+    found = {k: "N/A" for k in SOCIAL_LINK_PATTERNS}
+    for link in links:
+        link_lower = link.lower()
+        for platform, pattern in SOCIAL_LINK_PATTERNS.items():
+            if pattern in link_lower and "sharer" not in link_lower and "intent" not in link_lower:
+                if found[platform] == "N/A":
+                    found[platform] = link
+    return found
+
+
+# Lead fields derived from the snapshot texts: what rescore_snapshots recomputes and writes back when changed
+RESCORE_FIELDS = ("score", "decision", "age", "summary", "address", "gmb_status", "gmb_opp", "ad_status", "ad_opp",
+                  "web_status", "web_opp", "speed_status", "speed_opp", "xray_status", "xray_opp")
+
+# enrichment_waterfall results kept per domain (see enrichment_cache.py)
+WATERFALL_FIELDS = ("founder", "founder_linkedin", "email_guess", "socials")
+
+# Team-page discovery (enrichment_waterfall): fixed paths, plus same-site nav links that look like one
+TEAM_PAGE_PATHS = ["/about", "/about-us", "/our-team", "/management", "/leadership"]
+TEAM_LINK_PATTERN = re.compile(r"about|team|leadership|management|people|founder|who-we-are|our-story", re.I)
+TEAM_PAGE_MAX = 10
+LEADERSHIP_PATTERN = re.compile(r"([A-Z][a-z]+ [A-Z][a-z]+) (?:is the )?(Founder|CEO|Owner|Director|Managing Director|CMO|CTO)")
+HREF_PATTERN = re.compile(r"""href\s*=\s*["']([^"'#]+)""", re.I)
+
+
+def page_links(html, base_url):
+    """Absolute http(s) hrefs in raw HTML, in page order."""
+    links = (urllib.parse.urljoin(base_url, h.strip()) for h in HREF_PATTERN.findall(html or ""))
+    return list(dict.fromkeys(l for l in links if l.startswith("http")))
+
+
+def team_page_urls(site_url, links):
+    """TEAM_PAGE_PATHS on the site first, then same-host nav links whose URL looks like a team / about page."""
+    base = site_url.rstrip("/")
+    host = urllib.parse.urlsplit(site_url).netloc.lower()
+    urls = [base + path for path in TEAM_PAGE_PATHS]
+    urls += [l.split("?")[0].rstrip("/") for l in links
+             if urllib.parse.urlsplit(l).netloc.lower() == host and TEAM_LINK_PATTERN.search(urllib.parse.urlsplit(l).path)]
+    return list(dict.fromkeys(urls))[:TEAM_PAGE_MAX]
+
+# PAGE PROBE: runs inside the page and returns only what scrape_website needs,
+# so the full HTML never crosses CDP into Python.
+PAGE_PROBE_TEXT_CHARS = 5000
+PAGE_PROBE_JS = r"""
+(opts) => {
+    const html = document.documentElement.outerHTML;
+    const lower = html.toLowerCase();
+    const body = document.body ? document.body.innerText : "";
+    const uniq = (arr) => Array.from(new Set(arr));
+
+    const labels = {};
+    for (const [group, label, needles] of opts.signatures) {
+        if (needles.some(n => lower.includes(n))) (labels[group] = labels[group] || []).push(label);
+    }
+
+    const imageExt = /\.(png|jpe?g|gif|svg)$/i;
+    const emails = uniq((html.match(new RegExp(opts.emailRegex, "g")) || []).filter(e => !imageExt.test(e))).slice(0, 100);
+    const phone = body.match(new RegExp(opts.phoneRegex));
+
+    const anchors = Array.from(document.querySelectorAll("a[href]"));
+    const socials = {};
+    for (const a of anchors) {
+        const href = a.href, h = href.toLowerCase();
+        if (h.includes("sharer") || h.includes("intent")) continue;
+        for (const [platform, pattern] of Object.entries(opts.socialPatterns)) {
+            if (!socials[platform] && h.includes(pattern)) socials[platform] = href;
+        }
+    }
+    const byHref = anchors.filter(a => /contact|about/i.test(a.getAttribute("href")));
+    const byText = anchors.filter(a => /contact|about/i.test(a.textContent || ""));
+    const contactLinks = uniq(byHref.concat(byText).map(a => a.href).filter(h => h.startsWith("http"))).slice(0, 5);
+
+    const meta = {};
+    for (const m of document.querySelectorAll("meta[content]")) {
+        const key = (m.getAttribute("property") || m.getAttribute("name") || m.getAttribute("itemprop") || "").toLowerCase();
+        if (key && !(key in meta)) meta[key] = m.getAttribute("content").trim();
+    }
+    const micro = {};
+    for (const el of document.querySelectorAll("[itemprop]")) {
+        const prop = el.getAttribute("itemprop").toLowerCase();
+        const value = (el.getAttribute("content") || el.getAttribute("href") || el.textContent || "")
+            .replace(/\s+/g, " ").trim().slice(0, 300);
+        if (value) (micro[prop] = micro[prop] || []).push(value);
+    }
+
+    return {
+        text: body.slice(0, opts.textChars),
+        emails: emails,
+        phone: phone ? phone[0].trim() : null,
+        socials: socials,
+        tech: labels.tech || [],
+        chat: labels.chat || [],
+        contactLinks: contactLinks,
+        jsonld: Array.from(document.querySelectorAll('script[type="application/ld+json"]')).map(s => s.textContent),
+        meta: meta,
+        micro: micro,
+        tel: Array.from(document.querySelectorAll('a[href^="tel:" i]')).map(a => a.getAttribute("href").slice(4)),
+        mailto: Array.from(document.querySelectorAll('a[href^="mailto:" i]')).map(a => a.getAttribute("href").slice(7).split("?")[0]),
+        htmlChars: html.length,
+    };
+}
+"""
+
+# ENRICHMENT LADDER: minimum Tier-0 pre-score (0-100) a Maps candidate needs
+# before each paid tier runs. Override per deploy with LADDER_<TIER>_MIN.
+LADDER_THRESHOLDS = {
+    "browser": int(os.getenv("LADDER_BROWSER_MIN", 25)),   # website scrape
+    "socials": int(os.getenv("LADDER_SOCIALS_MIN", 40)),   # Google social recovery
+    "xray":    int(os.getenv("LADDER_XRAY_MIN", 55)),      # founder X-ray dork
+    "llm":     int(os.getenv("LADDER_LLM_MIN", 35)),       # Gemini scoring
+}
+
+# Local on-disk caches (AI chunk results, ...). Safe to delete at any time.
+CACHE_DIR = os.getenv("HUNTER_CACHE_DIR", ".hunter_cache")
+
+# Google consent: cookies saved once as Playwright storage_state and loaded into every new context
+CONSENT_STATE_PATH = os.getenv("CONSENT_STATE_PATH", os.path.join(CACHE_DIR, "google_consent_state.json"))
+
+# One evaluate per page: find the consent wall's "accept" control and click it in-page.
+# Returns the clicked label, or null when there is no wall.
+CONSENT_JS = r"""
+() => {
+  const labels = ["accept all", "i agree", "agree", "alle akzeptieren", "tout accepter", "aceptar todo",
+                  "accetta tutto", "aceitar tudo", "alles accepteren", "zaakceptuj wszystko"];
+  const onWall = location.hostname.startsWith("consent.") ||
+                 !!document.querySelector('form[action*="consent.google"], form[action*="/save"] input[name="set_eom"]');
+  const nodes = document.querySelectorAll('button, div[role="button"], input[type="submit"]');
+  for (const el of nodes) {
+    const text = ((el.getAttribute("aria-label") || el.innerText || el.value || "") + "").trim().toLowerCase();
+    if (!text || text.length > 40) continue;
+    if (labels.includes(text) || (onWall && labels.some(l => text.startsWith(l)))) {
+      el.click();
+      return text;
+    }
+  }
+  return null;
+}
+"""
+
+# Universal extraction: chars per AI call, max chunks per page, parallel AI calls
+AI_CHUNK_CHARS = int(os.getenv("AI_CHUNK_CHARS", 8000))
+AI_MAX_CHUNKS = int(os.getenv("AI_MAX_CHUNKS", 12))
+AI_CONCURRENCY = int(os.getenv("AI_CONCURRENCY", 3))
+
+# Record splitting on listing/directory pages: a block (html_text.BLOCK_TAGS)
+# whose text fits in RECORD_MAX_CHARS is treated as one record (e.g. a listing card)
+RECORD_MAX_CHARS = 1500
+
+# Words that say nothing about keyword fit ("dentists in miami near me")
+KEYWORD_STOPWORDS = {"in", "near", "me", "the", "and", "of", "for", "best", "top", "a", "an", "at", "to", "services", "companies"}
+
+# Dual-Scan founder X-ray: company names packed per OR-dork (Google ignores words past ~32),
+# and how sure a result title/snippet must be about a company before it's assigned
+FOUNDER_BATCH_SIZE = int(os.getenv("FOUNDER_BATCH_SIZE", 4))
+FOUNDER_QUERY_WORDS = 32
+FOUNDER_MATCH_MIN = 0.8
+# Intra-lead parallel enrichment: independent lookups run on sibling pages of the
+# lead's browser context; one that overruns this many seconds is dropped (defaults kept)
+ENRICH_TASK_TIMEOUT = float(os.getenv("ENRICH_TASK_TIMEOUT", 60))
+
+# Per-lead deadline (seconds) and each stage's share of it. A stage over budget is
+# cancelled and the lead goes on with what it has, marked partial.
+# STAGE_BUDGET_<STAGE> (seconds) overrides a share, e.g. STAGE_BUDGET_XRAY=10
+LEAD_DEADLINE = float(os.getenv("LEAD_DEADLINE", 45))
+STAGE_BUDGETS = {"website": 0.7, "socials": 0.4, "xray": 0.5, "fallback": 0.3, "fill_in": 1.0}
+# AI scoring runs on its own clock once enrichment is done, so a slow site can't starve it
+SCORE_BUDGET = float(os.getenv("STAGE_BUDGET_SCORE", 20))
+
+COMPANY_NAME_NOISE = {"llc", "inc", "ltd", "limited", "pvt", "private", "co", "corp", "corporation", "company",
+                      "the", "and", "of", "group", "services", "solutions", "plc", "gmbh", "llp"}
+
+
+def _name_tokens(text):
+    return [t for t in re.findall(r"[a-z0-9]+", (text or "").lower()) if t not in COMPANY_NAME_NOISE]
+
+
+def company_match_score(company, text):
+    """0-1: share of the company's name tokens found in `text`, with fuzzy credit for typos / plurals."""
+    want = _name_tokens(company)
+    have = set(_name_tokens(text))
+    if not want or not have:
+        return 0.0
+    hits = 0.0
+    for tok in want:
+        if tok in have:
+            hits += 1
+            continue
+        best = max((difflib.SequenceMatcher(None, tok, h).ratio() for h in have if abs(len(h) - len(tok)) <= 2), default=0.0)
+        if best >= 0.85:
+            hits += best
+    return hits / len(want)
+
+class LeadDeadline:
+    """Wall-clock budget for one lead; stages get min(their share, what's left)."""
+    def __init__(self, total=LEAD_DEADLINE):
+        self.total = total
+        self.start = time.time()
+        self.cut = []   # stages cancelled over budget
+
+    def remaining(self):
+        return max(0.0, self.total - (time.time() - self.start))
+
+    def budget(self, stage):
+        override = os.getenv(f"STAGE_BUDGET_{stage.upper()}")
+        share = float(override) if override else self.total * STAGE_BUDGETS.get(stage, 1.0)
+        return min(share, self.remaining())
+
+    @property
+    def partial(self):
+        return ", ".join(dict.fromkeys(self.cut))
+
+
 class LeadHunter:
-    def __init__(self, keyword=None, limit=10):
+    def __init__(self, keyword=None, limit=10, ladder=None, local_gate=None, refresh_cache=None):
         self.keyword = keyword
         self.limit = limit
+        self.ladder = {**LADDER_THRESHOLDS, **(ladder or {})}
+        self.ladder_stats = {"tier0": 0, "browser": 0, "socials": 0, "xray": 0, "llm": 0}
+        # Distilled local scorer: confident predictions skip Gemini
+        self.local_gate = local_gate if local_gate is not None else os.getenv("LOCAL_SCORER_GATE", "false").lower() == "true"
+        self.local_scorers = {}
+        self.ai_stats = {"local": 0, "gemini": 0}
+        self.extraction_stats = {}   # portal -> {"records": n, "no_ai": n}
+        self.probe_stats = {"pages": 0, "html_chars": 0, "returned_chars": 0}
+        self.consent_stats = {"contexts": 0, "reused": 0, "walls": 0}
+        self.social_stats = {"leads": 0, "combined": 0, "fallbacks": 0}
+        self.founder_cache = {}   # company name -> {"name", "url", "snippet"} or False
+        self.founder_stats = {"companies": 0, "batch_queries": 0, "batch_hits": 0, "single_queries": 0}
+        self.parallel_stats = {"leads": 0, "tasks": 0, "timeouts": 0, "serial": 0.0, "wall": 0.0}
+        self.stage_stats = {}   # stage -> {"runs", "seconds", "max", "cut"}
+        # Google egress pool (proxies / direct) with per-egress CAPTCHA breakers
+        self.proxies = get_proxy_pool()
+        self.page_egress = weakref.WeakKeyDictionary()
+        # Google searches: disk cache, then plain-HTTP results page, SearxNG, the browser last
+        # Liveness pre-flight: dead / parked sites never cost a browser navigation
+        self.preflight = get_preflight()
+        # Per-domain enrichment results; refresh_cache=True re-scrapes everything (and rewrites the cache)
+        self.enrich_cache = get_enrichment_cache()
+        self.refresh_cache = refresh_cache if refresh_cache is not None else self.enrich_cache.refresh
+        # What each saved lead was scored on, for browser-free re-scoring
+        self.snapshots = get_snapshot_store()
+        self.ai_concurrency = AI_CONCURRENCY
+        # Existing leads with empty fields, filled later by run_backfill_sweep
+        self.backfill = get_backfill_queue()
+        self.serp = SerpRouter([
+            GoogleHTTPProvider(self.proxies, cookie_path=CONSENT_STATE_PATH),
+            SearxNGProvider(),
+            PlaywrightGoogleProvider(self),
+        ], cache=get_serp_cache())
+        # CPU-bound parsing / CSV work runs in a shared process pool, timed per mission
+        self.cpu = get_cpu_pool()
+        self.cpu_stats = {}
         self.gsheets = GSheetsHandler()
         self.leads = []
         self.api_key = os.getenv("GEMINI_API_KEY")
@@ -189,58 +573,85 @@ class LeadHunter:
         }
 
     def truncate_for_ai(self, html_content, max_chars=5000):
-        """Clean and slice text so Gemini doesn't choke on RAM."""
+        """Clean and slice text so Gemini doesn't choke on RAM (streams; stops at max_chars)."""
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-            # Remove script and style elements
-            for script_or_style in soup(["script", "style", "nav", "footer"]):
-                script_or_style.decompose()
-            
-            clean_text = soup.get_text(separator=' ')
-            # Collapse whitespace
-            clean_text = " ".join(clean_text.split())
-            return clean_text[:max_chars]
+            return html_to_text(html_content, max_chars)
         except Exception as e:
             print(f"Truncation error: {e}")
             return html_content[:max_chars]
 
+    async def run_cpu(self, fn, *args, offload=None):
+        """Runs a CPU-heavy module-level function off the event loop (see cpu_pool)."""
+        return await self.cpu.run(fn, *args, offload=offload, stats=self.cpu_stats)
+
     async def extract_socials(self, page):
         """
         Scans the current page for social media patterns.
         """
-        social_patterns = {
-            "linkedin": "linkedin.com/company",
-            "instagram": "instagram.com/",
-            "facebook": "facebook.com/",
-            "twitter": "x.com/"
-        }
-        found_socials = {k: "N/A" for k in social_patterns}
-        
         try:
             # 1. Grab all hrefs
             hrefs = await page.evaluate(
                 "() => Array.from(document.querySelectorAll('a[href]')).map(a => a.href)"
             )
-            
             # 2. Match patterns
-            for link in hrefs:
-                link_lower = link.lower()
-                for platform, pattern in social_patterns.items():
-                    if pattern in link_lower and "sharer" not in link_lower and "intent" not in link_lower:
-                        if found_socials[platform] == "N/A":
-                            found_socials[platform] = link
+            return socials_from_links(hrefs)
         except Exception as e:
             print(f"Error extracting socials: {e}")
-            
-        return found_socials
+        return {k: "N/A" for k in SOCIAL_LINK_PATTERNS}
 
-    async def universal_ai_extract(self, html_content, prompt_type="general"):
-        """Uses Gemini to extract structured lead data from any page text."""
-        if not self.model:
-            return {"error": "Gemini API key not configured"}
+    def page_records(self, html_content, max_chars=None):
+        """
+        Cleaned page text split on record boundaries: the largest block elements
+        whose text still fits in RECORD_MAX_CHARS (listing cards, table rows, ...).
+        Streams the HTML and stops once max_chars of records are collected.
+        """
+        try:
+            return html_to_records(html_content, RECORD_MAX_CHARS, max_chars)
+        except Exception as e:
+            print(f"Record split error: {e}")
+            return [" ".join(html_content.split())]
+
+    def chunk_records(self, records, max_chars=AI_CHUNK_CHARS):
+        """Greedily packs records into chunks; a record never straddles two chunks unless it alone is too big."""
+        chunks, current, size = [], [], 0
+        for rec in records:
+            while len(rec) > max_chars:
+                chunks.append(rec[:max_chars])
+                rec = rec[max_chars:]
+            if size + len(rec) + 1 > max_chars and current:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(rec)
+            size += len(rec) + 1
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    def _ai_semaphore(self):
+        """Per-event-loop semaphore enforcing AI_CONCURRENCY (dashboard runs a fresh loop per mission)."""
+        loop = asyncio.get_running_loop()
+        if getattr(self, "_ai_sem_loop", None) is not loop:
+            self._ai_sem_loop = loop
+            self._ai_sem = asyncio.Semaphore(self.ai_concurrency)
+        return self._ai_sem
+
+    async def _ai_call(self, fn, *args):
+        """
+        fn(*args) in a thread under the AI_CONCURRENCY semaphore. The slot is held until the
+        thread finishes, even if the caller is cancelled (a stage cut can't stop the request itself).
+        """
+        sem = self._ai_semaphore()
+        await sem.acquire()
+        call = asyncio.ensure_future(asyncio.to_thread(fn, *args))
 
-        clean_text = self.truncate_for_ai(html_content, 8000)
-        
+        def done(f):
+            sem.release()
+            if not f.cancelled(): f.exception()   # retrieved: an abandoned call's error isn't "never retrieved"
+
+        call.add_done_callback(done)
+        return await asyncio.shield(call)
+
+    def _extract_prompt(self, prompt_type, clean_text):
         prompts = {
             "general": f"""
                 Scan this page text and extract all business leads. 
@@ -268,28 +679,133 @@ class LeadHunter:
         prompt = prompts.get(prompt_type, prompts["general"])
         # Ensure JSON response
         prompt += "\nReturn exactly in valid JSON format. If it's a list, return [{}]. If single object, return {}."
+        return prompt
 
+    async def _run_extract_prompt(self, prompt, prompt_type):
+        """One Gemini extraction call (off the event loop) with archiving and JSON recovery."""
         # ARCHIVE: Prompt
         self.archive_intelligence(f"PROMPT_EXTRACT_{prompt_type}", prompt)
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await self._ai_call(self.model.generate_content, prompt)
             text = response.text.replace("```json", "").replace("```", "").strip()
             
             # ARCHIVE: Response
             self.archive_intelligence(f"RESPONSE_EXTRACT_{prompt_type}", text)
 
-            # Basic JSON extraction
-            start = text.find('[') if '[' in text else text.find('{')
-            end = (text.rfind(']') + 1) if ']' in text else (text.rfind('}') + 1)
-            if start != -1 and end != -1:
-                return json.loads(text[start:end])
-            return None
+            # Basic JSON extraction (with repair), off the loop for big replies
+            return await self.run_cpu(extract_json_block, text, "[{")
         except Exception as e:
             self.archive_intelligence(f"ERROR_EXTRACT_{prompt_type}", str(e))
             print(f"Universal AI Extract Error: {e}")
             return None
 
+    async def _extract_chunk(self, chunk, prompt_type):
+        """Extracts one chunk, reusing the on-disk result when this exact chunk was seen before."""
+        key = hashlib.sha1(f"{prompt_type}\n{chunk}".encode("utf-8")).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, "ai_chunks", f"{key}.json")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    return json.load(f), True
+            except Exception:
+                pass
+
+        data = await self._run_extract_prompt(self._extract_prompt(prompt_type, chunk), prompt_type)
+        if data is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+            except Exception as e:
+                print(f"Chunk cache write error: {e}")
+        return data, False
+
+    def merge_extracted(self, batches):
+        """Flattens per-chunk results and dedupes leads by name + contact, filling gaps from repeats."""
+        merged, index = [], {}
+        for batch in batches:
+            items = batch if isinstance(batch, list) else [batch] if isinstance(batch, dict) else []
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                name = item.get("company_name") or item.get("property_name") or item.get("college_name") or ""
+                contact = str(item.get("contact", ""))
+                key = (re.sub(r"[^a-z0-9]", "", str(name).lower()), re.sub(r"[^a-z0-9@]", "", contact.lower()))
+                if not any(key):
+                    continue
+                if key not in index:
+                    index[key] = item
+                    merged.append(item)
+                    continue
+                kept = index[key]
+                for k, v in item.items():
+                    if str(kept.get(k, "")).strip() in ["", "N/A", "...", "None"] and v:
+                        kept[k] = v
+        return merged
+
+    async def universal_ai_extract(self, html_content, prompt_type="general", chunked=None):
+        """
+        Uses Gemini to extract structured lead data from any page text.
+        `chunked` (default: on for list-style "general" pages) maps the whole page
+        in record-aligned chunks concurrently, then merges + dedupes the leads,
+        instead of truncating to the first AI_CHUNK_CHARS characters.
+        """
+        if not self.model:
+            return {"error": "Gemini API key not configured"}
+
+        if chunked is None:
+            chunked = prompt_type == "general"
+
+        if not chunked:
+            clean_text = await self.run_cpu(html_to_text, html_content, AI_CHUNK_CHARS)
+            return await self._run_extract_prompt(self._extract_prompt(prompt_type, clean_text), prompt_type)
+
+        records = await self.run_cpu(html_to_records, html_content, RECORD_MAX_CHARS, AI_CHUNK_CHARS * AI_MAX_CHUNKS)
+        chunks = self.chunk_records(records)[:AI_MAX_CHUNKS]
+        if not chunks:
+            return None
+        results = await asyncio.gather(*(self._extract_chunk(c, prompt_type) for c in chunks))
+        cached = sum(1 for _, hit in results if hit)
+        print(f"🧩 Chunked extract: {len(chunks)} chunks ({cached} cached, {len(chunks) - cached} sent to AI)")
+        merged = self.merge_extracted([data for data, _ in results if data])
+        return merged or None
+
+    async def extract_portal_record(self, html, prompt_type):
+        """
+        Structured data first (JSON-LD / meta / embedded state), Gemini only for
+        the fields that are still missing. Tracks how many records needed no AI.
+        """
+        record = extract_portal(html, prompt_type)
+        missing = [f for f in PORTAL_FIELDS[prompt_type] if not record.get(f)]
+        stats = self.extraction_stats.setdefault(prompt_type, {"records": 0, "no_ai": 0})
+
+        if missing:
+            ai_data = await self.universal_ai_extract(html, prompt_type=prompt_type)
+            if isinstance(ai_data, list) and ai_data:
+                ai_data = ai_data[0]
+            if isinstance(ai_data, dict):
+                for field in missing:
+                    if ai_data.get(field):
+                        record[field] = ai_data[field]
+        else:
+            print(f"🧱 Structured data covered all {prompt_type} fields — skipped AI")
+
+        if not record:
+            return None
+        stats["records"] += 1
+        if not missing:
+            stats["no_ai"] += 1
+        return record
+
+    def extraction_summary(self):
+        """One line per portal: share of records that needed no AI call."""
+        lines = []
+        for portal, st in self.extraction_stats.items():
+            if st["records"]:
+                lines.append(f"📊 {portal}: {st['no_ai']}/{st['records']} records needed no AI call ({st['no_ai'] / st['records']:.0%})")
+        return lines
+
     async def enrichment_waterfall(self, page, company_name):
         """
         The Enrichment Waterfall logic:
@@ -310,57 +826,53 @@ class LeadHunter:
         
         # Stage 1: Official Site
         data["website"] = await self.recover_website(page, company_name)
+        # Pre-flight: a dead / parked site gets none of the page visits below
+        site_url = "N/A"
+        if data["website"] != "N/A":
+            verdict = await self.preflight.check(data["website"])
+            if verdict["status"] == "live":
+                site_url = verdict["final_url"]
+            else:
+                data["site_status"] = f"{verdict['status']} ({verdict['reason']})"
+        cached = await self.enrich_cache.get(site_url, WATERFALL_FIELDS, revalidate=False, refresh=self.refresh_cache)
+        if cached:
+            print(f"  -> Waterfall from enrichment cache: {site_url}")
+            data.update({"founder": cached["founder"], "linkedin": cached["founder_linkedin"],
+                         "email_guess": cached["email_guess"], "socials": cached["socials"]})
+            return data
+        # Homepage over plain HTTP, fetched once while the dork runs; shared by team-page discovery and socials
+        home_task = asyncio.ensure_future(fetch(site_url, headers={"User-Agent": self.get_stealth_headers()["User-Agent"]})) if site_url != "N/A" else None
         
         # Stage 2: DNS/Dork Search for Founder
         dork = f'site:linkedin.com/in/ "CEO" OR "Founder" "{company_name}"'
-        await page.goto(f"https://www.google.com/search?q={dork.replace(' ', '+')}")
-        await self.sleep_random(3, 5)
-        
-        links = await page.query_selector_all('a')
-        for link in links:
-            href = await link.get_attribute('href')
-            if href and "linkedin.com/in/" in href:
-                if "/url?q=" in href:
-                    match = re.search(r'url\?q=([^&]*)', href)
-                    if match: href = match.group(1)
-                data["linkedin"] = href.split('&')[0]
-                # Try to get name
-                try:
-                    container = await page.evaluate_handle('el => el.closest(".g")', link)
-                    if container:
-                        h3 = await container.as_element().query_selector('h3')
-                        data["founder"] = await h3.inner_text() if h3 else "Found on LinkedIn"
-                except: pass
+        for result in await self.serp.search(dork, page=page, kind="founder"):
+            if "linkedin.com/in/" in result["url"]:
+                data["linkedin"] = result["url"].split('&')[0]
+                data["founder"] = result["title"] or "Found on LinkedIn"
                 break
         
+        home_html = ""
+        if home_task:
+            try:
+                home = await home_task
+                if home["status"] == 200:
+                    home_html, site_url = home["text"], home["url"]
+            except Exception as e:
+                print(f"  -> Homepage fetch failed: {e}")
+
         # Stage 4: Team Page Discovery (New - Suggested by User)
-        if data["founder"] == "N/A" and data["website"] != "N/A":
+        if data["founder"] == "N/A" and site_url != "N/A":
             try:
-                # Try common paths to find real names
-                for path in ["/about", "/about-us", "/our-team", "/management", "/leadership"]:
-                    try:
-                        target = data["website"].rstrip('/') + path
-                        await page.goto(target, wait_until="load", timeout=15000)
-                        text = await page.inner_text("body")
-                        # Simple semantic match for leadership names
-                        match = re.search(r"([A-Z][a-z]+ [A-Z][a-z]+) (?:is the )?(Founder|CEO|Owner|Director|Managing Director|CMO|CTO)", text)
-                        if match:
-                            data["founder"] = f"{match.group(1)} ({match.group(2)})"
-                            break
-                    except: continue
-            except: pass
+                data["founder"] = await self.find_team_page_founder(site_url, page_links(home_html, site_url))
+            except Exception as e:
+                print(f"  -> Team page discovery failed: {e}")
 
         # Stage 5: Twitter/X Dorking (New - Suggested by User)
         if data["founder"] == "N/A":
             try:
                 twitter_dork = f'site:twitter.com OR site:x.com "{company_name}" founder'
-                await page.goto(f"https://www.google.com/search?q={twitter_dork.replace(' ', '+')}", wait_until="load", timeout=15000)
-                await self.sleep_random(2, 4)
-                tw_match = await page.evaluate("""() => {
-                    const h3 = document.querySelector('h3');
-                    return h3 ? h3.innerText : null;
-                }""")
-                if tw_match: data["founder"] = f"{tw_match} (via Twitter)"
+                tw_results = await self.serp.search(twitter_dork, page=page, kind="founder")
+                if tw_results: data["founder"] = f"{tw_results[0]['title']} (via Twitter)"
             except: pass
 
         # Stage 6: Email Pattern Guessing (Final stage)
@@ -375,22 +887,55 @@ class LeadHunter:
                     else: data["email_guess"] = f"{first}@{domain}"
             except: pass
 
-        # Stage 7: Social Cross-ref
-        if data["website"] != "N/A":
+        # Stage 7: Social Cross-ref (the homepage we already have; the browser only if HTTP couldn't get it)
+        if home_html:
+            data["socials"] = socials_from_links(page_links(home_html, site_url))
+        elif site_url != "N/A":
             try:
-                await page.goto(data["website"], wait_until="networkidle", timeout=20000)
+                await page.goto(site_url, wait_until="networkidle", timeout=20000)
                 data["socials"] = await self.extract_socials(page)
             except: pass
-            
+
+        if site_url != "N/A":
+            await asyncio.to_thread(self.enrich_cache.put, site_url, {
+                "founder": data["founder"], "founder_linkedin": data["linkedin"],
+                "email_guess": data["email_guess"], "socials": data["socials"]})
         return data
 
+    async def find_team_page_founder(self, site_url, home_links):
+        """
+        Fetches every candidate team / about page concurrently over plain HTTP and
+        runs the leadership-name pattern on those that answer 200. Returns
+        "Name (Title)" from the first page in candidate order that has one, else "N/A".
+        """
+        urls = team_page_urls(site_url, home_links)
+        headers = {"User-Agent": self.get_stealth_headers()["User-Agent"]}
+
+        async def probe(url):
+            try:
+                r = await fetch(url, headers=headers, timeout=8)
+                return r["text"] if r["status"] == 200 else ""
+            except Exception:
+                return ""
+
+        pages = await asyncio.gather(*(probe(u) for u in urls))
+        print(f"  -> Team pages: {sum(1 for h in pages if h)}/{len(urls)} candidates answered")
+        for html in pages:
+            if not html:
+                continue
+            text = await self.run_cpu(html_to_text, html, 20000)
+            match = LEADERSHIP_PATTERN.search(text)
+            if match:
+                return f"{match.group(1)} ({match.group(2)})"
+        return "N/A"
+
     async def scrape_naukri_job(self, page, url):
         """Specific logic for Naukri job posts."""
         try:
             await page.goto(url, wait_until="load", timeout=35000)
             await self.sleep_random(3, 5)
             html = await page.content()
-            data = await self.universal_ai_extract(html, prompt_type="naukri")
+            data = await self.extract_portal_record(html, "naukri")
             if data and isinstance(data, dict):
                 # Enrich with waterfall
                 wf = await self.enrichment_waterfall(page, data.get('company_name', ''))
@@ -406,7 +951,7 @@ class LeadHunter:
             await page.goto(url, wait_until="networkidle", timeout=30000)
             await self.sleep_random(3, 5)
             html = await page.content()
-            data = await self.universal_ai_extract(html, prompt_type="99acres")
+            data = await self.extract_portal_record(html, "99acres")
             return data
         except Exception as e:
             print(f"99acres Scrape Error: {e}")
@@ -418,7 +963,7 @@ class LeadHunter:
             await page.goto(url, wait_until="networkidle", timeout=30000)
             await self.sleep_random(3, 5)
             html = await page.content()
-            data = await self.universal_ai_extract(html, prompt_type="shiksha")
+            data = await self.extract_portal_record(html, "shiksha")
             return data
         except Exception as e:
             print(f"Shiksha Scrape Error: {e}")
@@ -427,37 +972,20 @@ class LeadHunter:
     async def scrape_google_maps(self, page, update_callback=None, min_candidates=None):
         print(f"Searching Google Maps for: {self.keyword}")
         if update_callback: update_callback(f"Searching Google Maps for: {self.keyword}")
-        maps_url = f"https://www.google.com/maps/search/{self.keyword.replace(' ', '+')}?hl=en"
+        maps_path = f"/maps/search/{self.keyword.replace(' ', '+')}?hl=en"
         
-        try:
-            await page.goto(maps_url, wait_until="networkidle", timeout=60000)
-        except Exception as e:
-            msg = f"Initial navigation slow/failed: {e}"
+        # Consent screen (common on new IPs like Render) is handled inside google_goto
+        ok = await self.google_goto(page, maps_path, update_callback, wait_until="networkidle", timeout=60000)
+        if not ok and not self.egress_blocked(page):
+            msg = "Initial navigation slow/failed, retrying..."
             print(msg)
             if update_callback: update_callback(msg)
-            await page.goto(maps_url)
+            ok = await self.google_goto(page, maps_path, update_callback)
+        if not ok:
+            return []
         
         await self.sleep_random(5, 7)
 
-        # 2. HANDLE CONSENT SCREEN (Common on new IPs like Render)
-        try:
-            consent_selectors = [
-                'button[aria-label="Accept all"]',
-                'button[aria-label="Agree"]',
-                'button:has-text("Accept all")',
-                'button:has-text("I agree")',
-            ]
-            for selector in consent_selectors:
-                if await page.query_selector(selector):
-                    msg = f"Found consent screen, clicking {selector}..."
-                    print(msg)
-                    if update_callback: update_callback(msg)
-                    await page.click(selector)
-                    await self.sleep_random(2, 4)
-                    break
-        except:
-            pass
-
         # Check for Google Maps failures
         if await page.query_selector('text="Google Maps can\'t find"'):
             msg = f"No results found for {self.keyword}"
@@ -551,6 +1079,7 @@ class LeadHunter:
                 website = "N/A"
                 reviews = 0
                 is_closed = False
+                is_unclaimed = False
                 
                 # Locate the parent article to find the website button
                 article = await page.evaluate_handle('el => el.closest(\'div[role="article"]\')', item)
@@ -571,8 +1100,7 @@ class LeadHunter:
                         # Often "Own this business?" is not visible on the search results card directly without clicking.
                         # But sometimes "Claim this business" appears. We'll search for it in `txt`.
                         if "Own this business?" in txt or "Claim this business" in txt:
-                            # This needs to be passed out
-                            pass 
+                            is_unclaimed = True
                     except:
                         pass
 
@@ -583,7 +1111,8 @@ class LeadHunter:
                 
                 print(f"  + Scraped: {name} ({website}) | Revs: {reviews}")
                 if update_callback: update_callback(f"📍 Discovered: {name}")
-                results.append({"name": name, "website": website, "reviews": reviews, "is_closed": is_closed, "raw_maps_text": txt})
+                results.append({"name": name, "website": website, "reviews": reviews, "is_closed": is_closed,
+                                "is_unclaimed": is_unclaimed, "raw_maps_text": txt})
             except Exception as e:
                 print(f"Error extracting item: {e}")
         
@@ -597,23 +1126,163 @@ class LeadHunter:
                 if name:
                     name = name.strip()
                     if update_callback: update_callback(f"📍 Discovered: {name}")
-                    results.append({"name": name.strip(), "website": "N/A", "reviews": 0, "is_closed": False, "raw_maps_text": ""})
+                    results.append({"name": name.strip(), "website": "N/A", "reviews": 0, "is_closed": False,
+                                    "is_unclaimed": False, "raw_maps_text": ""})
 
         return results
 
+    def prescore_candidate(self, basic_info, keyword=""):
+        """
+        Tier-0 pre-score (0-100) from Maps card data only — no browser, no AI.
+        Closed businesses score 0 so they never reach a paid tier.
+        """
+        if basic_info.get("is_closed"):
+            return 0
+
+        raw_txt = basic_info.get("raw_maps_text", "") or ""
+        score = 10 if raw_txt else 0
+
+        website = str(basic_info.get("website", "N/A"))
+        if website.lower() not in ["n/a", "unknown", "none", ""] and not basic_info.get("site_status"):
+            score += 30
+        if PHONE_PATTERN.search(raw_txt):
+            score += 15
+
+        reviews = basic_info.get("reviews", 0) or 0
+        if reviews >= 200: score += 25
+        elif reviews >= 50: score += 20
+        elif reviews >= 10: score += 15
+        elif reviews >= 1: score += 5
+
+        # Keyword fit: share of meaningful keyword terms found on the card
+        terms = [t for t in re.findall(r"[a-z0-9]+", (keyword or "").lower()) if t not in KEYWORD_STOPWORDS]
+        if terms:
+            haystack = f"{basic_info.get('name', '')} {raw_txt}".lower()
+            hits = sum(1 for t in terms if t in haystack or t.rstrip('s') in haystack)
+            score += round(20 * hits / len(terms))
+
+        return min(score, 100)
+
+    def candidate_priority(self, basic_info, pre_score):
+        """
+        Queue priority for run_mission: pre-score plus the opportunity signals
+        we can pitch on (unclaimed listing, reachable business with few reviews).
+        """
+        if basic_info.get("is_closed"):
+            return -1
+        priority = pre_score
+        if basic_info.get("is_unclaimed"):
+            priority += 15
+        if 0 < (basic_info.get("reviews", 0) or 0) < 10 and pre_score >= self.ladder["browser"]:
+            priority += 10
+        return priority
+
+    def apply_preflight(self, company, verdict):
+        """Live sites get their canonical `live_url` for the browser; dead / parked ones a `site_status`."""
+        if not verdict:
+            return
+        if verdict["status"] == "live":
+            company["live_url"] = verdict["final_url"]
+        else:
+            company["site_status"] = f"{verdict['status']} ({verdict['reason']})"
+
+    def ladder_tiers(self, pre_score):
+        """Which enrichment tiers a candidate with this pre-score has unlocked."""
+        return {tier: pre_score >= threshold for tier, threshold in self.ladder.items()}
+
+    def heuristic_score(self, pre_score):
+        """Stand-in for score_lead_ai when a lead stays below the LLM tier."""
+        decision = "Not Qualified" if pre_score < self.ladder["browser"] else "Neutral"
+        return pre_score, decision, "Unknown", f"Tier-0 pre-score {pre_score} (below AI threshold {self.ladder['llm']})", "N/A"
+
+    def apply_opportunity_signals(self, company, tech_stack, load_time, keyword):
+        """SIGNAL & OPPORTUNITY LOGIC: maps scrape results to gmb/ad/web/speed pitches."""
+        if company.get("is_unclaimed", False):
+            company["gmb_status"] = "🚩 Unclaimed"
+            company["gmb_opp"]    = "Pitch: Claim and Optimize GMB Profile."
+        elif company.get("reviews", 0) < 10:
+            company["gmb_status"] = f"⚠️ Low Reviews ({company.get('reviews')})"
+            company["gmb_opp"]    = "Pitch: Automated Review Management."
+        else:
+            company["gmb_status"] = "✅ Healthy"
+            company["gmb_opp"]    = "N/A"
+
+        if "Meta Pixel" not in tech_stack:
+            company["ad_status"] = "📉 Not running Meta Ads"
+            company["ad_opp"]    = "Pitch: Lead Generation Automation."
+        else:
+            company["ad_status"] = "🚀 Active"
+            company["ad_opp"]    = "N/A"
+
+        if company.get("website", "N/A") == "N/A":
+            company["web_status"]   = "🚫 No Site"
+            company["web_opp"]      = "Pitch: High-Converting Landing Page Build."
+            company["speed_status"] = "N/A (No Site)"
+            company["speed_opp"]    = "N/A"
+        elif company.get("site_status"):
+            company["web_status"]   = f"💀 Site Down: {company['site_status']}"
+            company["web_opp"]      = "Pitch: Website Rebuild — their listed site doesn't work."
+            company["speed_status"] = "N/A (Site Down)"
+            company["speed_opp"]    = "N/A"
+        elif "WordPress" in tech_stack or "Basic" in tech_stack:
+            company["web_status"] = "🕸️ Old WP / Basic"
+            company["web_opp"]    = "Pitch: Performance Marketing / CRO."
+        else:
+            company["web_status"] = "💎 Modern"
+            company["web_opp"]    = "N/A"
+
+        if "speed_status" not in company:
+            if load_time > 5:
+                company["speed_status"] = f"🐢 Slow ({load_time:.1f}s)"
+                company["speed_opp"]    = "Pitch: Website Optimization / Speed."
+            else:
+                company["speed_status"] = f"⚡ Fast ({load_time:.1f}s)"
+                company["speed_opp"]    = "N/A"
+
+        company["xray_status"] = "❓ Not Found"
+        company["xray_opp"]    = "Pitch: Direct Outreach / LinkedIn DM."
+
+        if company.get("is_closed"):
+            company["gmb_status"] = "⛔ Permanently Closed"
+            company["gmb_opp"]    = "Pitch: Local SEO Fix."
+        if "emergency" in keyword.lower():
+            company["ad_opp"]  = "Pitch: PPC / Google Ads (Urgent need)."
+        if "new" in keyword.lower():
+            company["gmb_opp"] = "Pitch: Launch Marketing / Google Business Setup."
+        return company
+
     def detect_tech_stack(self, html):
-        stack = []
-        if "wp-content" in html: stack.append("WordPress")
-        if "shopify" in html: stack.append("Shopify")
-        if "fbevents.js" in html or "facebook-domain-verification" in html: stack.append("Meta Pixel")
-        if "googletagmanager" in html: stack.append("GTM")
-        if "wix.com" in html: stack.append("Wix")
-        if "squarespace" in html: stack.append("Squarespace")
-        return ", ".join(stack) if stack else "Unknown"
-
-    async def scrape_website(self, page, url):
+        return scan_page(html)["tech_stack"]
+
+    async def probe_page(self, page):
+        """Runs PAGE_PROBE_JS in the page; only the compact result is sent back over CDP."""
+        probe = await page.evaluate(PAGE_PROBE_JS, {
+            "signatures": [[g, label, [l.lower() for l in lits]] for g, label, lits in SIGNATURES if g in ("tech", "chat")],
+            "emailRegex": EMAIL_REGEX,
+            "phoneRegex": PHONE_PATTERN.pattern,
+            "socialPatterns": SOCIAL_LINK_PATTERNS,
+            "textChars": PAGE_PROBE_TEXT_CHARS,
+        })
+        self.probe_stats["pages"] += 1
+        self.probe_stats["html_chars"] += probe.get("htmlChars", 0)
+        self.probe_stats["returned_chars"] += len(json.dumps(probe, ensure_ascii=False))
+        return probe
+
+    async def scrape_website(self, page, url, budget=None):
+        """
+        Returns (content, emails, socials, phone, tech_stack, load_time, chat_detected, address).
+        Structured data the site publishes about itself (JSON-LD, microdata,
+        OpenGraph) wins over regex guesses and fills socials the links missed.
+        `budget` (seconds) shrinks the navigation timeouts so the scrape returns
+        what it has before the caller's stage deadline; no contact jump without time for it.
+        """
         if not url or url == "N/A":
-            return "", [], {}, "N/A", "Unknown", 0
+            return "", [], {}, "N/A", "Unknown", 0, "None/Standard", "N/A"
+
+        cached = await self.enrich_cache.get(url, SCRAPE_FIELDS, refresh=self.refresh_cache)
+        if cached:
+            print(f"Website from enrichment cache: {url}")
+            return tuple(cached[f] for f in SCRAPE_FIELDS)
 
         print(f"Scraping website: {url}")
         start_time = time.time()
@@ -623,102 +1292,88 @@ class LeadHunter:
         phone = "N/A"
         tech_stack = "Unknown"
         load_time = 0
+        address = "N/A"
+        validators = None
+        budget = budget or 60
+        nav_ms = int(min(30, budget * 0.5) * 1000)
 
         try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+            try:
+                response = await page.goto(url, wait_until="networkidle", timeout=nav_ms)
+                if response:
+                    validators = {"etag": response.headers.get("etag"), "last_modified": response.headers.get("last-modified")}
+            except Exception as nav_err:
+                # networkidle never came (chatty trackers): probe whatever has rendered
+                if page.url.startswith(("about:", "chrome-error:")):
+                    raise
+                print(f"  -> Still loading after {nav_ms / 1000:.0f}s, probing what rendered ({str(nav_err)[:40]})")
             load_time = time.time() - start_time
-            await self.sleep_random(2, 4)
+            await self.sleep_random(min(2, budget * 0.05), min(4, budget * 0.1))
             
-            # Extract HTML for Tech Stack and Emails
-            html = await page.content()
-            tech_stack = self.detect_tech_stack(html)
-            
-            # Extract text for scoring
-            content = await page.evaluate("() => document.body.innerText")
-            
-            # Extract emails
-            emails = list(set(re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', html)))
-            emails = [e for e in emails if not e.endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg'))]
-            
-            # Phone Extraction (Simple regex)
+            # One in-page probe: signals, contacts and a text excerpt (the HTML stays in the browser)
+            probe = await self.probe_page(page)
+            tech_stack = ", ".join(probe["tech"]) if probe["tech"] else "Unknown"
+            chat_detected = ", ".join(probe["chat"]) if probe["chat"] else "None/Standard"
+            emails = probe["emails"]
+            content = probe["text"]
+
+            # Phone Extraction (Simple regex, run in-page over the full body text)
             # Looks for common formats: (123) 456-7890, 123-456-7890, +1 123 456 7890
-            phone_match = re.search(r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', content)
-            if phone_match:
-                phone = phone_match.group(0).strip()
-
-            # Chat Detection
-            html_lower = html.lower()
-            widgets = []
-            if "drift.com" in html_lower or "driftt" in html_lower:
-                widgets.append("Drift")
-            if "teams.live.com" in html_lower or "teams.microsoft.com" in html_lower:
-                widgets.append("Microsoft Teams")
-            if "intercomcdn" in html_lower or "widget.intercom.io" in html_lower:
-                widgets.append("Intercom")
-            if "gwebchat" in html_lower or "google-chat" in html_lower:
-                widgets.append("Google Chat")
-            
-            chat_detected = ", ".join(widgets) if widgets else "None/Standard"
-
-            # Socials - Round 1 (Homepage)
-            socials = await self.extract_socials(page)
+            phone = probe["phone"] or "N/A"
+
+            # Structured business data (schema.org / microdata / OpenGraph)
+            profile = business_profile_from_parts(
+                json_ld_nodes(probe["jsonld"]), probe["micro"], probe["meta"], probe["tel"], probe["mailto"])
+            if profile["phone"] != "N/A":
+                phone = profile["phone"]
+            address = profile["address"]
+            emails = sorted(set(emails) | set(profile["emails"]))
+
+            # Socials - Round 1 (Homepage links, then declared sameAs profiles)
+            socials = {k: probe["socials"].get(k, "N/A") for k in SOCIAL_LINK_PATTERNS}
+            for k, v in profile["socials"].items():
+                if socials.get(k, "N/A") == "N/A" and v != "N/A":
+                    socials[k] = v
             
             # Contact Page Jump for deeper social extraction
             # If we missed major socials, try to find a 'Contact' or 'About' page
-            if socials["linkedin"] == "N/A" or socials["instagram"] == "N/A":
+            left = budget - (time.time() - start_time)
+            if (socials["linkedin"] == "N/A" or socials["instagram"] == "N/A") and left > 5:
                 try:
-                    # Look for Contact/About link
-                    # We match flexible text or href containing 'contact'/'about'
-                    contact_link = await page.query_selector('a[href*="contact"], a[href*="Contact"], a[href*="about"], a[href*="About"]')
-                    if not contact_link:
-                         # Fallback to text content
-                         contact_link = await page.query_selector('a:has-text("Contact"), a:has-text("About")')
-
-                    if contact_link:
-                        href = await contact_link.get_attribute('href')
-                        if href:
-                            print(f"  -> Jumping to potential Contact/About page: {href[:30]}...")
-                            # Construct absolute URL if relative
-                            if not href.startswith('http'):
-                                from urllib.parse import urljoin
-                                href = urljoin(page.url, href)
-                            
-                            await page.goto(href, wait_until="networkidle", timeout=15000)
-                            await self.sleep_random(1, 3)
-                            
-                            # Socials - Round 2 (Merge)
-                            more_socials = await self.extract_socials(page)
-                            for k, v in more_socials.items():
-                                if socials[k] == "N/A" and v != "N/A":
-                                    socials[k] = v
+                    # Contact/About link (href match first, then link text) found by the probe
+                    if probe["contactLinks"]:
+                        href = probe["contactLinks"][0]
+                        print(f"  -> Jumping to potential Contact/About page: {href[:30]}...")
+                        
+                        await page.goto(href, wait_until="networkidle", timeout=int(min(15, left * 0.6) * 1000))
+                        await self.sleep_random(min(1, left * 0.05), min(3, left * 0.1))
+                        
+                        # Socials - Round 2 (Merge)
+                        more_socials = await self.extract_socials(page)
+                        for k, v in more_socials.items():
+                            if socials[k] == "N/A" and v != "N/A":
+                                socials[k] = v
                 except Exception as ex:
                     print(f"  -> Contact jump info: {ex}")
             
-            return content[:5000], emails, socials, phone, tech_stack, load_time, chat_detected # First 5000 chars for LLM
+            result = (content[:5000], emails, socials, phone, tech_stack, load_time, chat_detected, address)  # First 5000 chars for LLM
+            if content or emails:
+                await asyncio.to_thread(self.enrich_cache.put, url, dict(zip(SCRAPE_FIELDS, result)), validators)
+            return result
         except Exception as e:
             print(f"Error scraping {url}: {e}")
             load_time = time.time() - start_time if load_time == 0 else load_time
-            return "", [], {}, "N/A", "Unknown", load_time, "None/Standard"
+            return "", [], {}, "N/A", "Unknown", load_time, "None/Standard", "N/A"
 
     async def recover_website(self, page, company_name):
         """Searches Google for the company's official website if Maps entry is empty."""
         try:
             print(f"  🔍 Recovery Sweep: Searching for {company_name} website...")
             search_query = f'"{company_name}" official website'
-            await page.goto(f"https://www.google.com/search?q={search_query.replace(' ', '+')}")
-            await self.sleep_random(3, 5)
             
             # Look for non-social, non-directory links
-            links = await page.query_selector_all('a')
-            for link in links:
-                href = await link.get_attribute('href')
-                if not href: continue
-                # Basic cleaning
-                if "/url?q=" in href:
-                    match = re.search(r'url\?q=([^&]*)', href)
-                    if match: href = match.group(1)
-                
-                clean_url = href.split('&')[0].split('?')[0].lower()
+            for result in await self.serp.search(search_query, page=page, kind="website"):
+                clean_url = result["url"].split('&')[0].split('?')[0].lower()
                 
                 # Exclude social and directories
                 excl = ["facebook.com", "instagram.com", "linkedin.com", "yelp.com", "yellowpages.com", "mapquest.com", "google.com", "twitter.com"]
@@ -734,44 +1389,145 @@ class LeadHunter:
         try:
             print(f"  🔍 Social Hunting: Searching for {company_name} {platform}...")
             search_query = f'"{company_name}" {platform}'
-            await page.goto(f"https://www.google.com/search?q={search_query.replace(' ', '+')}")
-            await self.sleep_random(2, 4)
             
-            links = await page.query_selector_all('a')
-            for link in links:
-                href = await link.get_attribute('href')
-                if href and f"{platform}.com" in href.lower():
-                    # Clean Google redirect
-                    if "/url?q=" in href:
-                        match = re.search(r'url\?q=([^&]*)', href)
-                        if match: href = match.group(1)
-                    clean_url = href.split('&')[0].split('?')[0]
+            for result in await self.serp.search(search_query, page=page, kind="social"):
+                if f"{platform}.com" in result["url"].lower():
+                    clean_url = result["url"].split('&')[0].split('?')[0]
                     print(f"  ✨ Recovered {platform.capitalize()}: {clean_url}")
                     return clean_url
         except:
             pass
         return "N/A"
 
+    async def recover_socials(self, page, company_name, platforms=("linkedin", "instagram", "facebook"), fallback=True):
+        """
+        One OR-query for all missing platforms, every result link classified by
+        platform in one pass; per-platform queries only for what it didn't find
+        (fallback=False leaves those out of the result for the caller).
+        Returns {platform: url or "N/A"}.
+        """
+        found = {}
+        sites = " OR ".join(f"site:{SOCIAL_SEARCH_SITES[p]}" for p in platforms)
+        query = f'"{company_name}" ({sites})'
+        print(f"  🔍 Social Hunting: {query}")
+        self.social_stats["leads"] += 1
+        try:
+            for result in await self.serp.search(query, page=page, kind="social"):
+                platform = classify_social_url(result["url"])
+                if platform in platforms and platform not in found:
+                    found[platform] = result["url"].split('&')[0].split('?')[0]
+                    print(f"  ✨ Recovered {platform.capitalize()}: {found[platform]}")
+        except Exception as e:
+            print(f"  ⚠️ Combined social search failed: {e}")
+        self.social_stats["combined"] += len(found)
+
+        if fallback:
+            for platform in platforms:
+                if platform not in found:
+                    found[platform] = await self.recover_social_fallback(page, company_name, platform)
+        return found
+
+    async def recover_social_fallback(self, page, company_name, platform):
+        """Per-platform search for one profile the combined query missed (+ the company-page search for LinkedIn)."""
+        self.social_stats["fallbacks"] += 1
+        url = await self.recover_social(page, company_name, platform)
+        if url == "N/A" and platform == "linkedin":
+            self.social_stats["fallbacks"] += 1
+            url = await self.search_linkedin(page, company_name)
+        return url
+
+    def founder_batches(self, names):
+        """Groups names into OR-dorks that stay under Google's query word limit."""
+        base_words = 7   # site:linkedin.com/in ("CEO" OR "Founder") ( ... )
+        batches, current, words = [], [], base_words
+        for name in names:
+            n = len(name.split()) + 1   # + the OR
+            if current and (len(current) >= FOUNDER_BATCH_SIZE or words + n > FOUNDER_QUERY_WORDS):
+                batches.append(current)
+                current, words = [], base_words
+            current.append(name)
+            words += n
+        if current:
+            batches.append(current)
+        return batches
+
+    async def resolve_founders(self, page, names, update_callback=None):
+        """
+        Founder X-ray for several companies at once: one OR-dork per batch, each
+        result mapped back to its company by fuzzy-matching title + snippet.
+        Companies the batch didn't resolve get the classic single-company dork.
+        Results land in self.founder_cache (profile dict, or False).
+        """
+        todo = [n for n in dict.fromkeys(names) if n and n not in self.founder_cache]
+        for batch in self.founder_batches(todo):
+            self.founder_stats["companies"] += len(batch)
+            unresolved = list(batch)
+            if len(batch) > 1:
+                names_or = " OR ".join(f'"{n.replace(chr(34), "")}"' for n in batch)
+                dork = f'site:linkedin.com/in ("CEO" OR "Founder") ({names_or})'
+                if update_callback: update_callback(f"   🔍 Batched founder X-ray: {len(batch)} companies in one query")
+                self.founder_stats["batch_queries"] += 1
+                for result in await self.serp.search(dork, page=page, kind="founder"):
+                    if "linkedin.com/in/" not in result["url"]:
+                        continue
+                    text = f"{result['title']} {result['snippet']}"
+                    scored = sorted(((company_match_score(n, text), n) for n in unresolved), reverse=True)
+                    if not scored or scored[0][0] < FOUNDER_MATCH_MIN:
+                        continue
+                    if len(scored) > 1 and scored[1][0] >= scored[0][0]:
+                        continue   # names two companies equally well: ambiguous
+                    company = scored[0][1]
+                    self.founder_cache[company] = {"name": result["title"] or "LinkedIn User",
+                                                   "url": result["url"].split('&')[0].split('?')[0],
+                                                   "snippet": result["snippet"] or "No snippet available"}
+                    unresolved.remove(company)
+                    self.founder_stats["batch_hits"] += 1
+                    if not unresolved:
+                        break
+            for company in unresolved:
+                self.founder_stats["single_queries"] += 1
+                xray_dork = f'site:linkedin.com/in "CEO" OR "Founder" "{company}"'
+                if update_callback: update_callback(f"   🔍 X-Raying Founder for: {company}")
+                profiles = await self.scrape_linkedin_profiles(page, xray_dork, update_callback=update_callback)
+                self.founder_cache[company] = profiles[0] if profiles else False
+        return {n: self.founder_cache.get(n, False) for n in names}
+
     async def search_linkedin(self, page, company_name):
         print(f"Searching LinkedIn for: {company_name}")
         search_query = f"{company_name} LinkedIn company"
-        await page.goto(f"https://www.google.com/search?q={search_query.replace(' ', '+')}")
-        await self.sleep_random(2, 4)
         
         # Look for linkedin.com/company links
-        links = await page.query_selector_all('a')
-        for link in links:
-            href = await link.get_attribute('href')
-            if href and "linkedin.com/company" in href:
-                # Clean Google redirect if necessary
-                if "/url?q=" in href:
-                    match = re.search(r'url\?q=([^&]*)', href)
-                    if match:
-                        return match.group(1)
-                return href.split('&')[0]
+        for result in await self.serp.search(search_query, page=page, kind="linkedin_company"):
+            if "linkedin.com/company" in result["url"]:
+                return result["url"].split('&')[0]
         return "N/A"
 
+    def local_first_pass(self, kind, text):
+        """
+        Asks the distilled local classifier (see lead_classifier.py) first.
+        Returns (decision, confidence, score) when the gate is on and the model
+        is confident, otherwise None so the caller escalates to Gemini.
+        """
+        if not self.local_gate:
+            return None
+        if kind not in self.local_scorers:
+            self.local_scorers[kind] = LeadClassifier.load(kind=kind)
+        scorer = self.local_scorers[kind]
+        if not scorer:
+            return None
+        decision, confidence, score = scorer.predict(text)
+        if not scorer.is_confident(confidence):
+            return None
+        self.ai_stats["local"] += 1
+        return decision, confidence, score
+
     async def score_lead_ai(self, lead_name, website_content):
+        local = self.local_first_pass("score", f"{lead_name} {website_content[:3000]}")
+        if local:
+            decision, confidence, score = local
+            self.archive_intelligence(f"LOCAL_SCORE_{lead_name}", json.dumps({"score": score, "decision": decision, "confidence": round(confidence, 3)}))
+            return score, decision, "Unknown", f"Local model ({confidence:.0%} confident)", "N/A"
+
         if not self.model:
             # Fallback: Mark as pending AI review
             return "Pending", "Pending", "Pending", "Pending AI Review", "N/A"
@@ -796,22 +1552,20 @@ class LeadHunter:
     
         # ARCHIVE: Prompt
         self.archive_intelligence(f"PROMPT_SCORE_{lead_name}", prompt)
+        self.ai_stats["gemini"] += 1
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await self._ai_call(self.model.generate_content, prompt)
             # Handle possible markdown wrapping from LLM
             clean_text = response.text.replace("```json", "").replace("```", "").strip()
             
             # ARCHIVE: Response
             self.archive_intelligence(f"RESPONSE_SCORE_{lead_name}", clean_text)
 
-            # If there's still extra text around the JSON, try to find the first { and last }
-            start = clean_text.find('{')
-            end = clean_text.rfind('}') + 1
-            if start != -1 and end != 0:
-                clean_text = clean_text[start:end]
-                
-            data = json.loads(clean_text)
+            # If there's still extra text around the JSON, take the first { ... last }
+            data = await self.run_cpu(extract_json_block, clean_text)
+            if data is None:
+                raise ValueError("No JSON object in scoring response")
             return data.get("score", 0), data.get("decision", "Neutral"), data.get("inferred_age", "Unknown"), data.get("reasoning", "Analyzed by AI"), data.get("address", "N/A")
         except Exception as e:
             self.archive_intelligence(f"ERROR_SCORE_{lead_name}", str(e))
@@ -820,6 +1574,203 @@ class LeadHunter:
 
 
 
+    async def rescore_snapshot(self, snap):
+        """
+        Recomputes RESCORE_FIELDS for one stored lead from its snapshot texts, exactly
+        as run_mission would (pre-score -> ladder -> score_lead_ai or heuristic, then
+        the opportunity rules). Returns {field: new value} for the fields that changed.
+        """
+        lead, keyword = snap["lead"], snap["keyword"]
+        maps_text, page_text = await asyncio.to_thread(
+            lambda: (self.snapshots.get_text(snap["maps_hash"]), self.snapshots.get_text(snap["page_hash"])))
+        fresh = {k: v for k, v in lead.items() if k not in RESCORE_FIELDS}
+        fresh["raw_maps_text"] = maps_text
+
+        pre_score = self.prescore_candidate(fresh, keyword)
+        self.apply_opportunity_signals(fresh, lead.get("tech_stack", "Unknown"), lead.get("load_time", 0) or 0, keyword)
+        if lead.get("founder_match", "Not Found") != "Not Found":
+            fresh["xray_status"] = "👤 Found Founder"
+
+        if self.ladder_tiers(pre_score)["llm"]:
+            content = await self.run_cpu(html_to_text, f"MAPS INFO: {maps_text}\n\nWEBSITE INFO:\n{page_text}", 5000)
+            score, decision, age, summary, address = await self.score_lead_ai(snap["name"], content)
+            if score == "Pending" or summary == "AI parsing failed, using default score":
+                # No verdict this time (no Gemini key / failed call): keep the stored one
+                score, decision, age, summary = (lead.get(f) for f in ("score", "decision", "age", "summary"))
+                address = lead.get("address", "N/A")
+        else:
+            score, decision, age, summary, address = self.heuristic_score(pre_score)
+        site_address = lead.get("site_address", "N/A")
+        fresh.update({"score": score, "decision": decision, "age": age, "summary": summary,
+                      "address": site_address if site_address != "N/A" else address})
+        return {f: fresh.get(f) for f in RESCORE_FIELDS if fresh.get(f) != lead.get(f)}
+
+    async def rescore_snapshots(self, keyword=None, update_callback=None, dry_run=False, push_sheets=False,
+                                concurrency=RESCORE_CONCURRENCY):
+        """
+        Offline re-scoring: current prompt, local scorer, ladder and opportunity rules
+        over every snapshot (optionally one keyword), no browsers. Only changed fields
+        are written back to the snapshot index (and, with push_sheets, those leads'
+        Sheets rows). Returns [(name, keyword, {field: value})].
+        """
+        snaps = await asyncio.to_thread(self.snapshots.leads, keyword)
+        if update_callback: update_callback(f"♻️ Re-scoring {len(snaps)} snapshots ({concurrency} at a time)...")
+        start = time.time()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(snap):
+            async with sem:
+                try:
+                    return snap, await self.rescore_snapshot(snap)
+                except Exception as e:
+                    print(f"Re-score error for {snap['name']}: {e}")
+                    return snap, {}
+
+        results = await asyncio.gather(*(one(s) for s in snaps))
+        changes = [(snap["name"], snap["keyword"], diff) for snap, diff in results if diff]
+        field_counts = {}
+        for _, _, diff in changes:
+            for f in diff:
+                field_counts[f] = field_counts.get(f, 0) + 1
+
+        if changes and not dry_run:
+            await asyncio.to_thread(self.snapshots.update_fields, changes)
+            if push_sheets:
+                by_key = {(s["name"], s["keyword"]): s["lead"] for s in snaps}
+                for name, kw, diff in changes:
+                    data = {**by_key[(name, kw)], **diff}
+                    await asyncio.to_thread(self.gsheets.update_lead, name, kw, data, "google")
+
+        if update_callback:
+            update_callback(f"♻️ Re-scored {len(snaps)} leads in {time.time() - start:.1f}s: {len(changes)} changed"
+                            + (" (dry run, nothing written)" if dry_run else ""))
+            if field_counts: update_callback("   " + ", ".join(f"{f} {n}" for f, n in sorted(field_counts.items(), key=lambda x: -x[1])))
+            if self.local_gate: update_callback(
+                f"🧠 Local scorer: {self.ai_stats['local']} decided locally, {self.ai_stats['gemini']} escalated to Gemini")
+        return changes
+
+    async def backfill_http(self, item):
+        """
+        HTTP-first contact scrape for one backfill lead: website recovery through the
+        browserless SERP providers, pre-flight, enrichment cache, then one plain GET.
+        Returns {"site", "emails", "phone", "socials", "chat"}, {} when there is
+        nothing to scrape, or None when the page needs a real browser.
+        """
+        site = item["website"] if item["website"] not in ["N/A", "", None] else await self.recover_website(None, item["name"])
+        if site == "N/A":
+            return {}
+        verdict = await self.preflight.check(site)
+        if verdict["status"] != "live":
+            return {}
+        site = item["site"] = verdict["final_url"] or site
+        cached = await self.enrich_cache.get(site, SCRAPE_FIELDS, refresh=self.refresh_cache)
+        if cached:
+            return {"site": site, "emails": cached["emails"], "phone": cached["phone"],
+                    "socials": cached["socials"], "chat": cached["chat"]}
+        try:
+            r = await fetch(site, headers={"User-Agent": self.get_stealth_headers()["User-Agent"]})
+        except Exception:
+            return None
+        if r["status"] != 200:
+            return None
+        html = r["text"]
+        scan, profile = scan_page(html), extract_business_profile(html)
+        text = await self.run_cpu(html_to_text, html, 20000)
+        socials = socials_from_links(page_links(html, r["url"]))
+        for k, v in profile["socials"].items():
+            if socials.get(k, "N/A") == "N/A" and v != "N/A":
+                socials[k] = v
+        found = {"site": site, "emails": sorted(set(scan["emails"]) | set(profile["emails"])),
+                 "phone": profile["phone"] if profile["phone"] != "N/A" else (first_phone(text) or "N/A"),
+                 "socials": socials, "chat": scan["chat"]}
+        if not found["emails"] and found["phone"] == "N/A" and len(text) < 500:
+            return None   # next to no server-rendered text: a JS site, the browser will see more
+        return found
+
+    async def backfill_browser(self, page, item, budget):
+        site = item.get("site") or item["website"]
+        _, emails, socials, phone, _, _, chat, _ = await self.scrape_website(page, site, budget=budget)
+        return {"site": site, "emails": emails, "phone": phone, "socials": socials, "chat": chat}
+
+    async def run_backfill_sweep(self, max_items=BACKFILL_BATCH, update_callback=None):
+        """
+        Fills empty backup-CSV fields for the most valuable queued leads: every lead
+        over plain HTTP at once, one shared browser (a few sibling pages at a time)
+        only for pages HTTP couldn't read, then one CSV write per file. Returns how
+        many leads got at least one field.
+        """
+        items = await asyncio.to_thread(self.backfill.take, max_items)
+        if not items:
+            if update_callback: update_callback("🗂️ Backfill queue is empty.")
+            return 0
+        if update_callback: update_callback(f"🗂️ Backfill sweep: {len(items)} leads (of {self.backfill.pending()} queued)")
+        start = time.time()
+
+        async def http_one(item):
+            try:
+                return await self.backfill_http(item)
+            except Exception as e:
+                print(f"Backfill HTTP error for {item['name']}: {e}")
+                return None
+
+        found = dict(zip([i["name"] for i in items], await asyncio.gather(*(http_one(i) for i in items))))
+        browser_items = [i for i in items if found[i["name"]] is None]
+        if update_callback: update_callback(
+            f"   🌐 {len(items) - len(browser_items)} answered over HTTP, {len(browser_items)} need the browser")
+
+        if browser_items:
+            try:
+                async with async_playwright() as p:
+                    browser, page = await self.get_browser_and_page(p)
+                    try:
+                        for n in range(0, len(browser_items), 3):
+                            deadline = LeadDeadline()
+                            budget = deadline.budget("fill_in") - 1
+                            chunk = browser_items[n:n + 3]
+                            results = await self.gather_lookups(page, {
+                                f"fill_in:{i['name']}": (lambda pg, i=i: self.backfill_browser(pg, i, budget), None)
+                                for i in chunk}, deadline)
+                            for key, result in results.items():
+                                found[key.split(":", 1)[1]] = result
+                    finally:
+                        await browser.close()
+            except Exception as e:
+                print(f"Backfill browser error: {e}")
+
+        # Column values, same validation as a mission's deep enrichment
+        updates = {}
+        for item in items:
+            got = found.get(item["name"]) or {}
+            if not got:
+                continue
+            values = {}
+            email_str = ", ".join(got["emails"]) if got["emails"] else "N/A"
+            if got["emails"] or got["phone"] != "N/A":
+                ws = await check_google_workspace_async(email_str) if got["emails"] else None
+                _, _, phone, mobile, chat = validate_and_parse_contact_fields(
+                    got["phone"], got["site"], "" if email_str == "N/A" else email_str, item["region"] or "US", is_workspace=ws)
+                values.update({"Emails": email_str, "Phone": phone, "Mobile": mobile, "Chat Option": chat})
+            if got["chat"] not in ("", "None/Standard") and values.get("Chat Option", "None/Standard") == "None/Standard":
+                values["Chat Option"] = got["chat"]
+            for platform, col in [("linkedin", "LinkedIn"), ("instagram", "Instagram"), ("facebook", "Facebook")]:
+                values[col] = got["socials"].get(platform, "N/A")
+            updates.setdefault(item["csv_path"], {})[item["name"]] = {k: v for k, v in values.items() if k in item["missing"]}
+
+        filled = {}
+        for path, batch in updates.items():
+            try:
+                filled.update(await self.run_cpu(lead_backup.fill_empty_fields_many, path, batch, offload=True))
+            except Exception as e:
+                print(f"Backfill write error for {path}: {e}")
+
+        done = [n for n, count in filled.items() if count]
+        dropped = await asyncio.to_thread(self.backfill.retry, [i["name"] for i in items if i["name"] not in done])
+        await asyncio.to_thread(self.backfill.done, done)
+        if update_callback: update_callback(
+            f"✅ Backfill sweep: {len(done)}/{len(items)} leads filled ({sum(filled.values())} fields) in {time.time() - start:.1f}s"
+            + (f", {dropped} dropped after {BACKFILL_MAX_ATTEMPTS} empty attempts" if dropped else ""))
+        return len(done)
+
     async def get_browser_and_page(self, p):
         # Tell Python to look in the persistent Render folder
         render_browser_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "/opt/render/project/playwright")
@@ -848,21 +1799,44 @@ class LeadHunter:
         if executable_path:
             launch_kwargs["executable_path"] = executable_path
         
+        # Egress: healthiest proxy (or direct) whose CAPTCHA breaker is closed
+        egress = self.proxies.acquire()
+        proxy = egress.playwright_proxy()
+        if proxy:
+            launch_kwargs["proxy"] = proxy
+        
         try:
             browser = await p.chromium.launch(**launch_kwargs)
         except Exception as e:
             # Use repr to avoid encoding issues with the error message
             print(f"Launch Error with custom path: {repr(e)}")
-            browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
+            fallback_kwargs = {"proxy": proxy} if proxy else {}
+            browser = await p.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"], **fallback_kwargs)
         
-        headers = self.get_stealth_headers()
-        context = await browser.new_context(
-            user_agent=headers["User-Agent"],
-            extra_http_headers=headers,
-            viewport={'width': random.randint(1280, 1440), 'height': random.randint(720, 900)}
-        )
+        headers = {"User-Agent": self.get_stealth_headers()["User-Agent"]}
+        context_kwargs = {
+            "user_agent": headers["User-Agent"],
+            "extra_http_headers": headers,
+            "viewport": {'width': random.randint(1280, 1440), 'height': random.randint(720, 900)},
+        }
+        # Re-apply the saved Google consent cookies so Google pages skip the consent wall
+        self.consent_stats["contexts"] += 1
+        context = None
+        if os.path.exists(CONSENT_STATE_PATH):
+            try:
+                context = await browser.new_context(storage_state=CONSENT_STATE_PATH, **context_kwargs)
+                self.consent_stats["reused"] += 1
+            except Exception as e:
+                print(f"Consent state ignored ({repr(e)[:80]})")
+        if context is None:
+            context = await browser.new_context(**context_kwargs)
         page = await context.new_page()
-        
+        await self.prepare_page(page)
+        self.page_egress[page] = egress
+        return browser, page
+
+    async def prepare_page(self, page):
+        """Stealth patches + media blocking, for every page we open."""
         # Apply Stealth Mode
         if stealth_async:
             await stealth_async(page)
@@ -877,8 +1851,170 @@ class LeadHunter:
             route.abort() if route.request.resource_type in ["image", "media", "font", "stylesheet"] 
             else route.continue_()
         )
+
+    async def sibling_page(self, page):
+        """Another tab in page's context: same cookies, consent state and egress."""
+        sibling = await page.context.new_page()
+        await self.prepare_page(sibling)
+        if page in self.page_egress:
+            self.page_egress[sibling] = self.page_egress[page]
+        return sibling
+
+    async def gather_lookups(self, page, lookups, deadline=None):
+        """
+        Runs independent lookups concurrently. `lookups` maps a name to
+        (fn, default); fn(page) is awaited on its own page (the first on `page`,
+        the rest on sibling pages, closed afterwards). A lookup that raises or
+        overruns its budget gives its default. The stage is the name up to ":"
+        ("fallback:linkedin"); with a LeadDeadline each stage gets
+        deadline.budget(stage) and cancelled stages land in deadline.cut,
+        otherwise ENRICH_TASK_TIMEOUT applies. Returns {name: result}.
+        """
+        names = list(lookups)
+        pages = [page]
+        results, durations = {}, {}
+        try:
+            for _ in names[1:]:
+                try:
+                    pages.append(await self.sibling_page(page))
+                except Exception as e:
+                    print(f"  ⚠️ Sibling page failed ({repr(e)[:60]}), sharing the main page")
+                    pages.append(None)
+
+            async def run(name, pg):
+                fn, default = lookups[name]
+                stage = name.split(":")[0]
+                timeout = deadline.budget(stage) if deadline else ENRICH_TASK_TIMEOUT
+                start = time.time()
+                cut = False
+                try:
+                    if pg is None:
+                        return default   # no page to run on concurrently
+                    return await asyncio.wait_for(fn(pg), timeout)
+                except asyncio.TimeoutError:
+                    cut = True
+                    self.parallel_stats["timeouts"] += 1
+                    if deadline: deadline.cut.append(stage)
+                    print(f"  ⏱️ {name} cancelled after {timeout:.0f}s (over budget)")
+                    return default
+                except Exception as e:
+                    print(f"  ⚠️ {name} lookup failed: {e}")
+                    return default
+                finally:
+                    durations[name] = time.time() - start
+                    self.record_stage(stage, durations[name], cut)
+
+            start = time.time()
+            done = await asyncio.gather(*(run(n, pg) for n, pg in zip(names, pages)))
+            results = dict(zip(names, done))
+            self.parallel_stats["tasks"] += len(names)
+            self.parallel_stats["serial"] += sum(durations.values())
+            self.parallel_stats["wall"] += time.time() - start
+        finally:
+            for pg in pages[1:]:
+                if pg is not None:
+                    try: await pg.close()
+                    except: pass
+        return results
+
+    def record_stage(self, stage, seconds, cut=False):
+        st = self.stage_stats.setdefault(stage, {"runs": 0, "seconds": 0.0, "max": 0.0, "cut": 0})
+        st["runs"] += 1
+        st["seconds"] += seconds
+        st["max"] = max(st["max"], seconds)
+        st["cut"] += cut
+
+    async def google_goto(self, page, path, update_callback=None, wait_until="load", timeout=30000):
+        """
+        Every Google navigation goes through here: refuses while the page's egress
+        is cooling down after a block, handles the consent wall, and reports
+        ok / blocked / latency to the proxy pool. True when the page holds results.
+        """
+        egress = self.page_egress.get(page)
+        if egress is not None and not self.proxies.allow(egress):
+            return False
+        start = time.time()
+        try:
+            try:
+                await page.goto(google_url(path), wait_until=wait_until, timeout=timeout)
+            except Exception as e:
+                # networkidle timeouts on trackers are common; the results may still be there
+                if not is_google_host(page.url):
+                    if egress is not None: self.proxies.report(egress, ok=False, latency=time.time() - start)
+                    if update_callback: update_callback(f"⚠️ Navigation warning: {str(e)[:50]}")
+                    return False
+            await self.handle_consent(page, update_callback)
+            try:
+                blocked = is_block_page(page.url) or await page.locator(BLOCK_SELECTOR).count() > 0
+            except Exception:
+                blocked = is_block_page(page.url)
+            if egress is not None:
+                self.proxies.report(egress, ok=not blocked, latency=time.time() - start, blocked=blocked)
+                if blocked and update_callback: update_callback(
+                    f"🧯 Breaker open on {egress.name}: no Google queries from it for {egress.cooling():.0f}s")
+            return not blocked
+        finally:
+            # A stage cut (CancelledError) skips report(); don't leave a half-open egress stuck in its trial
+            if egress is not None: self.proxies.release(egress)
+
+    def egress_blocked(self, page):
+        """True while the page's egress is cooling down after a block."""
+        egress = self.page_egress.get(page)
+        return egress is not None and egress.cooling() > 0
+
+    async def rotate_browser(self, p, browser, update_callback=None):
+        """
+        Closes a browser whose egress got blocked and relaunches on the healthiest
+        ready one. Returns (None, None) when every egress is cooling down.
+        """
+        await browser.close()
+        if not self.proxies.available():
+            if update_callback: update_callback(
+                f"🧯 All egresses cooling down (next in {self.proxies.next_ready_in():.0f}s) — pausing Google queries.")
+            return None, None
+        browser, page = await self.get_browser_and_page(p)
+        if update_callback: update_callback(f"🔁 Switched Google egress → {self.page_egress[page].name}")
         return browser, page
 
+    async def handle_consent(self, page, update_callback=None):
+        """
+        Clicks through Google's consent wall (one evaluate) and saves the resulting
+        cookies to CONSENT_STATE_PATH, so the next contexts start past it.
+        Returns True if a wall was handled.
+        """
+        try:
+            clicked = await page.evaluate(CONSENT_JS)
+        except Exception:
+            return False
+        if not clicked:
+            return False
+        self.consent_stats["walls"] += 1
+        if update_callback: update_callback(f"🔓 Handling Google Consent ({clicked})...")
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=10000)
+        except Exception:
+            pass
+        await self.save_consent_state(page.context)
+        return True
+
+    async def save_consent_state(self, context):
+        """Stores only Google's cookies / storage; written atomically so concurrent missions never read half a file."""
+        try:
+            state = await context.storage_state()
+            state = {
+                "cookies": [c for c in state.get("cookies", []) if "google." in c.get("domain", "")],
+                "origins": [o for o in state.get("origins", []) if "google." in o.get("origin", "")],
+            }
+            if not state["cookies"]:
+                return
+            os.makedirs(os.path.dirname(CONSENT_STATE_PATH) or ".", exist_ok=True)
+            tmp_path = f"{CONSENT_STATE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, CONSENT_STATE_PATH)
+        except Exception as e:
+            print(f"Consent state save error: {e}")
+
     def generate_dork(self, keyword):
         """Constructs surgical Google X-Ray dorks for LinkedIn to ensure high quality leads."""
         keyword_clean = keyword.replace('"', '')
@@ -912,84 +2048,32 @@ class LeadHunter:
         else:
             dork = self.generate_dork(keyword)
 
-        base_url = f"https://www.google.com/search?q={dork.replace(' ', '+')}"
-        if start > 0:
-            base_url += f"&start={start}"
-        search_url = base_url
-        if update_callback: update_callback(f"🧬 LinkedIn X-Ray: {search_url}")
+        if update_callback: update_callback(f"🧬 LinkedIn X-Ray: {dork} (offset {start})")
         
-        try:
-            # Shift to 'load' for more stability against trackers
-            await page.goto(search_url, wait_until="load", timeout=40000)
-            await self.sleep_random(3, 5)
-            
-            # Handle Google Consent Screen
-            consent_selectors = [
-                'button[aria-label="Accept all"]', 'button[aria-label="Agree"]',
-                'button:has-text("Accept all")', 'button:has-text("I agree")',
-                'div[role="button"]:has-text("Accept all")'
-            ]
-            for selector in consent_selectors:
-                if await page.query_selector(selector):
-                    if update_callback: update_callback("🔓 Handling Google Consent...")
-                    await page.click(selector)
-                    await self.sleep_random(2, 4)
-                    break
-        except Exception as e:
-            if update_callback: update_callback(f"⚠️ Navigation warning: {str(e)[:50]}")
-
-        # Human Scroll to trick bot detection and load more results
-        if update_callback: update_callback("🖱️ Simulating Human Scroll on Google...")
-        for _ in range(2):
-            await page.evaluate("window.scrollBy(0, document.body.scrollHeight / 4)")
-            await asyncio.sleep(1.5)
-
-        # Blocker Status check
-        page_title = await page.title()
-        if "Before you continue" in page_title or "Captcha" in page_title or "blocked" in page_title.lower():
-             if update_callback: update_callback(f"🔴 Blocker Status: CAPTCHA / Bot Detected")
-             return []
+        serp_results = await self.serp.search(dork, start=start, page=page, update_callback=update_callback, kind="xray")
+        if not serp_results:
+            if self.egress_blocked(page) and update_callback: update_callback("🔴 Blocker Status: CAPTCHA / Bot Detected")
+            return []
 
         results = []
-        links = await page.query_selector_all('a')
         processed_urls = set()
         
-        if update_callback: update_callback(f"🔍 Found {len(links)} links. Filtering for LinkedIn profiles...")
+        if update_callback: update_callback(f"🔍 Found {len(serp_results)} results. Filtering for LinkedIn profiles...")
 
-        for link in links:
+        for result in serp_results:
             if len(results) >= self.limit: break
             
-            href = await link.get_attribute('href')
+            href = result["url"]
             # Broad match for linkedin urls
-            if href and ("linkedin.com/in/" in href or "linkedin.com/company/" in href or ".linkedin.com/" in href):
-                # Clean Google redirect (handle url?q= and url?url= and others)
-                if "/url?" in href:
-                    match = re.search(r'url\?(?:q|url)=([^\&]*)', href)
-                    if match: href = match.group(1)
-                    href = urllib.parse.unquote(href)
-                
+            if "linkedin.com/in/" in href or "linkedin.com/company/" in href or ".linkedin.com/" in href:
                 clean_url = href.split('&')[0].split('?')[0]
                 if clean_url in processed_urls: continue
                 # Final check if it looks like a LinkedIn profile/company
                 if "linkedin.com/" not in clean_url: continue
                 processed_urls.add(clean_url)
                 
-                try:
-                    # More robust container detection
-                    container = await page.evaluate_handle('el => el.closest(".g, .MjjYud, div[data-hveid]")', link)
-                    if container:
-                        h3 = await container.as_element().query_selector('h3')
-                        name = await h3.inner_text() if h3 else "LinkedIn User"
-                        
-                        # Broader snippet selectors
-                        snippet_el = await container.as_element().query_selector('.VwiC3b, .y355M, .IsZvec, .MUY17c, .kb0BC')
-                        snippet = await snippet_el.inner_text() if snippet_el else "No snippet available"
-                    else:
-                        name = await link.inner_text() or "LinkedIn User"
-                        snippet = "No snippet available"
-                except:
-                    name = "LinkedIn User"
-                    snippet = "No snippet available"
+                name = result["title"] or "LinkedIn User"
+                snippet = result["snippet"] or "No snippet available"
                 
                 # Check for "LinkedIn" in name to avoid false positives
                 if "linkedin" in name.lower() and len(name) < 15: # Skip if name is just "LinkedIn"
@@ -1009,70 +2093,35 @@ class LeadHunter:
         else:
             dork = f'site:linkedin.com/posts "{keyword}"'
             
-        search_url = f"https://www.google.com/search?q={dork.replace(' ', '+')}"
-        if update_callback: update_callback(f"📡 Signal Search: {search_url}")
+        if update_callback: update_callback(f"📡 Signal Search: {dork}")
         
         blocker_status = "🟢 OK"
+        walls_before = self.consent_stats["walls"]
         
-        try:
-            await page.goto(search_url, wait_until="load", timeout=40000)
-            await self.sleep_random(3, 5)
-            
-            # Handle Google Consent Screen
-            consent_selectors = ['button[aria-label="Accept all"]', 'button[aria-label="Agree"]', 'div[role="button"]:has-text("Accept all")']
-            for selector in consent_selectors:
-                if await page.query_selector(selector):
-                    await page.click(selector)
-                    await self.sleep_random(2, 4)
-                    blocker_status = "🟡 Consent Handled"
-                    break
-        except:
-            blocker_status = "🟡 Navigation Slow"
-
-        # Human Scroll
-        await page.evaluate("window.scrollBy(0, 500)")
-        await asyncio.sleep(1)
-
-        # BLOCKER DETECTION
-        page_title = await page.title()
-        if "Before you continue" in page_title or "Captcha" in page_title or "blocked" in page_title.lower():
+        # Consent + BLOCKER DETECTION happen inside the providers
+        serp_results = await self.serp.search(dork, page=page, update_callback=update_callback, kind="posts")
+        if not serp_results and self.egress_blocked(page):
             blocker_status = "🔴 CAPTCHA/Consent Block"
-            if update_callback: update_callback(f"⚠️ Blocker: {page_title}")
+            if update_callback: update_callback(f"⚠️ Blocker: {blocker_status}")
             return [], blocker_status
+        if self.consent_stats["walls"] > walls_before:
+            blocker_status = "🟡 Consent Handled"
         
         results = []
-        links = await page.query_selector_all('a')
         processed_urls = set()
 
-        for link in links:
+        for result in serp_results:
             if len(results) >= self.limit: break
             
-            href = await link.get_attribute('href')
-            if href and ("linkedin.com/posts/" in href or "linkedin.com/in/" in href or ".linkedin.com/" in href):
-                if "/url?" in href:
-                    match = re.search(r'url\?(?:q|url)=([^\&]*)', href)
-                    if match: href = match.group(1)
-                    href = urllib.parse.unquote(href)
-                
+            href = result["url"]
+            if "linkedin.com/posts/" in href or "linkedin.com/in/" in href or ".linkedin.com/" in href:
                 clean_url = href.split('&')[0].split('?')[0]
                 if clean_url in processed_urls: continue
                 if "linkedin.com/" not in clean_url: continue
                 processed_urls.add(clean_url)
                 
-                try:
-                    container = await page.evaluate_handle('el => el.closest(".g, .MjjYud, div[data-hveid]")', link)
-                    if container:
-                        h3 = await container.as_element().query_selector('h3')
-                        name = await h3.inner_text() if h3 else "LinkedIn User"
-                        
-                        snippet_el = await container.as_element().query_selector('.VwiC3b, .y355M, .IsZvec, .MUY17c, .kb0BC')
-                        snippet = await snippet_el.inner_text() if snippet_el else "No snippet available"
-                    else:
-                        name = "LinkedIn User"
-                        snippet = "No snippet available"
-                except:
-                    name = "LinkedIn User"
-                    snippet = "No snippet available"
+                name = result["title"] or "LinkedIn User"
+                snippet = result["snippet"] or "No snippet available"
                 
                 signal, signal_preview = self.detect_buying_signal(snippet)
                 results.append({
@@ -1087,13 +2136,19 @@ class LeadHunter:
         return results, blocker_status
 
     async def score_linkedin_ai(self, profile_name, snippet_text, signal_type="👤 Profile"):
-        if not self.model:
-            return "Pending", "Pending", "LinkedIn", "Pending AI Review", "N/A"
-
         # Handle empty snippets to avoid AI confusion
         if snippet_text == "No snippet available" or len(snippet_text) < 10:
              return 40, "Neutral", "LinkedIn", "Minimal context available", "I saw your profile on LinkedIn."
 
+        local = self.local_first_pass("linkedin", f"{signal_type} {snippet_text}")
+        if local:
+            decision, confidence, score = local
+            self.archive_intelligence(f"LOCAL_LINKEDIN_{profile_name}", json.dumps({"score": score, "decision": decision, "confidence": round(confidence, 3)}))
+            return score, decision, "LinkedIn", f"Local model ({confidence:.0%} confident)", "I saw your profile on LinkedIn."
+
+        if not self.model:
+            return "Pending", "Pending", "LinkedIn", "Pending AI Review", "N/A"
+
         prompt = f"""
         Analyze this LinkedIn profile snippet for '{profile_name}'.
         Signal Category: {signal_type}
@@ -1115,6 +2170,7 @@ class LeadHunter:
         """
         # ARCHIVE: Prompt
         self.archive_intelligence(f"PROMPT_LINKEDIN_{profile_name}", prompt)
+        self.ai_stats["gemini"] += 1
 
         try:
             response = self.model.generate_content(prompt)
@@ -1123,9 +2179,9 @@ class LeadHunter:
             # ARCHIVE: Response
             self.archive_intelligence(f"RESPONSE_LINKEDIN_{profile_name}", clean_text)
 
-            start = clean_text.find('{')
-            end = clean_text.rfind('}') + 1
-            data = json.loads(clean_text[start:end])
+            data = await self.run_cpu(extract_json_block, clean_text)
+            if data is None:
+                raise ValueError("No JSON object in LinkedIn response")
             return (
                 data.get("score", 50), 
                 data.get("decision", "Neutral"), 
@@ -1142,25 +2198,12 @@ class LeadHunter:
         Detects buying signals from Google snippet text.
         Returns: (signal_type, icebreaker_placeholder)
         """
-        hiring_keywords = ["hiring", "looking for freelancer", "looking for a freelancer", "need a", "recruiting", "looking to hire", "looking for help"]
-        frustration_keywords = ["frustrated with", "issues with", "problem with", "struggling with", "having trouble", "doesn't work"]
-        advice_keywords = ["recommend a", "recommend an", "looking for agency", "looking for a", "need help with", "suggestions for", "anyone know"]
-        
-        snippet_lower = snippet_text.lower()
-        
-        # Premium/Open Profile detection
-        is_open = "premium" in snippet_lower or "open profile" in snippet_lower
-        
-        if any(kw in snippet_lower for kw in hiring_keywords):
-            signal = "📢 Hiring"
-        elif any(kw in snippet_lower for kw in frustration_keywords):
-            signal = "🛠️ Frustration"
-        elif any(kw in snippet_lower for kw in advice_keywords):
-            signal = "💡 Advice"
-        else:
-            signal = "👤 Profile"
+        # Keyword tables live in signal_engine.SIGNATURES ("buying" is in priority order)
+        hits = SIGNALS.scan(snippet_text, groups=("buying", "open_profile"))
+        signal = hits["buying"][0] if hits["buying"] else "👤 Profile"
 
-        if is_open:
+        # Premium/Open Profile detection
+        if hits["open_profile"]:
             signal = f"🔓 {signal}"
             
         return signal, "Analyzing via AI..."
@@ -1171,6 +2214,8 @@ class LeadHunter:
             print("❌ No keyword provided for mission.")
             return []
 
+        phone_region = infer_default_region(target_keyword)
+
         # 0. Checkpoint: Load History
         print("Loading mission history...")
         history = self.gsheets.get_existing_leads()
@@ -1184,6 +2229,9 @@ class LeadHunter:
         # -------------------------------------------------------
         final_leads       = []
         all_processed     = set()   # names seen across ALL attempts (avoid re-enriching)
+        backfill_queued   = 0
+        self.ladder_stats = {tier: 0 for tier in self.ladder_stats}
+        self.ai_stats     = {"local": 0, "gemini": 0}
         attempt           = 0
         MAX_ATTEMPTS      = 50
 
@@ -1201,12 +2249,23 @@ class LeadHunter:
             # Each retry scrolls proportionally deeper to expose fresh results
             min_cands = max(self.limit * 2 * attempt, 20)
 
+            google_paused = False
             async with async_playwright() as p:
                 browser, page = await self.get_browser_and_page(p)
                 try:
                     basic_companies = await self.scrape_google_maps(page, update_callback, min_candidates=min_cands)
+                    # Blocked: fail over to the next healthy egress instead of retrying into the same wall
+                    while self.egress_blocked(page):
+                        browser, page = await self.rotate_browser(p, browser, update_callback)
+                        if page is None:
+                            google_paused = True
+                            break
+                        basic_companies = await self.scrape_google_maps(page, update_callback, min_candidates=min_cands)
                 finally:
-                    await browser.close()
+                    if browser: await browser.close()
+
+            if google_paused:
+                break
 
             # Only process companies we haven't seen before
             new_companies = [c for c in basic_companies if c['name'] not in all_processed]
@@ -1217,10 +2276,30 @@ class LeadHunter:
             if update_callback: update_callback(
                 f"📋 {len(new_companies)} new candidates this pass (skipped {len(basic_companies)-len(new_companies)} already seen).")
 
+            # --- LIVENESS PRE-FLIGHT: every candidate site at once, before any browser navigation ---
+            pf_start = time.time()
+            checks = await self.preflight.check_many([c.get("website", "N/A") for c in new_companies])
+            for c in new_companies:
+                self.apply_preflight(c, checks.get(c.get("website", "N/A")))
+            if update_callback and checks: update_callback(
+                f"🩺 Pre-flight: {sum(1 for v in checks.values() if v['status'] == 'live')}/{len(checks)} sites live "
+                f"({time.time() - pf_start:.1f}s) — dead / parked ones skip the browser.")
+
+            # --- VALUE-ORDERED QUEUE: cheapest signals first, enrichment pulls best-first ---
+            queue = []
+            for seq, basic_info in enumerate(new_companies):
+                basic_info["pre_score"] = self.prescore_candidate(basic_info, target_keyword)
+                self.ladder_stats["tier0"] += 1
+                queue.append((-self.candidate_priority(basic_info, basic_info["pre_score"]), seq, basic_info))
+            heapq.heapify(queue)
+            if update_callback and queue: update_callback(
+                f"📊 Priority queue ready — best candidate: {queue[0][2]['name']} (priority {-queue[0][0]})")
+
             count = 0
             total_new = len(new_companies)
 
-            for basic_info in new_companies:
+            while queue and len(final_leads) < self.limit:
+                _, _, basic_info = heapq.heappop(queue)
                 count += 1
                 website = basic_info.get("website", "N/A")
                 name    = basic_info.get("name", "Unknown")
@@ -1237,96 +2316,38 @@ class LeadHunter:
 
                 if is_duplicate:
                     if update_callback: update_callback(msg)
-                    # ── SMART UPSERT: Check if existing row has missing fields ──────
-                    # Instead of a hard skip, peek at the local CSV to see what's empty.
-                    # If critical fields are N/A, trigger a targeted fill-in scrape.
+                    # ── BACKFILL: an existing row with empty fields is queued, not filled inline ──────
+                    # run_backfill_sweep() fills it later, so discovery never waits on it.
                     local_csv_path = r"E:\Lead Hunter\incremental_leads_backup.csv"
-                    needs_fill = False
-                    existing_row_idx = None
-                    df_existing = None
-                    FILL_FIELDS = ['Emails', 'Mobile', 'Phone', 'Chat Option', 'LinkedIn', 'Instagram', 'Facebook']
-                    
-                    if os.path.exists(local_csv_path):
-                        try:
-                            df_existing = pd.read_csv(local_csv_path)
-                            # Find the matching row by name or website
-                            name_match = df_existing.index[df_existing['Company Name'].astype(str).str.strip() == name.strip()].tolist()
-                            if name_match:
-                                existing_row_idx = name_match[0]
-                                row = df_existing.iloc[existing_row_idx]
-                                # Check if any critical field is missing
-                                for f in FILL_FIELDS:
-                                    val = str(row.get(f, "N/A")).strip()
-                                    if val in ["N/A", "", "nan", "Pending Deep Background Scan..."]:
-                                        needs_fill = True
-                                        break
-                        except: pass
-                    
-                    if not needs_fill:
-                        continue  # Truly complete — full skip
-                    
-                    # Has missing fields → run targeted deep scrape to fill them in
-                    if update_callback: update_callback(f"🔄 [FILL-IN] {name} has missing fields — running targeted enrichment...")
                     try:
-                        async with async_playwright() as p_fill:
-                            browser_fill, page_fill = await self.get_browser_and_page(p_fill)
-                            try:
-                                fill_site = website if website not in ["N/A", ""] else await self.recover_website(page_fill, name)
-                                content_fill, emails_fill, socials_fill, phone_fill, tech_fill, _, chat_detected_fill = await self.scrape_website(page_fill, fill_site)
-                                
-                                # Build update dict — only overwrite N/A fields
-                                if df_existing is not None and existing_row_idx is not None:
-                                    def fill_if_empty(col, new_val):
-                                        cur = str(df_existing.loc[existing_row_idx, col]).strip() if col in df_existing.columns else "N/A"
-                                        if cur in ["N/A", "", "nan", "Pending Deep Background Scan..."] and new_val and str(new_val).strip() not in ["N/A", "", "nan"]:
-                                            df_existing.loc[existing_row_idx, col] = new_val
-                                    
-                                    if emails_fill:
-                                        email_str_fill = ", ".join(emails_fill)
-                                        fill_if_empty('Emails', email_str_fill)
-                                        # Re-validate with email for chat detection
-                                        _, is_m_f, fp_f, fm_f, cw_f = validate_and_parse_contact_fields(phone_fill, fill_site, email_str_fill)
-                                        fill_if_empty('Phone',       fp_f)
-                                        fill_if_empty('Mobile',      fm_f)
-                                        fill_if_empty('Chat Option', cw_f)
-                                    
-                                    for platform in ['linkedin', 'instagram', 'facebook']:
-                                        col_name = platform.capitalize()
-                                        fill_if_empty(col_name, socials_fill.get(platform, "N/A"))
-                                    
-                                    df_existing.to_csv(local_csv_path, index=False)
-                                    if update_callback: update_callback(f"✅ [FILL-IN COMPLETE] {name} updated with missing fields.")
-                            except Exception as fill_err:
-                                if update_callback: update_callback(f"⚠️ Fill-in error for {name}: {fill_err}")
-                            finally:
-                                await browser_fill.close()
-                    except Exception as outer_fill_err:
-                        if update_callback: update_callback(f"⚠️ Fill-in browser error: {outer_fill_err}")
-                    continue  # Don't create a new row — we just updated the existing one
+                        missing = await self.run_cpu(lead_backup.missing_fields, local_csv_path, name, FILL_FIELDS, offload=True)
+                        if missing:
+                            await asyncio.to_thread(self.backfill.enqueue, name, website, target_keyword,
+                                                    local_csv_path, missing, phone_region)
+                            backfill_queued += 1
+                            if update_callback: update_callback(f"🗂️ [BACKFILL] {name} queued — missing {', '.join(missing)}")
+                    except Exception as e:
+                        print(f"Backfill check error for {name}: {e}")
+                    continue  # Don't create a new row — the sweeper fills the existing one
                 
 
                 # --- FAST-PRIORITY STREAMING (STAGE 1) ---
                 raw_phone = ""
                 raw_txt = basic_info.get("raw_maps_text", "")
-                phone_match = re.search(r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', raw_txt)
+                phone_match = PHONE_PATTERN.search(raw_txt)
                 if phone_match:
                     raw_phone = phone_match.group(0).strip()
                 
                 site_url = website
                 # Pass empty email at Stage 1 (we don't have it yet — Stage 2 will refine)
-                is_p_val, is_m_val, fine_phone, fine_mobile, chat_widget = validate_and_parse_contact_fields(raw_phone, site_url, "")
+                is_p_val, is_m_val, fine_phone, fine_mobile, chat_widget = validate_and_parse_contact_fields(raw_phone, site_url, "", phone_region)
                 
                 local_csv = r"E:\Lead Hunter\incremental_leads_backup.csv"
                 skip_deep = False
-                if os.path.exists(local_csv):
-                    try:
-                        df_check = pd.read_csv(local_csv)
-                        web_clean = site_url.strip().lower() if site_url else "n/a"
-                        if 'Website' in df_check.columns and web_clean != "n/a" and web_clean != "":
-                            if web_clean in df_check['Website'].astype(str).str.lower().values:
-                                skip_deep = True
-                    except:
-                        pass
+                try:
+                    skip_deep = await self.run_cpu(lead_backup.website_in_backup, local_csv, site_url, offload=True)
+                except Exception:
+                    pass
                 
                 if skip_deep:
                     if update_callback: update_callback(f"Skipping {name} (Duplicate Website in Fast-Save)")
@@ -1345,9 +2366,7 @@ class LeadHunter:
                     "Timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
                 }
                 
-                df_core = pd.DataFrame([core_row])
-                file_exists = os.path.isfile(local_csv)
-                df_core.to_csv(local_csv, mode='a', header=not file_exists, index=False)
+                await self.run_cpu(lead_backup.append_row, local_csv, core_row, offload=True)
                 
                 # IMMEDIATE GOOGLE SHEETS INSERT
                 pending_gsheets_row = {
@@ -1384,6 +2403,12 @@ class LeadHunter:
                 if update_callback: update_callback(
                     f"Processing Lead {count}/{total_new} [✅ {len(final_leads)}/{self.limit} done]: {name}")
 
+                # --- TIER 0: LOCAL PRE-SCORE (Maps data only, no network) ---
+                pre_score = basic_info["pre_score"]
+                tiers     = self.ladder_tiers(pre_score)
+                if update_callback: update_callback(
+                    f"🪜 Pre-score {pre_score}/100 for {name} → tiers: {', '.join(t for t, ok in tiers.items() if ok) or 'maps only'}")
+
                 # ATOMIC SESSION
                 company_data    = None
                 company_content = None
@@ -1392,112 +2417,139 @@ class LeadHunter:
                 try:
                     if progress_callback: progress_callback(count / total_new)
 
-                    async with async_playwright() as p:
-                        browser, page = await self.get_browser_and_page(p)
+                    company = basic_info.copy()
+                    company["pre_score"] = pre_score
+                    website_content, emails, phone, tech_stack, load_time, chat_detected_d = "", [], "N/A", "Unknown", 0, "None/Standard"
+                    site_address = "N/A"
+                    socials = {"linkedin": "N/A", "instagram": "N/A", "facebook": "N/A", "twitter": "N/A"}
+                    founder = None
+                    deadline = LeadDeadline()
 
-                        try:
-                            company = basic_info.copy()
-
-                            # --- WEBSITE RECOVERY SWEEP ---
-                            if company.get("website") == "N/A":
-                                company["website"] = await self.recover_website(page, company["name"])
-
-                            # Scrape with strict timeout
-                            website_content, emails, socials, phone, tech_stack, load_time, chat_detected_d = await self.scrape_website(page, company["website"])
-
-                            # --- SOCIAL RECOVERY SWEEP ---
-                            if socials.get("linkedin") == "N/A":
-                                socials["linkedin"] = await self.recover_social(page, company["name"], "linkedin")
-                            if socials.get("instagram") == "N/A":
-                                socials["instagram"] = await self.recover_social(page, company["name"], "instagram")
-                            if socials.get("facebook") == "N/A":
-                                socials["facebook"] = await self.recover_social(page, company["name"], "facebook")
-
-                            company["email"]      = ", ".join(emails) if emails else "N/A"
-                            company["phone"]      = phone
-                            company["tech_stack"] = tech_stack
-                            company["source"]     = "Google Maps"
-                            company.update(socials)
-
-                            # SIGNAL & OPPORTUNITY LOGIC
-                            if company.get("is_unclaimed", False):
-                                company["gmb_status"] = "🚩 Unclaimed"
-                                company["gmb_opp"]    = "Pitch: Claim and Optimize GMB Profile."
-                            elif company.get("reviews", 0) < 10:
-                                company["gmb_status"] = f"⚠️ Low Reviews ({company.get('reviews')})"
-                                company["gmb_opp"]    = "Pitch: Automated Review Management."
-                            else:
-                                company["gmb_status"] = "✅ Healthy"
-                                company["gmb_opp"]    = "N/A"
+                    if tiers["browser"]:
+                        self.ladder_stats["browser"] += 1
+                        async with async_playwright() as p:
+                            browser, page = await self.get_browser_and_page(p)
 
-                            if "Meta Pixel" not in tech_stack:
-                                company["ad_status"] = "📉 Not running Meta Ads"
-                                company["ad_opp"]    = "Pitch: Lead Generation Automation."
-                            else:
-                                company["ad_status"] = "🚀 Active"
-                                company["ad_opp"]    = "N/A"
-
-                            if company.get("website", "N/A") == "N/A":
-                                company["web_status"]   = "🚫 No Site"
-                                company["web_opp"]      = "Pitch: High-Converting Landing Page Build."
-                                company["speed_status"] = "N/A (No Site)"
-                                company["speed_opp"]    = "N/A"
-                            elif "WordPress" in tech_stack or "Basic" in tech_stack:
-                                company["web_status"] = "🕸️ Old WP / Basic"
-                                company["web_opp"]    = "Pitch: Performance Marketing / CRO."
-                            else:
-                                company["web_status"] = "💎 Modern"
-                                company["web_opp"]    = "N/A"
-
-                            if "speed_status" not in company:
-                                if load_time > 5:
-                                    company["speed_status"] = f"🐢 Slow ({load_time:.1f}s)"
-                                    company["speed_opp"]    = "Pitch: Website Optimization / Speed."
-                                else:
-                                    company["speed_status"] = f"⚡ Fast ({load_time:.1f}s)"
-                                    company["speed_opp"]    = "N/A"
-
-                            company["xray_status"] = "❓ Not Found"
-                            company["xray_opp"]    = "Pitch: Direct Outreach / LinkedIn DM."
-
-                            if "emergency" in target_keyword.lower():
-                                company["ad_opp"]  = "Pitch: PPC / Google Ads (Urgent need)."
-                            if "new" in target_keyword.lower():
-                                company["gmb_opp"] = "Pitch: Launch Marketing / Google Business Setup."
-
-                            # X-RAY ENRICHMENT (Dual Scan mode)
-                            if enrich_with_xray:
-                                xray_dork = f'site:linkedin.com/in "CEO" OR "Founder" "{company["name"]}"'
-                                if update_callback: update_callback(f"   🔍 X-Raying Founder for: {company['name']}")
-                                original_limit = self.limit
-                                self.limit = 1
-                                xray_results = await self.scrape_linkedin_profiles(page, xray_dork, update_callback=update_callback)
-                                self.limit = original_limit
-                                if xray_results:
-                                    founder = xray_results[0]
-                                    company['founder_match'] = f"{founder['name']} ({founder['url']})"
-                                    company['xray_status']   = "👤 Found Founder"
-                                    if update_callback: update_callback(f"   👤 Found: {founder['name']}")
-                                else:
-                                    company['founder_match'] = "Not Found"
-
-                            if company.get("linkedin") == "N/A":
-                                found_li = await self.search_linkedin(page, company["name"])
-                                if found_li != "N/A":
-                                    company["linkedin"] = found_li
-
-                            company_data    = company
-                            combined_content = f"MAPS INFO: {company.get('raw_maps_text', '')}\n\nWEBSITE INFO:\n{website_content}"
-                            company_content  = self.truncate_for_ai(combined_content, 5000)
-
-                        except Exception as e:
-                            print(f"Scrape error for {basic_info['name']}: {e}")
-                            company_data    = basic_info.copy()
-                            company_content = ""
-                        finally:
-                            await browser.close()
-                            try: await p.stop()
-                            except: pass
+                            try:
+                                # Website and founder X-ray don't depend on each other: run them side by side
+                                # on sibling pages, so a lead costs its slower lookup. Social recovery waits for
+                                # the site, which often declares the profiles itself
+                                site_budget = deadline.budget("website")
+
+                                async def site_lookup(pg):
+                                    stage_start = time.time()
+                                    # --- WEBSITE RECOVERY SWEEP ---
+                                    if company.get("website") == "N/A":
+                                        company["website"] = await self.recover_website(pg, company["name"])
+                                        if company["website"] != "N/A":
+                                            self.apply_preflight(company, await self.preflight.check(company["website"]))
+                                    if company.get("site_status"):
+                                        return lookups["website"][1]   # dead / parked: nothing for the browser
+                                    # Scrape within what's left of the stage budget (1s spare to return)
+                                    left = site_budget - (time.time() - stage_start) - 1
+                                    return await self.scrape_website(pg, company.get("live_url") or company["website"], budget=max(left, 1))
+
+                                async def xray_lookup(pg):
+                                    if company["name"] not in self.founder_cache:
+                                        # Lazy prefetch: batch this company with the next queued ones that will also reach X-ray
+                                        upcoming = [b["name"] for _, _, b in heapq.nsmallest(FOUNDER_BATCH_SIZE * 3, queue)
+                                                    if self.ladder_tiers(b["pre_score"])["xray"] and b["name"] not in existing_names
+                                                    and b["name"] not in self.founder_cache]
+                                        batch = [company["name"]] + upcoming[:FOUNDER_BATCH_SIZE - 1]
+                                        await self.resolve_founders(pg, batch, update_callback)
+                                    return self.founder_cache.get(company["name"], False)
+
+                                # Earlier missions' results for this domain: socials (site + recovered) and the founder.
+                                # Neither comes from the page alone, so the homepage's 304 can't revive them
+                                site_key = company.get("live_url") or company.get("website")
+                                known = {}
+                                for field in ("socials_recovered", "founder_xray"):
+                                    hit = await self.enrich_cache.get(site_key, (field,), revalidate=False, refresh=self.refresh_cache)
+                                    if hit: known.update(hit)
+
+                                lookups = {"website": (site_lookup, ("", [], {}, "N/A", "Unknown", 0, "None/Standard", "N/A"))}
+                                # X-RAY ENRICHMENT (Dual Scan mode)
+                                if enrich_with_xray and tiers["xray"]:
+                                    self.ladder_stats["xray"] += 1
+                                    if "founder_xray" in known:
+                                        founder = known["founder_xray"]
+                                    else:
+                                        lookups["xray"] = (xray_lookup, None)
+
+                                self.parallel_stats["leads"] += 1
+                                found = await self.gather_lookups(page, lookups, deadline)
+                                website_content, emails, site_socials, phone, tech_stack, load_time, chat_detected_d, site_address = found["website"]
+                                if "xray" in lookups:
+                                    founder = found["xray"]
+
+                                # Homepage socials win; what earlier missions found fills the gaps
+                                socials.update(site_socials)
+                                for k, v in known.get("socials_recovered", {}).items():
+                                    if socials.get(k, "N/A") == "N/A" and v != "N/A":
+                                        socials[k] = v
+
+                                # --- SOCIAL RECOVERY SWEEP: only once the site has spoken, only for what it didn't declare ---
+                                if tiers["socials"]:
+                                    self.ladder_stats["socials"] += 1
+                                missing = [k for k in ("linkedin", "instagram", "facebook") if socials.get(k) == "N/A"]
+                                if tiers["socials"] and missing:
+                                    if deadline.remaining() < 2:
+                                        deadline.cut.append("socials")   # no time left for the searches
+                                    else:
+                                        recovered = await self.gather_lookups(page, {
+                                            "socials": (lambda pg: self.recover_socials(pg, company["name"], tuple(missing), fallback=False), {})
+                                        }, deadline)
+                                        for k, v in recovered["socials"].items():
+                                            if v != "N/A":
+                                                socials[k] = v
+                                        missing = [k for k in missing if socials.get(k) == "N/A"]
+                                if tiers["socials"] and missing:
+                                    if deadline.remaining() < 2:
+                                        deadline.cut.append("fallback")   # no time left for the per-platform searches
+                                    else:
+                                        fallbacks = await self.gather_lookups(page, {
+                                            f"fallback:{k}": (lambda pg, k=k: self.recover_social_fallback(pg, company["name"], k), "N/A")
+                                            for k in missing}, deadline)
+                                        socials.update({k.split(":")[1]: v for k, v in fallbacks.items()})
+
+                                # Remember what this lead taught us about the domain (a cut stage isn't an answer)
+                                site_key = company.get("live_url") or company.get("website")
+                                learned = {}
+                                if not deadline.partial:
+                                    learned["socials_recovered"] = socials   # "socials" stays homepage-only (scrape_website)
+                                if "xray" in lookups and founder is not None and "xray" not in deadline.cut:
+                                    learned["founder_xray"] = founder
+                                if learned and not company.get("site_status"):
+                                    await asyncio.to_thread(self.enrich_cache.put, site_key, learned)
+
+                            except Exception as e:
+                                print(f"Scrape error for {basic_info['name']}: {e}")
+                            finally:
+                                await browser.close()
+                                try: await p.stop()
+                                except: pass
+
+                    company["partial"]    = deadline.partial
+                    if company["partial"] and update_callback: update_callback(
+                        f"⏱️ {company['name']}: partial data, over budget in {company['partial']} ({deadline.total:.0f}s deadline)")
+                    company["email"]      = ", ".join(emails) if emails else "N/A"
+                    company["phone"]      = phone
+                    company["tech_stack"] = tech_stack
+                    company["source"]     = "Google Maps"
+                    company.update(socials)
+
+                    self.apply_opportunity_signals(company, tech_stack, load_time, target_keyword)
+
+                    if founder:
+                        company['founder_match'] = f"{founder['name']} ({founder['url']})"
+                        company['xray_status']   = "👤 Found Founder"
+                        if update_callback: update_callback(f"   👤 Found: {founder['name']}")
+                    elif founder is False:
+                        company['founder_match'] = "Not Found"
+
+                    company_data    = company
+                    combined_content = f"MAPS INFO: {company.get('raw_maps_text', '')}\n\nWEBSITE INFO:\n{website_content}"
+                    company_content  = await self.run_cpu(html_to_text, combined_content, 5000)
 
                 except Exception as e:
                     print(f"Browser launch error: {e}")
@@ -1510,19 +2562,35 @@ class LeadHunter:
                     try:
                         if update_callback: update_callback(f"AI Analyzing & Saving {company_data['name']}...")
 
-                        score, decision, age, summary, address = await self.score_lead_ai(company_data["name"], company_content or "")
+                        if tiers["llm"]:
+                            self.ladder_stats["llm"] += 1
+                            score_budget, stage_start = SCORE_BUDGET, time.time()
+                            try:
+                                score, decision, age, summary, address = await asyncio.wait_for(
+                                    self.score_lead_ai(company_data["name"], company_content or ""), score_budget)
+                                self.record_stage("score", time.time() - stage_start)
+                            except asyncio.TimeoutError:
+                                self.record_stage("score", time.time() - stage_start, cut=True)
+                                deadline.cut.append("score")
+                                company_data["partial"] = deadline.partial
+                                score, decision, age, _, address = self.heuristic_score(pre_score)
+                                summary = f"AI scoring over budget ({score_budget:.0f}s); tier-0 pre-score {pre_score}"
+                                if update_callback: update_callback(f"⏱️ {company_data['name']}: AI scoring cut, using the pre-score")
+                        else:
+                            score, decision, age, summary, address = self.heuristic_score(pre_score)
                         company_data["score"]    = score
                         company_data["decision"] = decision
                         company_data["age"]      = age
                         company_data["summary"]  = summary
-                        company_data["address"]  = address
+                        company_data["address"]  = site_address if site_address != "N/A" else address
                         # STAGE 2: Deep Enrichment Update — now we have the real email!
                         deep_email = company_data.get("email", "N/A")
                         deep_phone = company_data.get("phone", "N/A")
                         deep_site  = company_data.get("website", "")
                         
                         is_p_val_d, is_m_val_d, fine_phone_d, fine_mobile_d, chat_widget_d = validate_and_parse_contact_fields(
-                            deep_phone, deep_site, deep_email
+                            deep_phone, deep_site, deep_email, phone_region,
+                            is_workspace=await check_google_workspace_async(deep_email)
                         )
                         if fine_mobile_d != "N/A": fine_mobile = fine_mobile_d; is_m_val = is_m_val_d
                         if fine_phone_d  != "N/A": fine_phone  = fine_phone_d;  is_p_val = is_p_val_d
@@ -1545,19 +2613,27 @@ class LeadHunter:
                             
                         # Update the CSV row with full enriched data
                         try:
-                            df_update = pd.read_csv(local_csv)
-                            idx = df_update.index[df_update['Company Name'] == name].tolist()
-                            if idx:
-                                df_update.loc[idx[0], 'Emails']       = deep_email
-                                df_update.loc[idx[0], 'Phone']        = fine_phone
-                                df_update.loc[idx[0], 'Phone Valid']  = "YES" if is_p_val else "NO"
-                                df_update.loc[idx[0], 'Mobile']       = fine_mobile
-                                df_update.loc[idx[0], 'Mobile Valid'] = "YES" if is_m_val else "NO"
-                                df_update.loc[idx[0], 'Chat Option']  = chat_widget
-                                df_update.to_csv(local_csv, index=False)
+                            await self.run_cpu(lead_backup.update_row, local_csv, name, {
+                                'Emails':       deep_email,
+                                'Phone':        fine_phone,
+                                'Phone Valid':  "YES" if is_p_val else "NO",
+                                'Mobile':       fine_mobile,
+                                'Mobile Valid': "YES" if is_m_val else "NO",
+                                'Chat Option':  chat_widget,
+                                'Partial':      company_data.get("partial", ""),
+                            }, offload=True)
                         except:
                             pass
 
+                        # Snapshot the texts this lead was scored on (re-scoring later needs no browser)
+                        try:
+                            lead_record = {k: v for k, v in company_data.items() if k != "raw_maps_text"}
+                            lead_record.update({"load_time": load_time, "site_address": site_address})
+                            self.snapshots.record(company_data["name"], target_keyword, company_data.get("raw_maps_text", ""),
+                                                  website_content, lead_record)
+                        except Exception as snap_err:
+                            print(f"Snapshot error for {company_data['name']}: {snap_err}")
+
                         summary_lead = {
                             "keyword":  target_keyword,
                             "name":     company_data["name"],
@@ -1579,6 +2655,7 @@ class LeadHunter:
                             "score":    company_data.get("score", 0),
                             "decision": company_data.get("decision", "N/A"),
                             "summary":  str(company_data.get("summary", ""))[:100] + "...",
+                            "partial":  company_data.get("partial", ""),
                             "date_added": (datetime.datetime.now() + datetime.timedelta(hours=5, minutes=30)).strftime("%Y-%m-%d %H:%M:%S IST")
                         }
                         final_leads.append(summary_lead)
@@ -1600,6 +2677,48 @@ class LeadHunter:
             if len(final_leads) >= self.limit:
                 break
 
+        ls = self.ladder_stats
+        if update_callback: update_callback(
+            f"🪜 Ladder: Tier-0 {ls['tier0']} → Browser {ls['browser']} → Socials {ls['socials']} "
+            f"→ X-Ray {ls['xray']} → LLM {ls['llm']}")
+        if update_callback and self.local_gate: update_callback(
+            f"🧠 Local scorer: {self.ai_stats['local']} decided locally, {self.ai_stats['gemini']} escalated to Gemini")
+        mx = get_resolver().stats
+        if update_callback: update_callback(
+            f"📮 MX cache: {mx['hits']} hits, {mx['queries']} DNS queries, {mx['negative']} negative, {mx['errors']} failed")
+        ps = self.probe_stats
+        if update_callback and ps["pages"]: update_callback(
+            f"📦 Page probe: {ps['pages']} sites, {ps['html_chars'] / 1e6:.1f}M chars of HTML kept in-browser, "
+            f"{ps['returned_chars'] / 1e3:.0f}K returned")
+        if update_callback and self.preflight.summary(): update_callback(f"🩺 Site pre-flight: {self.preflight.summary()}")
+        if update_callback and self.enrich_cache.summary(): update_callback(f"💾 Enrichment cache: {self.enrich_cache.summary()}")
+        if update_callback and backfill_queued: update_callback(
+            f"🗂️ Backfill: {backfill_queued} incomplete existing leads queued ({self.backfill.pending()} pending) — "
+            f"run `python backfill_queue.py sweep`")
+        if update_callback: update_callback(f"🛡️ Egress health: {self.proxies.summary()}")
+        if update_callback and self.serp.summary(): update_callback(f"🔎 SERP providers: {self.serp.summary()}")
+        fs = self.founder_stats
+        if update_callback and fs["companies"]: update_callback(
+            f"👤 Founder X-ray: {fs['companies']} companies, {fs['batch_queries']} batched + {fs['single_queries']} single queries "
+            f"({fs['batch_hits']} resolved by batches)")
+        ss = self.social_stats
+        if update_callback and ss["leads"]: update_callback(
+            f"🔗 Social recovery: {ss['leads']} leads, {ss['combined']} profiles from the combined query, "
+            f"{ss['fallbacks']} per-platform fallback searches")
+        pl = self.parallel_stats
+        if update_callback and pl["leads"]: update_callback(
+            f"⚡ Parallel enrichment: {pl['leads']} leads, {pl['tasks']} lookups in {pl['wall']:.0f}s "
+            f"(vs {pl['serial']:.0f}s in series), {pl['timeouts']} timed out")
+        if update_callback and self.stage_stats: update_callback(
+            f"⏱️ Stage time ({LEAD_DEADLINE:.0f}s lead deadline, {sum(1 for l in final_leads if l.get('partial'))} partial leads): " +
+            ", ".join(f"{stage} {st['seconds'] / st['runs']:.1f}s avg / {st['max']:.1f}s max ({st['cut']} cut)"
+                      for stage, st in self.stage_stats.items()))
+        cs = self.consent_stats
+        if update_callback and cs["contexts"]: update_callback(
+            f"🍪 Consent state: reused in {cs['reused']}/{cs['contexts']} browsers, {cs['walls']} walls clicked")
+        if update_callback:
+            for line in self.cpu.summary(self.cpu_stats):
+                update_callback(f"🧮 CPU pool ({self.cpu.workers} workers) {line}")
         if update_callback: update_callback(
             f"Mission Complete: {len(final_leads)}/{self.limit} unique leads inserted — {target_keyword}")
         return final_leads
@@ -1659,10 +2778,8 @@ class LeadHunter:
                         page, target_keyword, is_dork=is_already_dork,
                         update_callback=update_callback, start=current_start)
 
-                    page_title = await page.title()
-                    if "Captcha" in page_title or "Before you continue" in page_title:
-                        blocker_status = "🔴 CAPTCHA Block"
-                    elif not profiles and current_start == search_start:
+                if not signal_mode:
+                    if not profiles and current_start == search_start and not self.egress_blocked(page):
                         # --- Fallback chain (only on first page of a fresh hunt) ---
                         if update_callback: update_callback("⚠️ No results. Trying Broad LinkedIn Hunt...")
                         broad_dork = f'site:linkedin.com/in/ {target_keyword}'
@@ -1670,13 +2787,13 @@ class LeadHunter:
                             page, broad_dork, is_dork=True,
                             update_callback=update_callback, start=current_start)
 
-                        if not profiles:
+                        if not profiles and not self.egress_blocked(page):
                             if update_callback: update_callback("🧬 Aggressive Mode: Natural Language Search...")
                             profiles = await self.scrape_linkedin_profiles(
                                 page, f'{target_keyword} linkedin profiles',
                                 is_dork=False, update_callback=update_callback, start=current_start)
 
-                        if not profiles:
+                        if not profiles and not self.egress_blocked(page):
                             if update_callback: update_callback("☢️ Final Attempt: Nuclear LinkedIn Hunt...")
                             profiles = await self.scrape_linkedin_profiles(
                                 page, f'{target_keyword} linkedin',
@@ -1684,6 +2801,14 @@ class LeadHunter:
 
                     blocker_status = "🟢 OK" if profiles else "🟡 No Results Found"
 
+                # --- CIRCUIT BREAKER: never fire more queries into a blocked session ---
+                if self.egress_blocked(page):
+                    if update_callback: update_callback("Blocker Status: 🔴 CAPTCHA Block")
+                    browser, page = await self.rotate_browser(p, browser, update_callback)
+                    if page is None:
+                        break
+                    continue   # same offset, fresh egress
+
                 if update_callback: update_callback(f"Blocker Status: {blocker_status}")
 
                 if not profiles:
@@ -1749,8 +2874,12 @@ class LeadHunter:
                 else:
                     break   # Target satisfied
 
-            await browser.close()
+            if browser: await browser.close()
 
+        if update_callback and self.local_gate:
+            update_callback(f"🧠 Local scorer: {self.ai_stats['local']} decided locally, {self.ai_stats['gemini']} escalated to Gemini")
+        if update_callback: update_callback(f"🛡️ Egress health: {self.proxies.summary()}")
+        if update_callback and self.serp.summary(): update_callback(f"🔎 SERP providers: {self.serp.summary()}")
         if update_callback:
             update_callback(
                 f"🎯 LinkedIn Mission Complete: {target_keyword} "
@@ -1788,131 +2917,85 @@ class LeadHunter:
         Executes a mission using a SPECIFIC dork from the sidebar toolkit.
         Scrape → Analyze → Save logic to ensure 0 'Pending' results.
         """
-        async with async_playwright() as p:
-            browser, page = await self.get_browser_and_page(p)
-            
-            if update_callback: update_callback(f"Deploying Bot for X-Ray: {dork_query}")
-            
-            # Use Google results for safety
-            try:
-                await page.goto(f"https://www.google.com/search?q={dork_query.replace(' ', '+')}", wait_until="networkidle")
-            except:
-                await page.goto(f"https://www.google.com/search?q={dork_query.replace(' ', '+')}")
+        if update_callback: update_callback(f"Deploying Bot for X-Ray: {dork_query}")
+        
+        # Cheap SERP providers first; a browser is only launched if they come back empty
+        serp_results = await self.serp.search(dork_query, update_callback=update_callback, kind="xray")
+        if not serp_results:
+            # fresh: an empty browserless answer must not be served back from the cache here
+            async with async_playwright() as p:
+                browser, page = await self.get_browser_and_page(p)
+                serp_results = await self.serp.search(dork_query, page=page, update_callback=update_callback, kind="xray", fresh=True)
+                # One retry on a fresh egress if this one is blocked
+                if not serp_results and self.egress_blocked(page):
+                    browser, page = await self.rotate_browser(p, browser, update_callback)
+                    if page is not None:
+                        serp_results = await self.serp.search(dork_query, page=page, update_callback=update_callback, kind="xray", fresh=True)
+                # FREE RAM
+                if browser: await browser.close()
+
+        # Check for CAPTCHA/Blocking
+        page_title = f"{len(serp_results)} SERP results" if serp_results else "no results from any SERP provider"
+        if not serp_results:
+            print(f"⚠️ CAPTCHA/Consent block detected: {page_title}")
+            if update_callback: update_callback(f"⚠️ Google Blocked Request ({page_title})")
+
+        profiles = []
+        processed_urls = set()
+        
+        for result in serp_results:
+            href = result["url"]
+            if "linkedin.com" in href or "instagram.com" in href:
+                clean_url = href.split('&')[0].split('?')[0]
+                if clean_url in processed_urls: continue
+                processed_urls.add(clean_url)
+                
+                name = result["title"] or "Lead"
+                snippet = result["snippet"] or "No snippet"
+                    
+                profiles.append({"name": name, "url": clean_url, "snippet": snippet})
+                if update_callback: update_callback(f"📍 Discovered: {name}")
+        
+        if not profiles:
+             msg = f"⚠️ No profiles found via X-Ray. Page Title: {page_title}"
+             print(msg)
+             if update_callback: update_callback(msg)
+
+        final_leads = []
+        for i, profile in enumerate(profiles):
+            if update_callback: update_callback(f"AI Analyzing: {profile['name']}")
+            if progress_callback:
+                progress_callback((i + 1) / len(profiles))
             
-            await self.sleep_random(5, 8)
+            # Analyze snippet
+            score, decision, _, summary = await self.score_linkedin_ai(profile["name"], profile["snippet"])
             
-            # Handle Google Consent Screen (if any)
-            try:
-                consent_selectors = [
-                    'button[aria-label="Accept all"]',
-                    'button[aria-label="Agree"]',
-                    'button:has-text("Accept all")',
-                    'button:has-text("I agree")',
-                    'div[role="button"]:has-text("Accept all")',
-                ]
-                for selector in consent_selectors:
-                    if await page.query_selector(selector):
-                        msg = f"Found consent screen, clicking {selector}..."
-                        print(msg)
-                        if update_callback: update_callback(msg)
-                        await page.click(selector)
-                        await self.sleep_random(2, 4)
-                        break
-            except:
-                pass
-
-            # Check for CAPTCHA/Blocking
-            page_title = await page.title()
-            if "Before you continue" in page_title or "Captcha" in page_title:
-                print(f"⚠️ CAPTCHA/Consent block detected: {page_title}")
-                if update_callback: update_callback(f"⚠️ Google Blocked Request ({page_title})")
-
-            links_elements = await page.query_selector_all('a')
-            profiles = []
-            processed_urls = set()
+            lead = {
+                "name": profile["name"],
+                "url": profile["url"],
+                "score": score,
+                "decision": decision,
+                "summary": summary,
+                "source": "LinkedIn " + ("Post" if "Post" in source.capitalize() else "Profile") if "linkedin" in source.lower() else source.capitalize()
+            }
             
-            for link in links_elements:
-                href = await link.get_attribute('href')
-                if href and ("linkedin.com" in href or "instagram.com" in href):
-                    # Basic cleaning
-                    if "/url?q=" in href:
-                        match = re.search(r'url\?q=([^&]*)', href)
-                        if match: href = match.group(1)
-                    clean_url = href.split('&')[0].split('?')[0]
-                    if clean_url in processed_urls: continue
-                    processed_urls.add(clean_url)
-                    
-                    try:
-                        container = await page.evaluate_handle('el => el.closest(".g, .MjjYud")', link)
-                        if container:
-                            h3 = await container.as_element().query_selector('h3')
-                            name = await h3.inner_text() if h3 else "Lead"
-                            snippet_el = await container.as_element().query_selector('.VwiC3b, .y355M')
-                            snippet = await snippet_el.inner_text() if snippet_el else "No snippet"
-                        else:
-                            name, snippet = "Lead", "No snippet"
-                    except:
-                        name, snippet = "Lead", "No snippet"
-                        
-                    profiles.append({"name": name, "url": clean_url, "snippet": snippet})
-                    if update_callback: update_callback(f"📍 Discovered: {name}")
-
-            # FREE RAM
-            await browser.close()
+            # Save using the smart router
+            is_saved = self.gsheets.save_lead(lead, query=dork_query, source=source)
+            if not is_saved:
+                if update_callback: update_callback(f"Error saving {profile['name']}")
+                continue
+            final_leads.append(lead)
             
-            if not profiles:
-                 msg = f"⚠️ No profiles found via X-Ray. Page Title: {page_title}"
-                 print(msg)
-                 if update_callback: update_callback(msg)
-
-            final_leads = []
-            for i, profile in enumerate(profiles):
-                if update_callback: update_callback(f"AI Analyzing: {profile['name']}")
-                if progress_callback:
-                    progress_callback((i + 1) / len(profiles))
-                
-                # Analyze snippet
-                score, decision, _, summary = await self.score_linkedin_ai(profile["name"], profile["snippet"])
-                
-                lead = {
-                    "name": profile["name"],
-                    "url": profile["url"],
-                    "score": score,
-                    "decision": decision,
-                    "summary": summary,
-                    "source": "LinkedIn " + ("Post" if "Post" in source.capitalize() else "Profile") if "linkedin" in source.lower() else source.capitalize()
-                }
-                
-                # Save using the smart router
-                is_saved = self.gsheets.save_lead(lead, query=dork_query, source=source)
-                if not is_saved:
-                    if update_callback: update_callback(f"Error saving {profile['name']}")
-                    continue
-                final_leads.append(lead)
-                
-            if update_callback: update_callback(f"Mission Done. {len(final_leads)} Leads saved to GSheets.")
-            return final_leads
+        if update_callback: update_callback(f"Mission Done. {len(final_leads)} Leads saved to GSheets.")
+        return final_leads
 
     def detect_source(self, query):
         """
         Smart detection: If it looks like a person search (CEO, Founder, Manager, LinkedIn)
         it goes to LinkedIn. Otherwise, it detects niche-specific directories.
         """
-        q_lower = query.lower()
-        person_terms = ["ceo", "founder", "owner", "manager", "director", "head", "vp", "president", "linkedin", "profile"]
-        job_terms = ["hiring", "job", "vacancy", "career", "work at"]
-        property_terms = ["flat for sale", "property in", "resale property", "house for sale", "rent plot"]
-        edu_terms = ["college", "university", "admission", "course info"]
-
-        if any(term in q_lower for term in person_terms):
-            return "linkedin"
-        if any(term in q_lower for term in job_terms):
-            return "naukri"
-        if any(term in q_lower for term in property_terms):
-            return "99acres"
-        if any(term in q_lower for term in edu_terms):
-            return "shiksha"
-        return "google"
+        # Term tables live in signal_engine.SIGNATURES ("source" group, checked in order)
+        return first_label(query, "source", "google")
 
     async def run_smart_mission(self, query, update_callback=None):
         source = self.detect_source(query)
@@ -1957,7 +3040,10 @@ class LeadHunter:
                         
                         html = await page.content()
                         
-                        extracted = await self.universal_ai_extract(html, prompt_type=prompt_type)
+                        if prompt_type in PORTAL_FIELDS:
+                            extracted = await self.extract_portal_record(html, prompt_type)
+                        else:
+                            extracted = await self.universal_ai_extract(html, prompt_type=prompt_type)
                         
                         if extracted:
                             # If it returns a list, extend, else append
@@ -1983,6 +3069,8 @@ class LeadHunter:
             finally:
                 await browser.close()
         
+        if update_callback:
+            for line in self.extraction_summary(): update_callback(line)
         return results
 
     async def run_naukri_mission(self, search_url, update_callback=None):
@@ -2010,16 +3098,9 @@ class LeadHunter:
                         clean_search = search_url.split('/')[-1].replace('-', ' ')
                         query = f'site:naukri.com/job-listings "{clean_search}"'
                     
-                    import urllib.parse
-                    google_url = f"https://www.google.com/search?q={urllib.parse.quote(query)}"
-                    await page.goto(google_url, wait_until="load")
-                    await self.sleep_random(3, 5)
-                    
                     # Extract from Google Results
-                    job_links = await page.evaluate("""() => {
-                        const links = Array.from(document.querySelectorAll('a[href*="naukri.com/job-listings-"]'));
-                        return links.map(a => a.href).slice(0, 10);
-                    }""")
+                    serp_results = await self.serp.search(query, page=page, update_callback=update_callback, kind="naukri")
+                    job_links = [r["url"] for r in serp_results if "naukri.com/job-listings-" in r["url"]][:10]
                     if update_callback: update_callback(f"🧬 SERP Backdoor: Found {len(job_links)} jobs via Google.")
                 else:
                     # Humanized Scroll Loop (using wheel to mimic human behavior)
@@ -2066,6 +3147,8 @@ class LeadHunter:
                     await browser.close()
                     gc.collect() 
         
+        if update_callback:
+            for line in self.extraction_summary(): update_callback(line)
         return results
 
 if __name__ == "__main__":
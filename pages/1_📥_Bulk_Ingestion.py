@@ -8,6 +8,7 @@ import sys
 # Ensure parent directory is in path so we can import project modules if needed
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dashboard import save_to_global_db, sync_to_cloud
+from lead_hunter import validate_contacts_frame, DEFAULT_CITY_MAP, SUBDOMAIN_REGIONS
 
 st.set_page_config(page_title="Bulk Ingestion - Lead Hunter", page_icon="📥", layout="wide")
 
@@ -58,6 +59,15 @@ uploaded_files = st.file_uploader(
     accept_multiple_files=True
 )
 
+# Uploads are tagged by file name, which rarely names a city: let the user say where the numbers are from
+region_choice = st.selectbox(
+    "📞 Default phone region (numbers without a country code)",
+    ["Auto (from city / source tag)"] + sorted(set(SUBDOMAIN_REGIONS.values())),
+)
+default_region = None if region_choice.startswith("Auto") else region_choice
+
+check_workspace = st.checkbox("📮 Detect Google Workspace from email domains (one cached MX lookup per domain)", value=False)
+
 # --- SECTION 3: THE PARSING PIPELINE ---
 if st.button("🚀 Process & Sync All Active Repositories", type="primary"):
     all_leads = []
@@ -106,6 +116,19 @@ if st.button("🚀 Process & Sync All Active Repositories", type="primary"):
             for col in ['Website', 'Mobile', 'Emails', 'Keyword', 'Score']:
                 if col not in master_leads_df.columns:
                     master_leads_df[col] = "N/A" if col != 'Score' else 50
+
+            # Normalize phones in one pass: distinct numbers parsed once, region inferred from the city/source tag
+            region_col = next((c for c in ['city', 'location', 'address'] if c in master_leads_df.columns), 'Keyword')
+            with st.spinner(f"Validating contacts for {len(master_leads_df)} rows..."):
+                master_leads_df = validate_contacts_frame(
+                    master_leads_df,
+                    keyword_col=region_col,
+                    default_region=default_region,
+                    city_map=st.session_state.get('city_map', DEFAULT_CITY_MAP),
+                    check_workspace=check_workspace,
+                )
+            valid_mobiles = int((master_leads_df['Mobile Valid'] == "YES").sum())
+            st.info(f"📱 {valid_mobiles} verified mobiles across {len(master_leads_df)} rows.")
                     
             payload = master_leads_df.to_dict(orient='records')
             
@@ -0,0 +1,142 @@
+"""
+Disk-backed SERP cache: parsed results keyed by normalized query + page offset.
+
+SerpRouter consults it before any provider, so re-running a keyword, the
+duplicate fill-in path, or several Naukri jobs from one company cost no
+Google traffic. Entries expire per query kind and the least recently used
+rows are evicted beyond SERP_CACHE_MAX.
+
+Config:
+    SERP_CACHE_PATH        default <HUNTER_CACHE_DIR>/serp_cache.sqlite
+    SERP_CACHE_MAX         max entries (default 20000)
+    SERP_TTL_<KIND>        hours, overrides TTL_HOURS below (e.g. SERP_TTL_XRAY=6)
+
+Usage:
+    python serp_cache.py stats | purge
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.getenv("HUNTER_CACHE_DIR", ".hunter_cache")
+SERP_CACHE_PATH = os.getenv("SERP_CACHE_PATH", os.path.join(CACHE_DIR, "serp_cache.sqlite"))
+SERP_CACHE_MAX = int(os.getenv("SERP_CACHE_MAX", 20000))
+
+# Company facts change slowly; prospecting lists and posts go stale fast
+TTL_HOURS = {
+    "website": 24 * 30,
+    "social": 24 * 30,
+    "linkedin_company": 24 * 30,
+    "founder": 24 * 14,
+    "xray": 24,
+    "posts": 6,
+    "naukri": 24,
+    "default": 24 * 3,
+}
+EMPTY_TTL_HOURS = 24    # "no results" is remembered, but not for long
+EVICT_EVERY = 200       # writes between LRU sweeps
+
+
+def normalize_query(query):
+    """Case / whitespace / quote-style insensitive key; operators and quoting are kept."""
+    query = query.replace("“", '"').replace("”", '"').replace("’", "'")
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+def ttl_seconds(kind):
+    hours = os.getenv(f"SERP_TTL_{kind.upper()}")
+    return 3600 * float(hours if hours else TTL_HOURS.get(kind, TTL_HOURS["default"]))
+
+
+class SerpCache:
+    def __init__(self, path=SERP_CACHE_PATH, max_entries=SERP_CACHE_MAX):
+        self.path = path
+        self.max_entries = max_entries
+        self.writes = 0
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evicted": 0}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""CREATE TABLE IF NOT EXISTS serp (
+                            query TEXT NOT NULL, start INTEGER NOT NULL, kind TEXT,
+                            results TEXT NOT NULL, expires REAL NOT NULL, last_used REAL NOT NULL,
+                            PRIMARY KEY (query, start))""")
+            db.execute("CREATE INDEX IF NOT EXISTS serp_lru ON serp (last_used)")
+
+    def _db(self):
+        # One short-lived connection per call: missions run on several threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, query, start=0):
+        """Cached results, or None when absent / expired."""
+        key, now = normalize_query(query), time.time()
+        try:
+            with self._db() as db:
+                row = db.execute("SELECT results, expires FROM serp WHERE query = ? AND start = ?", (key, start)).fetchone()
+                if row and row[1] > now:
+                    db.execute("UPDATE serp SET last_used = ? WHERE query = ? AND start = ?", (now, key, start))
+                    self.stats["hits"] += 1
+                    return json.loads(row[0])
+        except sqlite3.Error as e:
+            print(f"SERP cache read error: {e}")
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, query, start, results, kind="default"):
+        ttl = ttl_seconds(kind) if results else min(ttl_seconds(kind), 3600 * EMPTY_TTL_HOURS)
+        now = time.time()
+        try:
+            with self._db() as db:
+                db.execute("INSERT OR REPLACE INTO serp VALUES (?, ?, ?, ?, ?, ?)",
+                           (normalize_query(query), start, kind, json.dumps(results), now + ttl, now))
+            self.stats["stores"] += 1
+            with self.lock:
+                self.writes += 1
+                sweep = self.writes % EVICT_EVERY == 0
+            if sweep:
+                self.evict()
+        except sqlite3.Error as e:
+            print(f"SERP cache write error: {e}")
+
+    def evict(self):
+        """Drops expired rows, then the least recently used beyond max_entries."""
+        with self._db() as db:
+            removed = db.execute("DELETE FROM serp WHERE expires <= ?", (time.time(),)).rowcount
+            count = db.execute("SELECT COUNT(*) FROM serp").fetchone()[0]
+            if count > self.max_entries:
+                removed += db.execute("DELETE FROM serp WHERE rowid IN (SELECT rowid FROM serp ORDER BY last_used LIMIT ?)",
+                                      (count - self.max_entries,)).rowcount
+        self.stats["evicted"] += removed
+        return removed
+
+    def summary(self):
+        s = self.stats
+        looked = s["hits"] + s["misses"]
+        return f"{s['hits']}/{looked} hits ({s['hits'] / looked:.0%}), {s['stores']} stored" if looked else ""
+
+
+_cache = None
+
+
+def get_serp_cache():
+    global _cache
+    if _cache is None:
+        _cache = SerpCache()
+    return _cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SERP result cache.")
+    parser.add_argument("command", choices=["stats", "purge"])
+    args = parser.parse_args()
+    cache = get_serp_cache()
+    if args.command == "purge":
+        print(f"Evicted {cache.evict()} rows")
+    with cache._db() as db:
+        for kind, n, live in db.execute("SELECT kind, COUNT(*), SUM(expires > ?) FROM serp GROUP BY kind", (time.time(),)):
+            print(f"{kind:<18} {n:>6} entries ({live} live)")
@@ -0,0 +1,340 @@
+"""
+SERP provider layer: one search() call, normalized results, cheapest backend first.
+
+Every provider returns [{"title", "url", "snippet", "position"}] (position is
+1-based across pages). SerpRouter tries providers in cost order and falls
+through on a block, an error or an empty page:
+
+    http        cost 1   Google's basic HTML results page over plain HTTP
+                         (shares the proxy pool's egresses and CAPTCHA breakers)
+    searxng     cost 2   SearxNG-compatible JSON API (enabled by SEARXNG_URL)
+    playwright  cost 10  the caller's browser page via LeadHunter.google_goto
+
+Config:
+    SERP_PROVIDERS   comma-separated subset / order override (default "http,searxng,playwright")
+    SEARXNG_URL      e.g. http://localhost:8888
+
+Usage:
+    python serp_providers.py search "plumbers miami" [--start 10]
+    python serp_providers.py stub                     # fake SERP (HTML + SearxNG JSON) on :8765
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import urllib.parse
+
+from http_client import fetch
+from proxy_pool import FakeSERP, get_proxy_pool, google_url, is_block_page, start_stub
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+SEARXNG_URL = os.getenv("SEARXNG_URL", "").rstrip("/")
+SERP_PROVIDERS = os.getenv("SERP_PROVIDERS", "http,searxng,playwright")
+PROVIDER_COOLDOWN = 120      # seconds a failing provider is skipped (doubles per repeat)
+MAX_PROVIDER_COOLDOWN = 1800
+
+# Basic-HTML Google is only served to very old browsers
+BASIC_HTML_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Lynx/2.9.0 Safari/537.36"
+
+RESULT_CONTAINER_CLASSES = ("g", "MjjYud", "Gx5Zad", "tF2Cxc")
+SNIPPET_CLASSES = ("VwiC3b", "y355M", "IsZvec", "MUY17c", "kb0BC", "s3v9rd")
+
+
+class SerpBlocked(Exception):
+    """The backend answered with a block / CAPTCHA / consent page instead of results."""
+
+
+def clean_result_url(href):
+    """Unwraps Google's /url?q= redirects; None for Google-internal links."""
+    if not href:
+        return None
+    if "/url?" in href:
+        qs = urllib.parse.parse_qs(urllib.parse.urlsplit(href).query)
+        href = (qs.get("q") or qs.get("url") or [""])[0]
+    if not href.startswith("http"):
+        return None
+    host = urllib.parse.urlsplit(href).hostname or ""
+    if "google." in host or host.endswith("googleusercontent.com"):
+        return None
+    return href
+
+
+def _classes(el):
+    return (el.get("class") or "").split()
+
+
+def parse_google_html(html, start=0):
+    """Organic results from a Google results page (full or basic-HTML layout)."""
+    if not html or lxml_html is None:
+        return []
+    tree = lxml_html.fromstring(html)
+    results, seen = [], set()
+    for a in tree.iter("a"):
+        url = clean_result_url(a.get("href"))
+        if not url or url in seen:
+            continue
+        box = next((anc for anc in a.iterancestors("div")
+                    if anc.get("data-hveid") is not None or any(c in RESULT_CONTAINER_CLASSES for c in _classes(anc))), None)
+        if box is None:
+            continue
+        h3 = a.find(".//h3")
+        if h3 is None:
+            h3 = box.find(".//h3")
+        title = " ".join((h3.text_content() if h3 is not None else a.text_content()).split())
+        if not title:
+            continue
+        snippet = ""
+        for el in box.iter("div", "span"):
+            if any(c in SNIPPET_CLASSES for c in _classes(el)) and el is not h3:
+                snippet = " ".join(el.text_content().split())
+                if snippet and snippet != title:
+                    break
+        seen.add(url)
+        results.append({"title": title, "url": url, "snippet": snippet, "position": start + len(results) + 1})
+    return results
+
+
+# One evaluate instead of an await per <a>: same container / snippet rules as parse_google_html
+SERP_RESULTS_JS = r"""
+([containers, snippets]) => {
+  const boxSel = containers.map(c => "." + c).join(", ") + ", div[data-hveid]";
+  const snipSel = snippets.map(c => "." + c).join(", ");
+  const out = [];
+  for (const a of document.querySelectorAll("a[href]")) {
+    const box = a.closest(boxSel);
+    if (!box) continue;
+    const h3 = a.querySelector("h3") || box.querySelector("h3");
+    const title = ((h3 ? h3.innerText : a.innerText) || "").trim();
+    const snip = box.querySelector(snipSel);
+    out.push({href: a.getAttribute("href"), title, snippet: snip ? snip.innerText.trim() : ""});
+  }
+  return out;
+}
+"""
+
+
+def consent_cookies(path):
+    """Google cookies from the saved consent storage_state (see LeadHunter.save_consent_state)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return {c["name"]: c["value"] for c in state.get("cookies", []) if "google." in c.get("domain", "")}
+    except Exception:
+        return {}
+
+
+class SerpProvider:
+    name = "base"
+    cost = 0
+    own_breaker = False   # True: failures already feed the proxy pool's per-egress breakers
+
+    def configured(self):
+        """False when this provider can never answer here (no endpoint set), as opposed to not right now."""
+        return True
+
+    def available(self, page=None):
+        return True
+
+    async def search(self, query, start=0, page=None):
+        raise NotImplementedError
+
+
+class GoogleHTTPProvider(SerpProvider):
+    """Google's basic HTML results over plain HTTP, through the shared egress pool."""
+    name = "http"
+    cost = 1
+    own_breaker = True
+
+    def __init__(self, proxies=None, cookie_path=None):
+        self.proxies = proxies or get_proxy_pool()
+        self.cookie_path = cookie_path
+
+    def available(self, page=None):
+        return bool(self.proxies.available()) and lxml_html is not None
+
+    async def search(self, query, start=0, page=None):
+        egress = self.proxies.acquire()
+        if not self.proxies.allow(egress):
+            raise SerpBlocked(f"{egress.name} cooling down")
+        path = f"/search?q={urllib.parse.quote_plus(query)}&hl=en&gbv=1" + (f"&start={start}" if start else "")
+        try:
+            try:
+                resp = await fetch(google_url(path), headers={"User-Agent": BASIC_HTML_UA, "Accept-Language": "en-US,en;q=0.9"},
+                                   cookies=consent_cookies(self.cookie_path) if self.cookie_path else None,
+                                   proxy=egress.http_proxy())
+            except Exception:
+                self.proxies.report(egress, ok=False)
+                raise
+        finally:
+            self.proxies.release(egress)   # no-op after report(); frees the half-open trial if we were cancelled
+        blocked = resp["status"] == 429 or is_block_page(resp["url"], resp["text"])
+        self.proxies.report(egress, ok=not blocked, latency=resp["elapsed"], blocked=blocked)
+        if blocked:
+            raise SerpBlocked(f"{egress.name}: {resp['url'] if resp['status'] != 429 else 429}")
+        return parse_google_html(resp["text"], start)
+
+
+class SearxNGProvider(SerpProvider):
+    """Any SearxNG-compatible /search?format=json endpoint."""
+    name = "searxng"
+    cost = 2
+
+    def __init__(self, base_url=None):
+        self.base_url = (base_url if base_url is not None else SEARXNG_URL).rstrip("/")
+
+    def configured(self):
+        return bool(self.base_url)
+
+    def available(self, page=None):
+        return bool(self.base_url)
+
+    async def search(self, query, start=0, page=None):
+        params = urllib.parse.urlencode({"q": query, "format": "json", "pageno": start // 10 + 1})
+        resp = await fetch(f"{self.base_url}/search?{params}", headers={"Accept": "application/json"})
+        if resp["status"] != 200:
+            raise SerpBlocked(f"searxng HTTP {resp['status']}")
+        items = json.loads(resp["text"]).get("results", [])
+        return [{"title": r.get("title", ""), "url": r.get("url", ""), "snippet": r.get("content", ""),
+                 "position": start + i + 1} for i, r in enumerate(items) if r.get("url")]
+
+
+class PlaywrightGoogleProvider(SerpProvider):
+    """The caller's browser page; all results read in one evaluate."""
+    name = "playwright"
+    cost = 10
+    own_breaker = True
+
+    def __init__(self, hunter):
+        self.hunter = hunter
+
+    def available(self, page=None):
+        return page is not None and not self.hunter.egress_blocked(page)
+
+    async def search(self, query, start=0, page=None):
+        path = f"/search?q={urllib.parse.quote_plus(query)}" + (f"&start={start}" if start else "")
+        if not await self.hunter.google_goto(page, path, wait_until="load", timeout=40000):
+            raise SerpBlocked("browser egress blocked" if self.hunter.egress_blocked(page) else "navigation failed")
+        await self.hunter.sleep_random(2, 4)
+        # Human scroll (bot detection + lazy-loaded results)
+        await page.evaluate("window.scrollBy(0, document.body.scrollHeight / 2)")
+        raw = await page.evaluate(SERP_RESULTS_JS, [list(RESULT_CONTAINER_CLASSES), list(SNIPPET_CLASSES)])
+        results, seen = [], set()
+        for r in raw:
+            url = clean_result_url(r.get("href"))
+            if not url or url in seen or not r.get("title"):
+                continue
+            seen.add(url)
+            results.append({"title": r["title"], "url": url, "snippet": r.get("snippet", ""),
+                            "position": start + len(results) + 1})
+        return results
+
+
+class SerpRouter:
+    """
+    Cheapest working provider first; failing providers back off like the egress
+    breakers. With a cache (serp_cache.SerpCache), answers are served from disk first.
+    """
+
+    def __init__(self, providers, cache=None):
+        self.cache = cache
+        order = [n.strip() for n in SERP_PROVIDERS.split(",") if n.strip()]
+        by_name = {p.name: p for p in providers}
+        self.providers = sorted((by_name[n] for n in order if n in by_name), key=lambda p: p.cost)
+        self.backoff = {}   # name -> (until, streak)
+        self.stats = {p.name: {"calls": 0, "results": 0, "failures": 0, "empty": 0} for p in self.providers}
+
+    def _ready(self, provider, page):
+        until, _ = self.backoff.get(provider.name, (0, 0))
+        return time.monotonic() >= until and provider.available(page)
+
+    async def search(self, query, start=0, page=None, update_callback=None, kind="default", fresh=False):
+        """
+        Normalized results from the first provider that returns any; [] if none does.
+        `kind` picks the cache TTL (see serp_cache.TTL_HOURS); fresh=True skips the cache read.
+        """
+        if self.cache is not None and not fresh:
+            cached = self.cache.get(query, start)
+            if cached is not None:
+                return cached
+        answered, complete = False, True   # complete: every provider in the chain got to answer
+        for provider in self.providers:
+            if not self._ready(provider, page):
+                complete = complete and not provider.configured()
+                continue
+            st = self.stats[provider.name]
+            st["calls"] += 1
+            try:
+                results = await provider.search(query, start=start, page=page)
+            except Exception as e:
+                st["failures"] += 1
+                if not provider.own_breaker:
+                    _, streak = self.backoff.get(provider.name, (0, 0))
+                    cooldown = min(MAX_PROVIDER_COOLDOWN, PROVIDER_COOLDOWN * 2 ** streak)
+                    self.backoff[provider.name] = (time.monotonic() + cooldown, streak + 1)
+                if update_callback: update_callback(f"↪️ SERP {provider.name} unavailable ({str(e)[:60]}) — trying next provider")
+                complete = False
+                continue
+            self.backoff.pop(provider.name, None)
+            answered = True
+            if not results:
+                st["empty"] += 1
+                continue
+            st["results"] += len(results)
+            if self.cache is not None:
+                self.cache.put(query, start, results, kind)
+            return results
+        # Only a real "no results" is remembered: every provider answered empty. A skipped or
+        # failing one (no page for the browser, a block) may still find something next time
+        if answered and complete and self.cache is not None:
+            self.cache.put(query, start, [], kind)
+        return []
+
+    def summary(self):
+        parts = [f"{name} {s['calls']} calls, {s['results']} results, {s['failures']} failed"
+                 for name, s in self.stats.items() if s["calls"]]
+        if self.cache is not None and self.cache.summary():
+            parts.insert(0, f"cache {self.cache.summary()}")
+        return " | ".join(parts)
+
+
+class FakeSearxNG(FakeSERP):
+    """FakeSERP that also answers SearxNG's format=json."""
+
+    def page(self, path, egress):
+        parsed = urllib.parse.urlsplit(path)
+        qs = urllib.parse.parse_qs(parsed.query)
+        if qs.get("format") == ["json"]:
+            q, pageno = qs.get("q", [""])[0], int(qs.get("pageno", ["1"])[0])
+            items = [{"title": f"Person {(pageno - 1) * 10 + i} - Founder", "url": f"https://www.linkedin.com/in/sx-{(pageno - 1) * 10 + i}",
+                      "content": f"Founder. {q}"} for i in range(self.results)]
+            self.hits["searxng"] = self.hits.get("searxng", 0) + 1
+            return 200, {"Content-Type": "application/json"}, json.dumps({"results": items})
+        return super().page(path, egress)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SERP provider layer.")
+    parser.add_argument("command", choices=["search", "stub"])
+    parser.add_argument("query", nargs="?", default="plumbers miami")
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    async def main():
+        if args.command == "stub":
+            _, (host, port) = await start_stub(FakeSearxNG(), port=args.port)
+            print(f"Fake SERP on http://{host}:{port} — set GOOGLE_BASE_URL and/or SEARXNG_URL to it")
+            await asyncio.Event().wait()
+        router = SerpRouter([GoogleHTTPProvider(), SearxNGProvider()])
+        start = time.perf_counter()
+        results = await router.search(args.query, start=args.start, update_callback=print)
+        for r in results:
+            print(f"{r['position']:>3}. {r['title'][:70]}\n     {r['url']}\n     {r['snippet'][:100]}")
+        print(f"{len(results)} results in {1000 * (time.perf_counter() - start):.0f} ms | {router.summary()}")
+
+    asyncio.run(main())
@@ -0,0 +1,286 @@
+"""
+Signal Engine — one-pass fingerprinting for pages, snippets and queries.
+
+Every substring rule the hunter used to check one `in` at a time (tech
+stack, chat widgets, buying signals, smart-routing terms) lives in the
+SIGNATURES table below. The literals are compiled into ONE multi-pattern
+matcher, so a page is scanned once no matter how many signatures exist:
+
+- pyahocorasick (if installed): a C Aho-Corasick automaton. Every
+  occurrence is reported, exactly like the old `in` checks.
+- fallback: one trie-shaped regex inside a lookahead, tried at every
+  offset, so overlapping literals are all found ("manager" inside
+  "googletagmanager"). The longest literal at an offset also reports
+  every literal that is its prefix, so "looking for a freelancer" still
+  yields both hiring and advice. Same hits as Aho-Corasick.
+
+Both run over the lower-cased text (case-insensitive), and emails ride
+along in the same pass as "@" hits that are widened to the full address.
+
+Usage:
+    python signal_engine.py bench [page.html ... | dir/]   # throughput vs the old per-rule scans
+"""
+import argparse
+import glob
+import os
+import random
+import re
+import time
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+EMAIL_REGEX = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+PHONE_REGEX = r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'
+PHONE_PATTERN = re.compile(PHONE_REGEX)
+EMAIL_LOCAL_TAIL = re.compile(r'[a-zA-Z0-9._%+-]+\Z')
+EMAIL_DOMAIN = re.compile(r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+ASCII_LOWER = {c: c + 32 for c in range(ord("A"), ord("Z") + 1)}
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg')
+
+# (group, label, literals) — order inside a group is the reporting/priority order
+SIGNATURES = [
+    ("tech", "WordPress", ["wp-content"]),
+    ("tech", "Shopify", ["shopify"]),
+    ("tech", "Meta Pixel", ["fbevents.js", "facebook-domain-verification"]),
+    ("tech", "GTM", ["googletagmanager"]),
+    ("tech", "Wix", ["wix.com"]),
+    ("tech", "Squarespace", ["squarespace"]),
+
+    ("chat", "Drift", ["drift.com", "driftt"]),
+    ("chat", "Microsoft Teams", ["teams.live.com", "teams.microsoft.com"]),
+    ("chat", "Intercom", ["intercomcdn", "widget.intercom.io"]),
+    ("chat", "Google Chat", ["gwebchat", "google-chat"]),
+
+    # Chat hints visible in the website URL itself (validate_and_parse_contact_fields)
+    ("url_chat", "WhatsApp Link", ["wa.me", "api.whatsapp"]),
+    ("url_chat", "Drift Chat", ["drift.com", "drifttteam"]),
+    ("url_chat", "Intercom", ["intercom"]),
+    ("url_chat", "Google Chat", ["chat.google.com"]),
+
+    ("buying", "📢 Hiring", ["hiring", "looking for freelancer", "looking for a freelancer", "need a",
+                            "recruiting", "looking to hire", "looking for help"]),
+    ("buying", "🛠️ Frustration", ["frustrated with", "issues with", "problem with", "struggling with",
+                                  "having trouble", "doesn't work"]),
+    ("buying", "💡 Advice", ["recommend a", "recommend an", "looking for agency", "looking for a",
+                            "need help with", "suggestions for", "anyone know"]),
+    ("open_profile", "🔓", ["premium", "open profile"]),
+
+    ("source", "linkedin", ["ceo", "founder", "owner", "manager", "director", "head", "vp", "president",
+                            "linkedin", "profile"]),
+    ("source", "naukri", ["hiring", "job", "vacancy", "career", "work at"]),
+    ("source", "99acres", ["flat for sale", "property in", "resale property", "house for sale", "rent plot"]),
+    ("source", "shiksha", ["college", "university", "admission", "course info"]),
+]
+
+
+def trie_regex(words):
+    """Builds a regex for a set of literals with shared prefixes factored out (a regex trie)."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        end = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != ""]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not end:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if end else body
+
+    return build(trie)
+
+
+class SignalEngine:
+    """Compiles a signature table once per group set; scan() returns every hit in a single pass."""
+
+    def __init__(self, signatures=SIGNATURES, backend=None):
+        self.signatures = signatures
+        self.backend = backend or ("aho-corasick" if ahocorasick else "regex")
+        self.order = {}
+        for group, label, _ in signatures:
+            self.order.setdefault(group, [])
+            if label not in self.order[group]:
+                self.order[group].append(label)
+        self._compiled = {}
+
+    def _literals(self, groups):
+        literal_labels = {}
+        for group, label, literals in self.signatures:
+            if group in groups:
+                for lit in literals:
+                    literal_labels.setdefault(lit.lower(), set()).add((group, label))
+        return literal_labels
+
+    def _matcher(self, groups, emails, backend):
+        key = (groups, emails, backend)
+        if key not in self._compiled:
+            literal_labels = self._literals(groups)
+            if backend == "aho-corasick":
+                automaton = ahocorasick.Automaton()
+                for lit, labels in literal_labels.items():
+                    automaton.add_word(lit, frozenset(labels))
+                if emails:
+                    automaton.add_word("@", None)
+                if len(automaton):
+                    automaton.make_automaton()
+                self._compiled[key] = automaton
+            else:
+                # Longest literal per offset (zero-width, so matches may overlap); it also reports its prefixes
+                labels = {
+                    lit: frozenset().union(*(lbl for other, lbl in literal_labels.items() if lit.startswith(other)))
+                    for lit in literal_labels
+                }
+                parts = [trie_regex(labels)] if labels else []
+                if emails:
+                    parts.append("@")
+                self._compiled[key] = (re.compile("(?=(" + "|".join(parts) + "))" if parts else "(?!)"), labels)
+        return self._compiled[key]
+
+    def _hits(self, lowered, groups, emails):
+        """Yields (end_offset, labels) per match; labels is None for an "@" (email anchor)."""
+        if self.backend == "aho-corasick":
+            automaton = self._matcher(groups, emails, "aho-corasick")
+            if len(automaton):
+                yield from automaton.iter(lowered)
+            return
+        regex, labels = self._matcher(groups, emails, "regex")
+        for m in regex.finditer(lowered):
+            word = m.group(1)
+            yield m.start() + len(word) - 1, (None if word == "@" else labels[word])
+
+    def literal_count(self, groups=None):
+        groups = tuple(self.order) if groups is None else tuple(groups)
+        return len(self._literals(groups))
+
+    def scan(self, text, groups=None, emails=False):
+        """
+        One pass over `text`. Returns {group: [labels in table order]} plus "email": [...]
+        when emails=True. Only the requested groups' literals are compiled in.
+        """
+        text = text or ""
+        groups = tuple(self.order) if groups is None else tuple(groups)
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few non-ASCII chars change length when lower-cased; offsets must line up for emails
+            lowered = text.translate(ASCII_LOWER)
+        hits, found = set(), []
+        for end, labels in self._hits(lowered, groups, emails):
+            if labels is not None:
+                hits |= labels
+                continue
+            local = EMAIL_LOCAL_TAIL.search(text, max(0, end - 256), end)
+            domain = EMAIL_DOMAIN.match(text, end + 1)
+            if local and domain:
+                found.append(text[local.start():domain.end()])
+        result = {g: [label for label in self.order.get(g, []) if (g, label) in hits] for g in groups}
+        if emails:
+            result["email"] = found
+        return result
+
+
+ENGINE = SignalEngine()
+
+
+def scan_page(html):
+    """Tech stack, chat widgets and emails from raw HTML in one pass."""
+    hits = ENGINE.scan(html, groups=("tech", "chat"), emails=True)
+    emails = sorted({e for e in hits["email"] if not e.lower().endswith(IMAGE_SUFFIXES)})
+    return {
+        "tech_stack": ", ".join(hits["tech"]) if hits["tech"] else "Unknown",
+        "chat": ", ".join(hits["chat"]) if hits["chat"] else "None/Standard",
+        "emails": emails,
+    }
+
+
+def first_phone(text):
+    """First phone-looking number in visible body text (a separate, much smaller input than the HTML)."""
+    match = PHONE_PATTERN.search(text or "")
+    return match.group(0).strip() if match else None
+
+
+def first_label(text, group, default=None):
+    """Highest-priority label of `group` found in text (table order), else default."""
+    labels = ENGINE.scan(text, groups=(group,))[group]
+    return labels[0] if labels else default
+
+
+# --- Benchmark ---
+
+def _legacy_scan(html, text):
+    """The per-rule scans scrape_website used to run, kept for comparison."""
+    stack = [label for needle, label in [("wp-content", "WordPress"), ("shopify", "Shopify"), ("fbevents.js", "Meta Pixel"),
+                                         ("googletagmanager", "GTM"), ("wix.com", "Wix"), ("squarespace", "Squarespace")]
+             if needle in html]
+    emails = list(set(re.findall(EMAIL_REGEX, html)))
+    html_lower = html.lower()
+    widgets = [w for w, needles in [("Drift", ["drift.com", "driftt"]), ("Microsoft Teams", ["teams.live.com", "teams.microsoft.com"]),
+                                     ("Intercom", ["intercomcdn", "widget.intercom.io"]), ("Google Chat", ["gwebchat", "google-chat"])]
+               if any(n in html_lower for n in needles)]
+    phone = PHONE_PATTERN.search(text)
+    return stack, emails, widgets, phone
+
+
+def load_corpus(paths):
+    files = []
+    for p in paths:
+        files += glob.glob(os.path.join(p, "**", "*.htm*"), recursive=True) if os.path.isdir(p) else glob.glob(p)
+    pages = []
+    for f in files:
+        with open(f, "r", encoding="utf-8", errors="ignore") as fh:
+            pages.append(fh.read())
+    if not pages:
+        # Synthetic stand-in: markup-heavy pages with a couple of trackers and one contact block
+        rng = random.Random(7)
+        vocab = ("service quality team project contact about clinic dental care home repair booking "
+                 "review price offer city support menu footer header card grid image button").split()
+        for _ in range(20):
+            rows = [f'<div class="{rng.choice(vocab)}-{rng.choice(vocab)}"><a href="/{rng.choice(vocab)}">'
+                    f'{" ".join(rng.choices(vocab, k=10))}</a></div>' for _ in range(3000)]
+            rows.insert(50, '<script src="https://www.googletagmanager.com/gtm.js"></script>'
+                            '<link rel="stylesheet" href="/wp-content/themes/site/style.css">')
+            rows.insert(2500, '<p>Call (415) 555-0199 or mail sales@example.com for a quote.</p>')
+            pages.append("<html><body>" + "\n".join(rows) + "</body></html>")
+        print("No pages given — using a synthetic corpus (pass saved .html files for real numbers).")
+    return pages
+
+
+def bench(paths, rounds=3, extra_signatures=500):
+    pages = load_corpus(paths)
+    texts = [re.sub(r"<[^>]+>", " ", p) for p in pages]
+    total_mb = sum(len(p) for p in pages) / 1e6
+    extra = [("tech", f"Vendor{i}", [f"vendor-{i:04d}-sdk.js"]) for i in range(extra_signatures)]
+
+    def timed(fn):
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for html, text in zip(pages, texts):
+                fn(html, text)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    print(f"Corpus: {len(pages)} pages, {total_mb:.1f} MB")
+    print(f"  Per-rule scans     : {total_mb / timed(_legacy_scan):8.1f} MB/s")
+    for backend in (["aho-corasick"] if ahocorasick else []) + ["regex"]:
+        engine = SignalEngine(backend=backend)
+        big = SignalEngine(SIGNATURES + extra, backend=backend)
+        page_scan = lambda e: (lambda html, text: (e.scan(html, groups=("tech", "chat"), emails=True), first_phone(text)))
+        print(f"  {backend:<19}: {total_mb / timed(page_scan(engine)):8.1f} MB/s ({engine.literal_count(('tech', 'chat'))} literals)"
+              f" | {total_mb / timed(page_scan(big)):8.1f} MB/s ({big.literal_count(('tech', 'chat'))} literals)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Single-pass signature scanner.")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("paths", nargs="*", help="HTML files, globs or directories")
+    parser.add_argument("--extra", type=int, default=500, help="Synthetic signatures added for the scaling run")
+    args = parser.parse_args()
+    bench(args.paths, extra_signatures=args.extra)
@@ -0,0 +1,234 @@
+"""
+Liveness pre-flight for candidate websites, run on a whole Maps pass before
+any browser navigation.
+
+Each URL gets a DNS resolve, a TCP (+TLS for https) connect with a short
+timeout, and a capped GET that follows redirects by hand, so dead domains,
+refused connections, broken certificates, redirect loops and parked
+"domain for sale" pages are known in a few seconds instead of after a 30 s
+networkidle timeout. Live sites come back with their final canonical URL,
+which is what the browser should open. Bot walls (401/403, a 503 challenge,
+429) are live: the browser may get through.
+
+Config:
+    PREFLIGHT_CONCURRENCY      URLs checked at once (default 20)
+    PREFLIGHT_CONNECT_TIMEOUT  seconds for DNS and for TCP/TLS (default 4)
+    PREFLIGHT_HTTP_TIMEOUT     seconds per HTTP hop (default 6)
+    PREFLIGHT_MAX_REDIRECTS    hops before calling it a loop (default 5)
+    PREFLIGHT_CACHE_TTL        seconds a live / parked verdict is reused (default 3600)
+    PREFLIGHT_RETRY_TTL        seconds before a dead verdict is re-checked (default 300)
+
+Usage:
+    python site_preflight.py check https://example.com example.org
+"""
+import argparse
+import asyncio
+import os
+import socket
+import ssl
+import time
+import urllib.parse
+
+from html_text import html_to_text
+from http_client import fetch
+
+PREFLIGHT_CONCURRENCY = int(os.getenv("PREFLIGHT_CONCURRENCY", 20))
+PREFLIGHT_CONNECT_TIMEOUT = float(os.getenv("PREFLIGHT_CONNECT_TIMEOUT", 4))
+PREFLIGHT_HTTP_TIMEOUT = float(os.getenv("PREFLIGHT_HTTP_TIMEOUT", 6))
+PREFLIGHT_MAX_REDIRECTS = int(os.getenv("PREFLIGHT_MAX_REDIRECTS", 5))
+PREFLIGHT_CACHE_TTL = float(os.getenv("PREFLIGHT_CACHE_TTL", 3600))
+PREFLIGHT_RETRY_TTL = float(os.getenv("PREFLIGHT_RETRY_TTL", 300))
+BODY_BYTES = 65536   # enough for <title> and a parking banner
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Domain marketplaces / parking services (as the final host), their lander scripts, and lander copy.
+# Hosting companies and registrars say "buy this domain" too: script or copy only count on a near-empty page
+PARKING_HOSTS = ("sedo.com", "sedoparking.com", "dan.com", "afternic.com", "hugedomains.com", "parkingcrew.net",
+                 "bodis.com", "above.com", "undeveloped.com", "domainmarket.com", "atom.com")
+PARKING_SCRIPTS = ("sedoparking.com", "parkingcrew.net", "bodis.com", "img1.wsimg.com/parking-lander",
+                   "parklogic", "dsparking", "above.com/marketplace", "afternic.com/", "dan.com/")
+PARKED_MARKERS = ("this domain is for sale", "this domain may be for sale", "this domain is parked",
+                  "parked free", "is available for purchase", "future home of")
+PARKED_TEXT_MAX = 600   # visible characters; a business site has more to say
+
+# Bot-protection challenges (Cloudflare, Sucuri, DDoS-Guard...) answer 503 / 429 from a live site
+CHALLENGE_SERVERS = ("cloudflare", "sucuri", "ddos-guard", "akamaighost")
+CHALLENGE_MARKERS = ("challenge-platform", "cf-chl", "just a moment...", "attention required", "checking your browser",
+                     "ddos-guard", "captcha")
+
+LIVE, DEAD, PARKED = "live", "dead", "parked"
+
+
+def normalize_url(url):
+    url = (url or "").strip()
+    if not url or url.lower() in ("n/a", "unknown", "none"):
+        return ""
+    if not url.lower().startswith(("http://", "https://")):
+        url = "http://" + url
+    return url
+
+
+def is_parked(final_url, body):
+    host = (urllib.parse.urlsplit(final_url).hostname or "").lower()
+    if any(host == h or host.endswith("." + h) for h in PARKING_HOSTS):
+        return True
+    body = (body or "")[:BODY_BYTES]
+    text = html_to_text(body, PARKED_TEXT_MAX + 1)
+    if len(text) > PARKED_TEXT_MAX:
+        return False
+    lower = body.lower()
+    return any(m in lower for m in PARKING_SCRIPTS) or any(m in text.lower() for m in PARKED_MARKERS)
+
+
+def is_challenge(headers, body):
+    headers = {k.lower(): str(v).lower() for k, v in (headers or {}).items()}
+    if "cf-mitigated" in headers or any(s in headers.get("server", "") for s in CHALLENGE_SERVERS):
+        return True
+    text = (body or "")[:BODY_BYTES].lower()
+    return any(m in text for m in CHALLENGE_MARKERS)
+
+
+def _result(url, status, reason="", final_url="", http_status=0, start=None):
+    return {"url": url, "status": status, "reason": reason, "final_url": final_url or "",
+            "http_status": http_status, "elapsed": time.perf_counter() - start if start else 0.0}
+
+
+class SitePreflight:
+    """URL -> liveness verdict, cached (one Maps pass often repeats chains' sites); dead ones are re-checked sooner."""
+
+    def __init__(self, concurrency=PREFLIGHT_CONCURRENCY, connect_timeout=PREFLIGHT_CONNECT_TIMEOUT,
+                 http_timeout=PREFLIGHT_HTTP_TIMEOUT, max_redirects=PREFLIGHT_MAX_REDIRECTS):
+        self.concurrency = concurrency
+        self.connect_timeout = connect_timeout
+        self.http_timeout = http_timeout
+        self.max_redirects = max_redirects
+        self.cache = {}   # url -> (verdict, expires)
+        self.stats = {"checked": 0, "cached": 0, LIVE: 0, DEAD: 0, PARKED: 0, "seconds": 0.0}
+
+    async def _connect(self, host, port, tls):
+        """DNS + TCP (+ TLS handshake). Returns None when reachable, else the failure reason."""
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), self.connect_timeout)
+        except (socket.gaierror, asyncio.TimeoutError, OSError):
+            return "dns"
+        try:
+            ctx = ssl.create_default_context() if tls else None
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=ctx, server_hostname=host if tls else None),
+                self.connect_timeout)
+            writer.close()
+        except ssl.SSLError:
+            return "tls"
+        except asyncio.TimeoutError:
+            return "timeout"
+        except OSError:
+            return "refused"
+        return None
+
+    async def _follow(self, url):
+        """GET hop by hop (capped body). Returns (final_url, http_status, body, headers) or raises ValueError(reason)."""
+        seen = set()
+        for _ in range(self.max_redirects + 1):
+            if url in seen:
+                raise ValueError("redirect loop")
+            seen.add(url)
+            try:
+                r = await fetch(url, headers={"User-Agent": USER_AGENT}, timeout=self.http_timeout,
+                                allow_redirects=False, max_bytes=BODY_BYTES)
+            except Exception as e:
+                raise ValueError("tls" if "SSL" in type(e).__name__ or "CERTIFICATE" in str(e) else "http error")
+            location = r["headers"].get("Location") or r["headers"].get("location")
+            if 300 <= r["status"] < 400 and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return r["url"], r["status"], r["text"], r["headers"]
+        raise ValueError("redirect loop")
+
+    async def check(self, url):
+        """Verdict dict: {"url", "status": live|dead|parked, "reason", "final_url", "http_status", "elapsed"}."""
+        url = normalize_url(url)
+        if not url:
+            return _result(url, DEAD, "no url")
+        cached = self.cache.get(url)
+        if cached and cached[1] > time.monotonic():
+            self.stats["cached"] += 1
+            return cached[0]
+        key, start = url, time.perf_counter()
+        parts = urllib.parse.urlsplit(url)
+        host = parts.hostname or ""
+        tls = parts.scheme == "https"
+        failure = await self._connect(host, parts.port or (443 if tls else 80), tls)
+        if failure == "tls":
+            # Broken certificate: the plain-http site may still be up
+            url = urllib.parse.urlunsplit(("http", parts.netloc, parts.path, parts.query, ""))
+            failure = await self._connect(host, parts.port or 80, False) and "tls"
+        if failure:
+            result = _result(url, DEAD, failure, start=start)
+        else:
+            try:
+                final_url, http_status, body, headers = await self._follow(url)
+                if http_status == 429 or (http_status == 503 and is_challenge(headers, body)):
+                    # Rate limit / bot challenge in front of a live site: let the browser try
+                    result = _result(url, LIVE, "challenge", final_url, http_status, start)
+                elif http_status >= 500 or http_status in (404, 410):
+                    result = _result(url, DEAD, f"http {http_status}", final_url, http_status, start)
+                elif is_parked(final_url, body):
+                    result = _result(url, PARKED, "parked", final_url, http_status, start)
+                else:
+                    # 401/403 are usually bot walls in front of a live site: let the browser try
+                    result = _result(url, LIVE, "", final_url, http_status, start)
+            except ValueError as e:
+                result = _result(url, DEAD, str(e), start=start)
+        # A dead verdict is often a blip (timeout, 503): retry it sooner than a live one goes stale
+        ttl = PREFLIGHT_RETRY_TTL if result["status"] == DEAD else PREFLIGHT_CACHE_TTL
+        self.cache[key] = (result, time.monotonic() + ttl)
+        self.stats["checked"] += 1
+        self.stats[result["status"]] += 1
+        self.stats["seconds"] += result["elapsed"]
+        return result
+
+    async def check_many(self, urls):
+        """Checks every distinct URL concurrently. Returns {url as given: verdict}."""
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def one(u):
+            async with sem:
+                return u, await self.check(u)
+
+        unique = list(dict.fromkeys(u for u in urls if normalize_url(u)))
+        return dict(await asyncio.gather(*(one(u) for u in unique)))
+
+    def summary(self):
+        s = self.stats
+        if not s["checked"]:
+            return ""
+        return (f"{s['checked']} sites in {s['seconds']:.0f}s total: {s[LIVE]} live, {s[DEAD]} dead, "
+                f"{s[PARKED]} parked ({s['cached']} cached)")
+
+
+_preflight = None
+
+
+def get_preflight():
+    global _preflight
+    if _preflight is None:
+        _preflight = SitePreflight()
+    return _preflight
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Liveness pre-flight for websites.")
+    parser.add_argument("command", choices=["check"])
+    parser.add_argument("urls", nargs="+")
+    args = parser.parse_args()
+
+    async def main():
+        start = time.perf_counter()
+        results = await get_preflight().check_many(args.urls)
+        for url, r in results.items():
+            print(f"{r['status']:<7} {url} -> {r['final_url'] or r['reason']} ({r['elapsed']:.2f}s)")
+        print(f"{len(results)} checked in {time.perf_counter() - start:.2f}s")
+
+    asyncio.run(main())
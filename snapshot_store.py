@@ -0,0 +1,151 @@
+"""
+Content-addressed snapshots of what each lead was scored on.
+
+run_mission stores the cleaned page text and the Maps card text of every
+saved lead as zlib blobs named by their SHA-256 (identical texts — chain
+branches, unchanged re-scrapes — are stored once), plus an index row with
+the lead record. LeadHunter.rescore_snapshots() re-runs scoring and the
+opportunity rules over the snapshots without a browser and writes back only
+the fields that changed.
+
+Layout:
+    <SNAPSHOT_DIR>/blobs/ab/abcdef....z     zlib-compressed UTF-8 text
+    <SNAPSHOT_DIR>/index.sqlite             (name, keyword) -> blob hashes + lead JSON
+
+Config:
+    SNAPSHOT_DIR           default <HUNTER_CACHE_DIR>/snapshots
+    RESCORE_CONCURRENCY    leads re-scored at once (default 64)
+
+Usage:
+    python snapshot_store.py stats
+    python snapshot_store.py rescore [--keyword K] [--dry-run] [--sheets] [--ai-concurrency N]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+CACHE_DIR = os.getenv("HUNTER_CACHE_DIR", ".hunter_cache")
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join(CACHE_DIR, "snapshots"))
+RESCORE_CONCURRENCY = int(os.getenv("RESCORE_CONCURRENCY", 64))
+
+
+def text_hash(text):
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.stats = {"stored": 0, "deduped": 0, "bytes_in": 0, "bytes_out": 0}
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""CREATE TABLE IF NOT EXISTS leads (
+                            name TEXT NOT NULL, keyword TEXT NOT NULL, maps_hash TEXT NOT NULL, page_hash TEXT NOT NULL,
+                            lead TEXT NOT NULL, captured REAL NOT NULL, rescored REAL,
+                            PRIMARY KEY (name, keyword))""")
+
+    def _db(self):
+        # One short-lived connection per call: missions run on several threads
+        return sqlite3.connect(os.path.join(self.root, "index.sqlite"), timeout=10)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest + ".z")
+
+    def put_text(self, text):
+        """Stores text once per distinct content; returns its hash."""
+        digest = text_hash(text)
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            self.stats["deduped"] += 1
+            return digest
+        raw = (text or "").encode("utf-8")
+        packed = zlib.compress(raw, 6)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(packed)
+        os.replace(tmp, path)
+        self.stats["stored"] += 1
+        self.stats["bytes_in"] += len(raw)
+        self.stats["bytes_out"] += len(packed)
+        return digest
+
+    def get_text(self, digest):
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error):
+            return ""
+
+    def record(self, name, keyword, maps_text, page_text, lead):
+        """Snapshot one lead (re-saving the same name + keyword replaces its entry)."""
+        maps_hash, page_hash = self.put_text(maps_text), self.put_text(page_text)
+        with self._db() as db:
+            db.execute("INSERT OR REPLACE INTO leads VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                       (name, keyword, maps_hash, page_hash, json.dumps(lead, default=str), time.time()))
+
+    def leads(self, keyword=None):
+        """[{"name", "keyword", "maps_hash", "page_hash", "lead"}], optionally for one keyword."""
+        sql, args = "SELECT name, keyword, maps_hash, page_hash, lead FROM leads", ()
+        if keyword:
+            sql, args = sql + " WHERE keyword = ?", (keyword,)
+        with self._db() as db:
+            return [{"name": n, "keyword": k, "maps_hash": mh, "page_hash": ph, "lead": json.loads(l)}
+                    for n, k, mh, ph, l in db.execute(sql, args)]
+
+    def update_fields(self, changes):
+        """changes = [(name, keyword, {field: value})]; merged into the stored lead records in one transaction."""
+        now = time.time()
+        with self._db() as db:
+            for name, keyword, fields in changes:
+                row = db.execute("SELECT lead FROM leads WHERE name = ? AND keyword = ?", (name, keyword)).fetchone()
+                if not row:
+                    continue
+                lead = json.loads(row[0])
+                lead.update(fields)
+                db.execute("UPDATE leads SET lead = ?, rescored = ? WHERE name = ? AND keyword = ?",
+                           (json.dumps(lead, default=str), now, name, keyword))
+
+
+_store = None
+
+
+def get_snapshot_store():
+    global _store
+    if _store is None:
+        _store = SnapshotStore()
+    return _store
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lead snapshots and offline re-scoring.")
+    parser.add_argument("command", choices=["stats", "rescore"])
+    parser.add_argument("--keyword", default=None)
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing them")
+    parser.add_argument("--sheets", action="store_true", help="also push changed leads to Google Sheets")
+    parser.add_argument("--ai-concurrency", type=int, default=None, help="parallel Gemini calls (default AI_CONCURRENCY)")
+    args = parser.parse_args()
+    store = get_snapshot_store()
+
+    if args.command == "stats":
+        with store._db() as db:
+            n, rescored = db.execute("SELECT COUNT(*), COUNT(rescored) FROM leads").fetchone()
+            for kw, c in db.execute("SELECT keyword, COUNT(*) FROM leads GROUP BY keyword ORDER BY 2 DESC LIMIT 20"):
+                print(f"{c:>6}  {kw}")
+        blobs = [os.path.join(d, f) for d, _, fs in os.walk(os.path.join(store.root, "blobs")) for f in fs]
+        size = sum(os.path.getsize(b) for b in blobs)
+        print(f"{n} leads ({rescored} re-scored), {len(blobs)} distinct texts in {size / 1e6:.1f} MB")
+    else:
+        import asyncio
+        from lead_hunter import LeadHunter
+
+        hunter = LeadHunter()
+        if args.ai_concurrency:
+            hunter.ai_concurrency = args.ai_concurrency
+        asyncio.run(hunter.rescore_snapshots(keyword=args.keyword, update_callback=print,
+                                             dry_run=args.dry_run, push_sheets=args.sheets))
@@ -0,0 +1,363 @@
+"""
+Deterministic structured-data extraction (no browser, no AI).
+
+Most portals already publish the fields we ask Gemini for as schema.org
+JSON-LD, OpenGraph/meta tags or an embedded state blob (__NEXT_DATA__,
+window.__INITIAL_STATE__). These parsers read that straight from
+page.content() so the LLM only has to fill whatever is still missing.
+Business websites get the same treatment for phone, address, email and
+sameAs social links (extract_business_profile).
+"""
+import html as html_lib
+import json
+import re
+
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.I | re.S)
+META_PATTERN = re.compile(r'<meta\s+([^>]+?)/?>', re.I | re.S)
+ATTR_PATTERN = re.compile(r'([a-zA-Z:_-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.S)
+NEXT_DATA_PATTERN = re.compile(r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.I | re.S)
+STATE_ASSIGN_PATTERN = re.compile(r'window\.(__INITIAL_STATE__|__PRELOADED_STATE__|__APP_DATA__|__NUXT__)\s*=\s*', re.S)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Fields each portal prompt in LeadHunter.universal_ai_extract asks for
+PORTAL_FIELDS = {
+    "naukri": ["company_name", "location", "industry", "requirements"],
+    "99acres": ["property_name", "owner", "contact", "price", "location"],
+    "shiksha": ["college_name", "courses", "location", "contact"],
+}
+
+
+def _loads(raw):
+    raw = raw.strip().rstrip(";")
+    try:
+        return json.loads(raw)
+    except ValueError:
+        # Some CMSs emit raw newlines / tabs inside strings
+        try:
+            return json.loads(re.sub(r'[\r\n\t]+', ' ', raw))
+        except ValueError:
+            return None
+
+
+def extract_json_block(text, openers="{"):
+    """
+    Parses the JSON object/array inside an AI reply (markdown fences and chatter
+    around it are ignored). openers="[{" prefers an array when one is present.
+    Returns None if nothing parses.
+    """
+    text = str(text or "").replace("```json", "").replace("```", "").strip()
+    for opener in openers:
+        closer = "]" if opener == "[" else "}"
+        start, end = text.find(opener), text.rfind(closer) + 1
+        if start != -1 and end > start:
+            return _loads(text[start:end])
+    return None
+
+
+def extract_json_ld(html):
+    """All JSON-LD nodes on the page, with @graph and top-level lists flattened."""
+    return json_ld_nodes(JSON_LD_PATTERN.findall(html or ""))
+
+
+def json_ld_nodes(blocks):
+    """Flattens raw JSON-LD <script> bodies (e.g. collected in the browser) into nodes."""
+    nodes = []
+
+    def collect(obj):
+        if isinstance(obj, list):
+            for o in obj:
+                collect(o)
+        elif isinstance(obj, dict):
+            if "@graph" in obj:
+                collect(obj["@graph"])
+            nodes.append(obj)
+
+    for block in blocks:
+        collect(_loads(html_lib.unescape(block) if "&quot;" in block else block))
+    return nodes
+
+
+def extract_meta(html):
+    """{property-or-name: content} for every <meta> tag (og:*, twitter:*, description, ...)."""
+    meta = {}
+    for attrs in META_PATTERN.findall(html or ""):
+        parsed = {k.lower(): (v1 or v2) for k, v1, v2 in ATTR_PATTERN.findall(attrs)}
+        key = parsed.get("property") or parsed.get("name") or parsed.get("itemprop")
+        if key and parsed.get("content") and key.lower() not in meta:
+            meta[key.lower()] = html_lib.unescape(parsed["content"]).strip()
+    return meta
+
+
+def extract_state_json(html):
+    """Embedded app state (Next.js __NEXT_DATA__ or window.__INITIAL_STATE__-style assignments)."""
+    html = html or ""
+    match = NEXT_DATA_PATTERN.search(html)
+    if match:
+        data = _loads(match.group(1))
+        if data is not None:
+            return data
+    match = STATE_ASSIGN_PATTERN.search(html)
+    if match:
+        try:
+            data, _ = json.JSONDecoder().raw_decode(html, match.end())
+            return data
+        except ValueError:
+            pass
+    return None
+
+
+def node_types(node):
+    t = node.get("@type", [])
+    return {str(x).lower() for x in (t if isinstance(t, list) else [t])}
+
+
+def find_nodes(nodes, *types):
+    wanted = {t.lower() for t in types}
+    return [n for n in nodes if node_types(n) & wanted]
+
+
+def find_key(obj, key, depth=0):
+    """First value stored under `key` anywhere in a nested state blob."""
+    if depth > 12:
+        return None
+    if isinstance(obj, dict):
+        if obj.get(key) not in (None, "", [], {}):
+            return obj[key]
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        found = find_key(child, key, depth + 1)
+        if found not in (None, "", [], {}):
+            return found
+    return None
+
+
+def text_of(value):
+    """Flattens a schema.org value (str / dict with name / list) into plain text."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(t for t in (text_of(v) for v in value) if t)
+    if isinstance(value, dict):
+        if "address" in value and not value.get("streetAddress"):
+            return text_of(value["address"])
+        if any(k in value for k in ("streetAddress", "addressLocality", "addressRegion")):
+            parts = [value.get(k) for k in ("streetAddress", "addressLocality", "addressRegion", "postalCode")]
+            country = value.get("addressCountry")
+            parts.append(country.get("name") if isinstance(country, dict) else country)
+            return ", ".join(str(p).strip() for p in parts if p)
+        return text_of(value.get("name") or value.get("value") or value.get("label") or "")
+    text = TAG_PATTERN.sub(" ", html_lib.unescape(str(value)))
+    return " ".join(text.split())
+
+
+def _fill(out, key, value):
+    """Sets out[key] unless an earlier node already supplied a non-empty value."""
+    if not out.get(key) and value:
+        out[key] = value
+
+
+def _price(offers):
+    offers = offers[0] if isinstance(offers, list) and offers else offers
+    if not isinstance(offers, dict):
+        return ""
+    price = offers.get("price") or offers.get("lowPrice") or text_of(offers.get("priceSpecification"))
+    if not price:
+        return ""
+    return f"{offers.get('priceCurrency', '')} {price}".strip()
+
+
+def extract_naukri(html):
+    nodes = extract_json_ld(html)
+    out = {}
+    for job in find_nodes(nodes, "JobPosting"):
+        _fill(out, "company_name", text_of(job.get("hiringOrganization")))
+        _fill(out, "location", text_of(job.get("jobLocation")))
+        _fill(out, "industry", text_of(job.get("industry")))
+        reqs = job.get("skills") or job.get("qualifications") or job.get("experienceRequirements")
+        _fill(out, "requirements", text_of(reqs)[:500])
+    if not out.get("company_name"):
+        state = extract_state_json(html)
+        if state is not None:
+            out["company_name"] = text_of(find_key(state, "companyName") or find_key(state, "companyDetail"))
+            _fill(out, "location", text_of(find_key(state, "locations")))
+            _fill(out, "industry", text_of(find_key(state, "industry")))
+            _fill(out, "requirements", text_of(find_key(state, "keySkills"))[:500])
+    return out
+
+
+def extract_99acres(html):
+    nodes = extract_json_ld(html)
+    out = {}
+    listing_types = ("Residence", "SingleFamilyResidence", "Apartment", "House", "Accommodation",
+                     "RealEstateListing", "Product", "Place", "Offer")
+    for node in find_nodes(nodes, *listing_types):
+        _fill(out, "property_name", text_of(node.get("name")))
+        _fill(out, "price", _price(node.get("offers") if "offers" in node else node))
+        _fill(out, "location", text_of(node.get("address") or node.get("contentLocation")))
+        offers = node.get("offers")
+        seller = node.get("seller") or (offers.get("seller") if isinstance(offers, dict) else None)
+        _fill(out, "owner", text_of(seller or node.get("provider") or node.get("author")))
+        contact = node.get("telephone") or (seller.get("telephone") if isinstance(seller, dict) else None)
+        _fill(out, "contact", text_of(contact))
+    meta = extract_meta(html)
+    if not out.get("property_name"):
+        out["property_name"] = meta.get("og:title", "")
+    return out
+
+
+def extract_shiksha(html):
+    nodes = extract_json_ld(html)
+    out = {}
+    for node in find_nodes(nodes, "CollegeOrUniversity", "EducationalOrganization", "School", "Organization"):
+        _fill(out, "college_name", text_of(node.get("name")))
+        _fill(out, "location", text_of(node.get("address")))
+        _fill(out, "contact", text_of(node.get("telephone") or node.get("email")))
+    courses = [text_of(c.get("name")) for c in find_nodes(nodes, "Course")]
+    if courses:
+        out["courses"] = ", ".join(c for c in courses if c)[:500]
+    meta = extract_meta(html)
+    if not out.get("college_name"):
+        out["college_name"] = meta.get("og:title", "")
+    return out
+
+
+PORTAL_EXTRACTORS = {
+    "naukri": extract_naukri,
+    "99acres": extract_99acres,
+    "shiksha": extract_shiksha,
+}
+
+
+def extract_portal(html, portal):
+    """Structured fields for `portal`, dropping anything empty. Never raises."""
+    extractor = PORTAL_EXTRACTORS.get(portal)
+    if not extractor:
+        return {}
+    try:
+        data = extractor(html)
+    except Exception as e:
+        print(f"Structured extract error ({portal}): {e}")
+        return {}
+    return {k: v for k, v in data.items() if k in PORTAL_FIELDS[portal] and str(v).strip()}
+
+
+# --- BUSINESS WEBSITES (scrape_website) ---
+SOCIAL_DOMAINS = {
+    "linkedin": ("linkedin.com/company",),
+    "instagram": ("instagram.com/",),
+    "facebook": ("facebook.com/",),
+    "twitter": ("x.com/", "twitter.com/"),
+}
+ITEMPROP_PATTERN = re.compile(
+    r'<(\w+)[^>]*itemprop=["\'](telephone|email|streetAddress|addressLocality|addressRegion|postalCode|sameAs)["\'][^>]*>',
+    re.I)
+HREF_OR_CONTENT_PATTERN = re.compile(r'(?:content|href)=["\']([^"\']+)["\']', re.I)
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+ADDRESS_PARTS = ["streetaddress", "addresslocality", "addressregion", "postalcode"]
+NON_BUSINESS_TYPES = {"website", "webpage", "breadcrumblist", "searchaction", "imageobject", "sitenavigationelement", "listitem"}
+
+
+def classify_social(url):
+    """Platform name for a profile URL, or None (share/intent links are ignored)."""
+    low = str(url).lower()
+    if "sharer" in low or "intent" in low:
+        return None
+    for platform, patterns in SOCIAL_DOMAINS.items():
+        if any(p in low for p in patterns):
+            return platform
+    return None
+
+
+def _microdata(html):
+    """{itemprop: [values]} from content/href attributes or the element's own text."""
+    found = {}
+    for match in ITEMPROP_PATTERN.finditer(html):
+        tag = match.group(0)
+        prop = match.group(2).lower()
+        attr = HREF_OR_CONTENT_PATTERN.search(tag)
+        if attr:
+            value = attr.group(1)
+        else:
+            close = html.find(f"</{match.group(1)}", match.end())
+            value = TAG_PATTERN.sub(" ", html[match.end():close if close != -1 else match.end() + 300])
+        value = " ".join(html_lib.unescape(value).split())
+        if value:
+            found.setdefault(prop, []).append(value)
+    return found
+
+
+def extract_business_profile(html):
+    """
+    Phone, address, emails and social profiles a business site declares about
+    itself (schema.org JSON-LD, microdata, OpenGraph business tags, tel:/mailto:).
+    Missing values come back as "N/A" / empty so callers can merge field by field.
+    """
+    html = html or ""
+    try:
+        tel = re.search(r'href=["\']tel:([^"\']+)["\']', html, re.I)
+        return business_profile_from_parts(
+            extract_json_ld(html), _microdata(html), extract_meta(html),
+            [html_lib.unescape(tel.group(1))] if tel else [],
+            re.findall(r'href=["\']mailto:([^"\'?]+)', html, re.I),
+        )
+    except Exception as e:
+        print(f"Business profile extract error: {e}")
+        return business_profile_from_parts([], {}, {}, [], [])
+
+
+def business_profile_from_parts(nodes, micro, meta, tel_links, mailto_links):
+    """
+    Same as extract_business_profile, from pre-collected pieces: JSON-LD nodes,
+    {itemprop: [values]}, {meta key: content}, tel: and mailto: targets. Lets the
+    browser-side page probe ship only these instead of the whole HTML.
+    """
+    profile = {"phone": "N/A", "address": "N/A", "emails": [], "socials": {k: "N/A" for k in SOCIAL_DOMAINS}}
+    same_as = []
+
+    try:
+        for node in nodes:
+            if node_types(node) & NON_BUSINESS_TYPES:
+                continue
+            if profile["phone"] == "N/A" and node.get("telephone"):
+                profile["phone"] = text_of(node["telephone"]).split(",")[0]
+            if profile["address"] == "N/A" and node.get("address"):
+                profile["address"] = text_of(node["address"]) or "N/A"
+            if node.get("email"):
+                profile["emails"].append(text_of(node["email"]).replace("mailto:", ""))
+            links = node.get("sameAs", [])
+            same_as.extend(links if isinstance(links, list) else [links])
+
+        if profile["phone"] == "N/A" and micro.get("telephone"):
+            profile["phone"] = micro["telephone"][0].replace("tel:", "")
+        if profile["address"] == "N/A" and any(p in micro for p in ADDRESS_PARTS):
+            profile["address"] = ", ".join(micro[p][0] for p in ADDRESS_PARTS if p in micro)
+        profile["emails"].extend(e.replace("mailto:", "") for e in micro.get("email", []))
+        same_as.extend(micro.get("sameas", []))
+
+        if profile["phone"] == "N/A":
+            profile["phone"] = meta.get("og:phone_number") or meta.get("business:contact_data:phone_number") or "N/A"
+        if profile["address"] == "N/A":
+            parts = [meta.get(f"business:contact_data:{k}") or meta.get(f"og:{k.replace('_', '-')}")
+                     for k in ("street_address", "locality", "region", "postal_code")]
+            if any(parts):
+                profile["address"] = ", ".join(p for p in parts if p)
+        if meta.get("og:email"):
+            profile["emails"].append(meta["og:email"])
+
+        if profile["phone"] == "N/A" and tel_links:
+            profile["phone"] = str(tel_links[0]).strip()
+        profile["emails"].extend(mailto_links)
+    except Exception as e:
+        print(f"Business profile extract error: {e}")
+
+    for link in same_as:
+        platform = classify_social(link)
+        if platform and profile["socials"][platform] == "N/A":
+            profile["socials"][platform] = str(link)
+    profile["emails"] = sorted({e.strip() for e in profile["emails"] if EMAIL_PATTERN.fullmatch(e.strip())})
+    return profile